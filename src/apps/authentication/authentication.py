@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+USER = get_user_model()
+
+# In concrete field order: Model.from_db maps the values onto fields by
+# position when some columns are deferred.
+SNAPSHOT_FIELDS = tuple(
+    field.attname
+    for field in USER._meta.concrete_fields
+    if field.attname in {"id", "is_staff", "is_active"}
+)
+
+
+def auth_user_cache_key(user_id) -> str:
+    return f"jwt-user:{user_id}"
+
+
+def invalidate_auth_user(*user_ids) -> None:
+    cache.delete_many([auth_user_cache_key(user_id) for user_id in user_ids])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user from a short-lived cached
+    snapshot (id, is_staff, is_active) instead of loading the full users row on
+    every request. The snapshot is rebuilt as a User instance with every other
+    column deferred, so anything else is still loaded on first access.
+    """
+
+    def get_user(self, validated_token):
+        # Token revocation compares against the password hash, which the
+        # snapshot does not carry.
+        if api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        key = auth_user_cache_key(user_id)
+        snapshot = cache.get(key)
+
+        if snapshot is None:
+            # Soft-deleted users are gone as far as authentication goes
+            snapshot = (
+                USER.objects.filter(
+                    deleted_at__isnull=True,
+                    **{api_settings.USER_ID_FIELD: user_id},
+                )
+                .values_list(*SNAPSHOT_FIELDS)
+                .first()
+            )
+            if snapshot is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, snapshot, getattr(settings, "AUTH_USER_CACHE_TTL", 60))
+
+        user = USER.from_db(DEFAULT_DB_ALIAS, SNAPSHOT_FIELDS, snapshot)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return user
@@ -1,3 +1,76 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
 
-# Create your tests here.
+from apps.authentication.authentication import (
+    CachedJWTAuthentication,
+    auth_user_cache_key,
+)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = get_user_model().objects.create_user(
+            username="member", email="member@example.com", password="password"
+        )
+        self.token = AccessToken.for_user(self.user)
+
+    def authenticate(self):
+        return CachedJWTAuthentication().get_user(self.token)
+
+    def users(self):
+        return get_user_model().objects.filter(pk=self.user.pk)
+
+    def test_repeat_requests_are_served_from_the_cache(self):
+        self.assertEqual(self.authenticate().pk, self.user.pk)
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertFalse(user.is_staff)
+
+    def test_saving_the_user_invalidates_the_snapshot(self):
+        self.authenticate()
+
+        self.user.is_staff = True
+        self.user.save()
+
+        self.assertIsNone(cache.get(auth_user_cache_key(self.user.pk)))
+        self.assertTrue(self.authenticate().is_staff)
+
+    def test_bulk_deactivation_rejects_the_user(self):
+        self.authenticate()
+
+        self.users().update(is_active=False)
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_unrelated_bulk_updates_keep_the_snapshot(self):
+        self.authenticate()
+
+        self.users().update(last_active=timezone.now())
+
+        self.assertIsNotNone(cache.get(auth_user_cache_key(self.user.pk)))
+
+    def test_soft_deleted_user_is_rejected(self):
+        self.authenticate()
+
+        get_user_model().all_objects.filter(pk=self.user.pk).delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleted_user_is_rejected(self):
+        self.authenticate()
+
+        self.users().delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class FormEngineConfig(AppConfig):
     name = 'apps.form_engine'
+
+    def ready(self):
+        import core.db.checks
@@ -0,0 +1,189 @@
+from bson import ObjectId
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from apps.form_engine.utils.access import (
+    FORM_RESPONSE_PROJECTION,
+    assigned_forms_query,
+)
+from apps.form_engine.utils.field_validation import (
+    FIELD_PROJECTION,
+    SUBMISSION_FORM_PROJECTION,
+    active_fields_query,
+    cache_validation_plan,
+    compile_validation_plan,
+    get_snapshot_plan,
+)
+from apps.form_engine.utils.form_deletion import NOT_DELETING, adeleting_form_ids
+from apps.form_engine.utils.ingest import INGEST_BUFFERED, get_submission_buffer
+from apps.form_engine.utils.rollups import arecord_submissions
+from apps.form_engine.utils.submission_filters import submission_date_filter
+from core.db.mongo import (
+    async_field_collection,
+    async_forms_collection,
+    async_submissions_collection,
+)
+from core.utils.async_views import AsyncAPIView
+from core.utils.pagination import MongoPageNumberPagination
+
+from .serializer import FormSubmissionSerializer
+
+
+async def _fetch_active_fields(form_id) -> list:
+    cursor = async_field_collection().find(
+        active_fields_query(form_id), projection=FIELD_PROJECTION
+    )
+    return await cursor.to_list()
+
+
+class AsyncFormListView(AsyncAPIView):
+    async def get(self, request, *args, **kwargs):
+        paginator = MongoPageNumberPagination(request)
+
+        auth_user = request.user
+
+        if auth_user.is_staff:
+            query = {"created_by": str(auth_user.pk)}
+        else:
+            # Indexed on assigned_users; no assignments is just an empty page
+            query = assigned_forms_query(auth_user)
+
+        results, count, total_page = await paginator.apaginate(
+            collection=async_forms_collection(),
+            query={**query, **NOT_DELETING},
+            sort=("created_at", -1),
+            projection=FORM_RESPONSE_PROJECTION,
+        )
+
+        for doc in results:
+            doc["id"] = str(doc.pop("_id"))
+
+        return Response(paginator.get_paginated_response(results, count, total_page))
+
+
+class AsyncFormFieldListView(AsyncAPIView):
+    async def get(self, request, form_id=None, *args, **kwargs):
+        paginator = MongoPageNumberPagination(request)
+        query = {"form_id": ObjectId(form_id)}
+
+        results, count, total_page = await paginator.apaginate(
+            collection=async_field_collection(),
+            query=query,
+            sort=("rank", 1),
+        )
+
+        for doc in results:
+            doc["id"] = str(doc.pop("_id"))
+            doc["form_id"] = str(doc.pop("form_id")) if doc.get("form_id") else None
+
+        return Response(paginator.get_paginated_response(results, count, total_page))
+
+
+class AsyncFormSubmissionView(AsyncAPIView):
+    async def post(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        serializer = FormSubmissionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        form = await async_forms_collection().find_one(
+            {"_id": ObjectId(form_id), "is_active": True, **NOT_DELETING},
+            projection=SUBMISSION_FORM_PROJECTION,
+        )
+
+        if not form:
+            return Response(
+                {"detail": "Form not found or inactive"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        # Forms carry their field snapshot; only ones that predate it need
+        # the fields collection.
+        plan = get_snapshot_plan(form)
+        if plan is None:
+            fields = await _fetch_active_fields(form_id)
+            plan = compile_validation_plan(fields, form.get("version", 0))
+            cache_validation_plan(form_id, plan)
+
+        cleaned_values, errors = plan.validate(serializer.validated_data["values"])
+
+        if errors:
+            return Response(
+                {"errors": errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        current_datetime = timezone.now()
+
+        document = {
+            "_id": ObjectId(),
+            "form_id": ObjectId(form_id),
+            "submitted_by": str(auth_user.pk),
+            "values": cleaned_values,
+            "schema_version": plan.version,
+            "submitted_at": current_datetime,
+            "updated_at": current_datetime,
+        }
+
+        # Never block the event loop on a full buffer; write directly instead.
+        if (
+            form.get("ingest_mode") == INGEST_BUFFERED
+            and get_submission_buffer().put(document, block=False)
+        ):
+            return Response(
+                {
+                    "message": "Form submission accepted",
+                    "submission_id": str(document["_id"]),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        await async_submissions_collection().insert_one(document)
+        await arecord_submissions(form_id, current_datetime)
+
+        return Response(
+            {
+                "message": "Form submitted successfully",
+                "submission_id": str(document["_id"]),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class AsyncFormSubmissionListView(AsyncAPIView):
+    async def get(self, request, *args, **kwargs):
+        paginator = MongoPageNumberPagination(request)
+        auth_user = request.user
+
+        if auth_user.is_staff:
+            form_ids = await async_forms_collection().find(
+                {"created_by": str(auth_user.pk), **NOT_DELETING},
+                {"_id": 1}
+            ).to_list()
+
+            query = {
+                "form_id": {"$in": [doc["_id"] for doc in form_ids]}
+            }
+        else:
+            query = {"submitted_by": str(auth_user.pk)}
+
+            deleting = await adeleting_form_ids()
+            if deleting:
+                query["form_id"] = {"$nin": deleting}
+
+        date_filter = submission_date_filter(request)
+        if date_filter:
+            query["submitted_at"] = date_filter
+
+        results, count, total_page = await paginator.apaginate(
+            collection=async_submissions_collection(),
+            query=query,
+            sort=("submitted_at", -1),
+        )
+
+        for doc in results:
+            doc["id"] = str(doc.pop("_id"))
+            doc["form_id"] = str(doc.get("form_id")) if doc.get("form_id") else None
+
+        return Response(paginator.get_paginated_response(results, count, total_page))
@@ -0,0 +1,99 @@
+import json
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from core.db import mongo
+from core.db.testing import mongomock_client
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the form engine hot paths (form/field create, submit, "
+        "submission and form lists, form render) against throwaway SQL and "
+        "Mongo databases and write p50/p99 latency, throughput and query "
+        "counts as JSON. "
+        "Leave DATABASE_URL empty to run the SQL side on SQLite."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fields", type=int, default=20)
+        parser.add_argument("--forms", type=int, default=100)
+        parser.add_argument("--submissions", type=int, default=10000)
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            dest="scenarios",
+            help="Only run the named scenario (repeatable).",
+        )
+        parser.add_argument(
+            "--mongo",
+            choices=["server", "mongomock"],
+            default="server",
+            help=(
+                "Use MONGODB_URI (a local mongod) or an in-process mongomock. "
+                "mongomock emits no command events, so Mongo counts read 0."
+            ),
+        )
+        parser.add_argument("--output", help="Write the JSON report to this path.")
+
+    def handle(self, *args, **options):
+        # Local import: the harness pulls in DRF's test helpers
+        from apps.form_engine.utils.benchmark import FormEngineBenchmark
+
+        if options["forms"] < 2:
+            # The first form takes submissions, the second takes new fields
+            raise CommandError("--forms must be at least 2")
+
+        base_name = settings.MONGODB_NAME or "form_builder"
+        mongo_name = f"{base_name}_bench_{uuid.uuid4().hex[:8]}"
+        previous_client = mongo._client
+
+        if options["mongo"] == "mongomock":
+            try:
+                mongo._client = mongomock_client()
+            except ImportError:
+                raise CommandError("mongomock is not installed")
+
+        setup_test_environment()
+        old_config = setup_databases(verbosity=0, interactive=False)
+
+        try:
+            with override_settings(MONGODB_NAME=mongo_name):
+                benchmark = FormEngineBenchmark(
+                    fields=options["fields"],
+                    forms=options["forms"],
+                    submissions=options["submissions"],
+                    iterations=options["iterations"],
+                )
+                benchmark.setup()
+                report = benchmark.run(only=options["scenarios"])
+                report["meta"]["mongo"] = options["mongo"]
+        finally:
+            mongo.get_mongo_client().drop_database(mongo_name)
+            mongo._client = previous_client
+            teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                fh.write(output)
+            self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+        else:
+            self.stdout.write(output)
+
+        failed = sorted(
+            name for name, result in report["results"].items() if "error" in result
+        )
+        if failed:
+            raise CommandError(f"Scenarios failed: {', '.join(failed)}")
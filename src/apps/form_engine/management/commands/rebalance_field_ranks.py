@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from apps.form_engine.utils.form_version import backfill_field_seq
+from apps.form_engine.utils.ranking import rebalance_form_ranks
+from core.db.mongo import field_collection
+
+
+class Command(BaseCommand):
+    help = (
+        "Respace field ranks evenly per form. Also backfills ranks for fields "
+        "created before ranking existed, following their `order`, and seeds "
+        "the per-form field sequence on forms that predate it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--form",
+            action="append",
+            dest="form_ids",
+            help="Only rebalance the given form id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        form_ids = options["form_ids"] or field_collection().distinct("form_id")
+
+        updated = 0
+        seeded = 0
+        for form_id in form_ids:
+            updated += rebalance_form_ranks(form_id)
+            seeded += backfill_field_seq(form_id)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Updated {updated} field ranks in {len(form_ids)} forms, "
+                f"seeded {seeded} field sequences"
+            )
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from apps.form_engine.utils.field_validation import FIELD_SNAPSHOT
+from apps.form_engine.utils.form_version import refresh_field_snapshot
+from core.db.mongo import forms_collection
+
+
+class Command(BaseCommand):
+    help = (
+        "Embed the active field snapshot on form documents that predate it, "
+        "so their submits validate from a single form read."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild every form's snapshot, not only missing ones.",
+        )
+
+    def handle(self, *args, **options):
+        query = {} if options["all"] else {FIELD_SNAPSHOT: {"$exists": False}}
+
+        rebuilt = 0
+        for form in forms_collection().find(query, projection={"_id": 1}):
+            refresh_field_snapshot(form["_id"])
+            rebuilt += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt field snapshots for {rebuilt} forms")
+        )
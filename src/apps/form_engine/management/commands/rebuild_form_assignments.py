@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from apps.form_engine.utils.access import rebuild_form_assignments
+
+
+class Command(BaseCommand):
+    help = "Rebuild the assigned_users mirror on form documents from FormMaster"
+
+    def handle(self, *args, **options):
+        updated = rebuild_form_assignments()
+        self.stdout.write(
+            self.style.SUCCESS(f"Mirrored assignments for {updated} forms")
+        )
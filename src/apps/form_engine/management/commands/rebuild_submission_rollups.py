@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.form_engine.utils.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-form daily submission rollups from raw submissions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--form",
+            action="append",
+            dest="form_ids",
+            help="Only rebuild the given form id (repeatable).",
+        )
+
+    def handle(self, *args, **options):
+        written = rebuild_rollups(options["form_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} rollup documents"))
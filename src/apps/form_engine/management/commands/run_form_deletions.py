@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from apps.form_engine.utils.form_deletion import (
+    resume_form_deletions,
+    run_form_deletion,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Run or resume pending form deletions: removes submissions, rollups, "
+        "fields and assignments in throttled batches, then the form itself. "
+        "Jobs held by a live worker are skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--form",
+            action="append",
+            dest="form_ids",
+            help="Only run the deletion for the given form id (repeatable).",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=None,
+            help="Seconds to pause between batches.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        sleep = options["sleep"]
+
+        if options["form_ids"]:
+            finished = sum(
+                run_form_deletion(form_id, batch_size, sleep)
+                for form_id in options["form_ids"]
+            )
+        else:
+            finished = resume_form_deletions(batch_size, sleep)
+
+        self.stdout.write(self.style.SUCCESS(f"Finished {finished} form deletions"))
@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-18 19:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('form_engine', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formmaster',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['user', 'form_id'], name='formmaster_alive_idx'),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.conf import settings
 
 from db.base import BaseModel
+from db.mixins import alive_index
 # Create your models here.
 
 
@@ -11,4 +12,7 @@ class FormMaster(BaseModel):
 
     class Meta:
         unique_together = ("user", "form_id")
+        indexes = [
+            alive_index("user", "form_id", name="formmaster_alive_idx"),
+        ]
     
\ No newline at end of file
@@ -1,8 +1,20 @@
+from bson import ObjectId
 from django.utils import timezone
+from pymongo.errors import OperationFailure, PyMongoError
 from rest_framework import serializers
-from pprint import pprint
 
-from core.db.mongo import forms_collection, field_collection
+from apps.form_engine.utils.field_validation import (
+    FIELD_SNAPSHOT,
+    build_field_snapshot,
+)
+from apps.form_engine.utils.ranking import initial_ranks
+from core.db.mongo import (
+    ILLEGAL_OPERATION,
+    field_collection,
+    forms_collection,
+    get_mongo_client,
+)
+
 
 class FormFieldSerializer(serializers.Serializer):
     FIELD_TYPE_CHOICES = (
@@ -65,6 +77,11 @@ class FormFieldSerializer(serializers.Serializer):
     
 
 class DynamicFormSerializer(serializers.Serializer):
+    INGEST_MODE_CHOICES = (
+        ("sync", "Synchronous"),
+        ("buffered", "Buffered (write-behind)"),
+    )
+
     name = serializers.CharField()
     submit = serializers.CharField(default="Submit")
     expired_at = serializers.DateTimeField(required=False, allow_null=True)
@@ -72,6 +89,11 @@ class DynamicFormSerializer(serializers.Serializer):
         default=True,
         required=False
     )
+    ingest_mode = serializers.ChoiceField(
+        choices=INGEST_MODE_CHOICES,
+        default="sync",
+        required=False,
+    )
 
     fields = FormFieldSerializer(many=True, required=False)
 
@@ -81,28 +103,63 @@ class DynamicFormSerializer(serializers.Serializer):
         current_datetime = timezone.now()
         fields = validated_data.pop("fields", [])
 
-        
-        form = forms_collection().insert_one({
+        form = {
             **validated_data,
+            "_id": ObjectId(),
             "created_by": str(auth_user.pk),
             "created_at": current_datetime,
             "updated_at": current_datetime,
-        })
+            "field_seq": len(fields),
+            "version": 0,
+        }
 
-        for idx, field in enumerate(fields):
-            field_collection().insert_one({
+        field_documents = [
+            {
                 **field,
-                "form_id": form.inserted_id,
+                "_id": ObjectId(),
+                "form_id": form["_id"],
                 "created_by": str(auth_user.pk),
                 "created_at": current_datetime,
                 "updated_at": current_datetime,
-                "order": idx
-            })
+                "order": idx,
+                "rank": rank,
+            }
+            for idx, (field, rank) in enumerate(
+                zip(fields, initial_ranks(len(fields)))
+            )
+        ]
+
+        form[FIELD_SNAPSHOT] = build_field_snapshot(field_documents)
+
+        self.perform_create(form, field_documents)
 
         return {
-            "form_id": str(form.inserted_id)
+            "form_id": str(form["_id"]),
+            "field_ids": [str(field["_id"]) for field in field_documents],
         }
 
+    def perform_create(self, form: dict, field_documents: list) -> None:
+        def write(session=None):
+            forms_collection().insert_one(form, session=session)
+            if field_documents:
+                field_collection().insert_many(field_documents, session=session)
+
+        try:
+            with get_mongo_client().start_session() as session:
+                session.with_transaction(write)
+            return
+        except OperationFailure as e:
+            # Standalone mongod has no transactions (IllegalOperation)
+            if e.code != ILLEGAL_OPERATION:
+                raise
+
+        try:
+            write()
+        except PyMongoError:
+            field_collection().delete_many({"form_id": form["_id"]})
+            forms_collection().delete_one({"_id": form["_id"]})
+            raise
+
 
 class FieldOrderSerializer(serializers.Serializer):
     id = serializers.CharField()
@@ -121,7 +178,29 @@ class UpdateFieldOrderSerializer(serializers.Serializer):
         return value
     
 
+class MoveFieldSerializer(serializers.Serializer):
+    after = serializers.CharField(required=False, allow_null=True)
+    before = serializers.CharField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        if not attrs.get("after") and not attrs.get("before"):
+            raise serializers.ValidationError(
+                "Provide the field to place this one `after` and/or `before`."
+            )
+        return attrs
+
+
 class FormSubmissionSerializer(serializers.Serializer):
     values = serializers.DictField(
         child=serializers.JSONField()
-    )
\ No newline at end of file
+    )
+
+
+class FormSubmissionBatchSerializer(serializers.Serializer):
+    MAX_BATCH_SIZE = 1000
+
+    submissions = FormSubmissionSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=MAX_BATCH_SIZE,
+    )
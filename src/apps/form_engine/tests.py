@@ -1,3 +1,1738 @@
-from django.test import TestCase
+import asyncio
+import csv
+import io
+import threading
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from bson import ObjectId
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from pymongo.errors import (
+    AutoReconnect,
+    BulkWriteError,
+    OperationFailure,
+    PyMongoError,
+)
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.form_engine import async_views, views
+from apps.form_engine.models import FormMaster
+from apps.form_engine.utils.access import mirror_form_assignments
+from apps.form_engine.utils.field_validation import (
+    BLANK_ERROR,
+    FIELD_SNAPSHOT,
+    REQUIRED_ERROR,
+    FieldRule,
+    ValidationPlan,
+    build_field_snapshot,
+)
+from apps.form_engine.utils.form_deletion import (
+    DELETION_DONE,
+    DELETION_FAILED,
+    DELETION_RUNNING,
+    STEP_HANDLERS,
+    claim_form_deletion,
+    deleting_form_ids,
+    request_form_deletion,
+    resume_form_deletions,
+    run_form_deletion,
+    schedule_form_deletion,
+)
+from apps.form_engine.utils.form_render import render_etag
+from apps.form_engine.utils.form_version import allocate_field_seq
+from apps.form_engine.utils.ingest import SubmissionBuffer
+from apps.form_engine.utils.ranking import (
+    RANK_MAX_LENGTH,
+    SEQUENCE_PREFIX,
+    initial_ranks,
+    is_dense,
+    rank_between,
+    rebalance_form_ranks,
+    schedule_rebalance,
+    sequence_rank,
+)
+from apps.form_engine.utils.rollups import (
+    TOTAL_DAY,
+    arecord_submissions,
+    rebuild_rollups,
+    record_submission_documents,
+    record_submissions,
+)
+from apps.form_engine.utils.submission_export import (
+    astream_csv,
+    astream_ndjson,
+    stream_csv,
+    stream_ndjson,
+)
+from core.db import mongo
+from core.db.indexes import ensure_indexes, index_drift
+from core.db.mongo import (
+    deletions_collection,
+    field_collection,
+    forms_collection,
+    rollups_collection,
+    submissions_collection,
+)
+from core.db.monitoring import (
+    PoolMetrics,
+    async_pool_metrics,
+    command_metrics,
+    pool_metrics,
+)
+from core.db.testing import AsyncMongomockClient, mongomock_client
+from core.middleware import QueryProfilingMiddleware
+from core.utils.pagination import (
+    COUNT_CACHED,
+    COUNT_ESTIMATED,
+    COUNT_EXACT,
+    COUNT_NONE,
+    MongoPageNumberPagination,
+)
+
+try:
+    import mongomock
+    from mongomock.collection import Collection
+except ImportError:
+    mongomock = None
+
+
+class FieldRuleTests(SimpleTestCase):
+    def check(self, field, value):
+        return FieldRule({"name": "field", **field}).validate(value)
+
+    def test_required_and_blank(self):
+        self.assertEqual(
+            self.check({"type": "text", "required": True}, None), REQUIRED_ERROR
+        )
+        self.assertIsNone(self.check({"type": "text"}, None))
+        self.assertEqual(
+            self.check({"type": "text", "allow_blank": False}, ""), BLANK_ERROR
+        )
+        self.assertIsNone(self.check({"type": "text"}, ""))
+
+    def test_text_length(self):
+        field = {"type": "text", "min_length": 2, "max_length": 4}
+        self.assertIsNone(self.check(field, "abc"))
+        self.assertIn("at least 2", self.check(field, "a"))
+        self.assertIn("at most 4", self.check(field, "abcde"))
+        self.assertEqual(self.check(field, 12), "Must be a string")
+
+    def test_email(self):
+        self.assertIsNone(self.check({"type": "email"}, "user@example.com"))
+        self.assertEqual(
+            self.check({"type": "email"}, "user@example"), "Enter a valid email address"
+        )
+
+    def test_number_rejects_booleans(self):
+        self.assertIsNone(self.check({"type": "number"}, 4.5))
+        self.assertEqual(self.check({"type": "number"}, True), "Must be a number")
+        self.assertEqual(self.check({"type": "number"}, "4"), "Must be a number")
+
+    def test_date(self):
+        self.assertIsNone(self.check({"type": "date"}, "2024-02-29"))
+        self.assertEqual(self.check({"type": "date"}, "2024-02-30"), "Invalid date")
+        self.assertEqual(
+            self.check({"type": "date"}, "30/01/2024"),
+            "Must be a date string (YYYY-MM-DD)",
+        )
+
+    def test_checkbox(self):
+        self.assertIsNone(self.check({"type": "checkbox"}, False))
+        self.assertEqual(
+            self.check({"type": "checkbox"}, "yes"), "Must be true or false"
+        )
+
+    def test_multi_checkbox_options(self):
+        field = {"type": "multi_checkbox", "options": ["a", "b"], "max_length": 2}
+        self.assertIsNone(self.check(field, ["a", "b"]))
+        self.assertEqual(self.check(field, ["a", "z"]), "Invalid choices: ['z']")
+        self.assertEqual(self.check(field, "a"), "Must be a list of strings")
+        self.assertIn("at most 2", self.check(field, ["a", "b", "a"]))
+
+    def test_file_extension_and_size(self):
+        field = {"type": "file", "allowed_extensions": [".PDF"], "max_size_mb": 1}
+        self.assertIsNone(self.check(field, "report.pdf"))
+        self.assertIsNone(self.check(field, {"name": "a.pdf", "size": 1024 * 1024}))
+        self.assertEqual(
+            self.check(field, {"name": "a.pdf", "size": 1024 * 1024 + 1}),
+            "File exceeds 1 MB",
+        )
+        self.assertIn("File type not allowed", self.check(field, "image.png"))
+        self.assertEqual(self.check(field, {"size": 10}), "Invalid file reference")
+
+    def test_unknown_type(self):
+        self.assertEqual(self.check({"type": "color"}, "red"), "Unsupported field type")
+
+
+class ValidationPlanTests(SimpleTestCase):
+    def setUp(self):
+        self.plan = ValidationPlan(
+            [
+                {"name": "email", "type": "email", "required": True},
+                {"name": "age", "type": "number"},
+                {"name": "joined", "type": "date"},
+            ],
+            version=3,
+        )
+
+    def test_cleans_known_values_and_drops_the_rest(self):
+        cleaned, errors = self.plan.validate(
+            {"email": "user@example.com", "age": 30, "unknown": "x"}
+        )
+
+        self.assertEqual(errors, {})
+        self.assertEqual(cleaned, {"email": "user@example.com", "age": 30})
+        self.assertEqual(self.plan.version, 3)
+
+    def test_collects_an_error_per_field(self):
+        cleaned, errors = self.plan.validate({"age": "30", "joined": "2024-02-30"})
+
+        self.assertEqual(cleaned, {})
+        self.assertEqual(
+            errors,
+            {
+                "email": REQUIRED_ERROR,
+                "age": "Must be a number",
+                "joined": "Invalid date",
+            },
+        )
+
+
+class RankBetweenTests(SimpleTestCase):
+    def test_open_ends(self):
+        self.assertLess(rank_between(None, "V"), "V")
+        self.assertGreater(rank_between("V", None), "V")
+        self.assertTrue(rank_between())
+
+    def test_between_neighbours(self):
+        for lower, upper in [("1", "2"), ("V", "W"), ("A", "A1"), ("z", "z1")]:
+            rank = rank_between(lower, upper)
+            self.assertLess(lower, rank)
+            self.assertLess(rank, upper)
+            self.assertFalse(rank.endswith("0"))
+
+    def test_rejects_inverted_bounds(self):
+        with self.assertRaises(ValueError):
+            rank_between("W", "V")
+        with self.assertRaises(ValueError):
+            rank_between("V", "V")
+
+    def test_repeated_splits_stay_ordered(self):
+        lower, upper = "1", "2"
+        for _ in range(100):
+            rank = rank_between(lower, upper)
+            self.assertTrue(lower < rank < upper)
+            upper = rank
+        self.assertTrue(is_dense(upper))
+
+
+class InitialRanksTests(SimpleTestCase):
+    def test_sorted_unique_and_below_sequence_ranks(self):
+        for count in (0, 1, 5, 61, 62, 100, 4000):
+            ranks = initial_ranks(count)
+            self.assertEqual(len(ranks), count)
+            self.assertEqual(ranks, sorted(set(ranks)))
+            for rank in ranks:
+                self.assertTrue(rank)
+                self.assertFalse(rank.endswith("0"))
+                self.assertLess(rank, SEQUENCE_PREFIX)
+                self.assertFalse(is_dense(rank))
+
+
+class SequenceRankTests(SimpleTestCase):
+    def test_ordered_by_sequence(self):
+        ranks = [sequence_rank(seq) for seq in (1, 2, 61, 62, 63, 3844, 10**6)]
+        self.assertEqual(ranks, sorted(ranks))
+        self.assertEqual(len(set(ranks)), len(ranks))
+
+    def test_after_every_initial_rank(self):
+        self.assertGreater(sequence_rank(0), initial_ranks(5000)[-1])
+
+    def test_room_between_consecutive_sequences(self):
+        lower, upper = sequence_rank(7), sequence_rank(8)
+        rank = rank_between(lower, upper)
+        self.assertTrue(lower < rank < upper)
+        self.assertLessEqual(len(lower), RANK_MAX_LENGTH)
+
+
+class SubmissionExportStreamTests(SimpleTestCase):
+    docs = (
+        {
+            "_id": ObjectId(),
+            "submitted_by": "1",
+            "submitted_at": datetime(2025, 1, 31, tzinfo=UTC),
+            "values": {"email": "user@example.com", "tags": ["a", "b"]},
+        },
+        {"_id": ObjectId(), "submitted_by": "2", "values": {}},
+    )
+
+    @staticmethod
+    def collect(stream) -> list:
+        async def drain():
+            return [chunk async for chunk in stream]
+
+        return asyncio.run(drain())
+
+    async def cursor(self):
+        for doc in self.docs:
+            yield doc
+
+    def test_async_csv_matches_sync(self):
+        field_names = ["email", "tags"]
+        rows = self.collect(astream_csv(self.cursor(), field_names))
+
+        self.assertEqual(rows, list(stream_csv(iter(self.docs), field_names)))
+        self.assertEqual(rows[1].split(",")[-1], "a;b\r\n")
+
+    def test_formula_cells_are_quoted(self):
+        doc = {
+            "_id": ObjectId(),
+            "submitted_by": "1",
+            "values": {
+                "a": "=HYPERLINK(\"http://evil\")",
+                "b": "+1",
+                "c": "-2+3",
+                "d": "@SUM(A1)",
+                "e": ["=1", "x"],
+                "f": -5,
+                "g": "plain",
+            },
+        }
+
+        _, row = csv.reader(stream_csv(iter([doc]), list("abcdefg")))
+
+        self.assertEqual(
+            row[3:],
+            ["'=HYPERLINK(\"http://evil\")", "'+1", "'-2+3", "'@SUM(A1)", "'=1;x",
+             "-5", "plain"],
+        )
+
+    def test_field_columns_never_shadow_base_columns(self):
+        doc = {"_id": ObjectId(), "values": {"id": "custom", "email": "a@b.c"}}
+
+        header, row = csv.reader(stream_csv(iter([doc]), ["id", "email"]))
+
+        self.assertEqual(
+            header, ["id", "submitted_by", "submitted_at", "values.id", "email"]
+        )
+        self.assertEqual(row[0], str(doc["_id"]))
+        self.assertEqual(row[3:], ["custom", "a@b.c"])
+
+    def test_async_ndjson_matches_sync(self):
+        lines = self.collect(astream_ndjson(self.cursor()))
+
+        self.assertEqual(lines, list(stream_ndjson(iter(self.docs))))
+        self.assertEqual(len(lines), 2)
+
+
+class RecordSubmissionsTests(SimpleTestCase):
+    submitted_at = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def test_batch_documents_are_grouped_per_day_and_form(self):
+        form_id = ObjectId()
+        documents = [
+            {"form_id": form_id, "submitted_at": datetime(2025, 1, day)}
+            for day in (1, 1, 2)
+        ]
+
+        with mock.patch(
+            "apps.form_engine.utils.rollups.rollups_collection"
+        ) as rollups:
+            record_submission_documents(documents)
+
+        [operations], _ = rollups.return_value.bulk_write.call_args
+        self.assertEqual(
+            sorted(
+                (op._filter["day"] or "", op._doc["$inc"]["count"])
+                for op in operations
+            ),
+            [("", 3), ("2025-01-01", 2), ("2025-01-02", 1)],
+        )
+
+    @mock.patch("apps.form_engine.utils.rollups.rollups_collection")
+    def test_failed_write_is_logged_not_raised(self, rollups):
+        rollups.return_value.bulk_write.side_effect = PyMongoError("down")
+
+        with self.assertLogs("apps.form_engine.utils.rollups", "ERROR"):
+            record_submissions(ObjectId(), self.submitted_at)
+
+    @mock.patch("apps.form_engine.utils.rollups.async_rollups_collection")
+    def test_failed_async_write_is_logged_not_raised(self, rollups):
+        rollups.return_value.bulk_write = mock.AsyncMock(
+            side_effect=PyMongoError("down")
+        )
+
+        with self.assertLogs("apps.form_engine.utils.rollups", "ERROR"):
+            asyncio.run(arecord_submissions(ObjectId(), self.submitted_at))
+
+
+@mock.patch("apps.form_engine.utils.ingest.time.sleep")
+@mock.patch("apps.form_engine.utils.ingest.record_submission_documents")
+@mock.patch("apps.form_engine.utils.ingest.submissions_collection")
+class SubmissionBufferTests(SimpleTestCase):
+    def make_buffer(self, **options):
+        return SubmissionBuffer(
+            **{
+                "max_size": 10,
+                "flush_size": 3,
+                "flush_interval": 60,
+                "put_timeout": 0,
+                "flush_retries": 3,
+                **options,
+            }
+        )
+
+    def documents(self, count) -> list:
+        return [{"_id": ObjectId()} for _ in range(count)]
+
+    def bulk_error(self, *codes) -> BulkWriteError:
+        return BulkWriteError({
+            "writeErrors": [
+                {"index": idx, "code": code} for idx, code in enumerate(codes)
+            ]
+        })
+
+    def test_full_batch_is_flushed_without_waiting_for_the_interval(
+        self, submissions, record, sleep
+    ):
+        flushed = threading.Event()
+        submissions.return_value.insert_many.side_effect = (
+            lambda *args, **kwargs: flushed.set()
+        )
+        buffer = self.make_buffer()
+        documents = self.documents(3)
+
+        with mock.patch("apps.form_engine.utils.ingest.atexit.register"):
+            for doc in documents:
+                self.assertTrue(buffer.put(doc))
+
+        self.assertTrue(flushed.wait(5))
+        # The idle flusher sits out its 60s interval; don't wait for it
+        buffer.shutdown(timeout=0)
+        submissions.return_value.insert_many.assert_called_once_with(
+            documents, ordered=False
+        )
+
+    def test_full_buffer_rejects_the_document(self, submissions, record, sleep):
+        buffer = self.make_buffer(max_size=1)
+        buffer.start = mock.Mock()
+
+        self.assertTrue(buffer.put({"_id": ObjectId()}))
+        self.assertFalse(buffer.put({"_id": ObjectId()}))
+        self.assertEqual(buffer.metrics()["rejected"], 1)
+
+    def test_transient_error_is_retried(self, submissions, record, sleep):
+        submissions.return_value.insert_many.side_effect = [AutoReconnect(), None]
+        documents = self.documents(2)
+        buffer = self.make_buffer()
+
+        buffer._flush(documents)
+
+        self.assertEqual(submissions.return_value.insert_many.call_count, 2)
+        record.assert_called_once_with(documents)
+        self.assertEqual(buffer.metrics()["flushed"], 2)
+
+    def test_batch_is_dropped_after_the_last_retry(self, submissions, record, sleep):
+        submissions.return_value.insert_many.side_effect = AutoReconnect()
+        buffer = self.make_buffer()
+
+        with self.assertLogs("apps.form_engine.utils.ingest", "ERROR") as logs:
+            buffer._flush(self.documents(2))
+
+        self.assertEqual(submissions.return_value.insert_many.call_count, 3)
+        self.assertIn("Dropped 2 buffered submissions", logs.output[-1])
+        record.assert_not_called()
+        self.assertEqual(buffer.metrics()["failed"], 2)
+
+    def test_rejected_documents_are_dropped(self, submissions, record, sleep):
+        submissions.return_value.insert_many.side_effect = self.bulk_error(121)
+        documents = self.documents(2)
+        buffer = self.make_buffer()
+
+        with self.assertLogs("apps.form_engine.utils.ingest", "ERROR") as logs:
+            buffer._flush(documents)
+
+        self.assertIn("Dropped 1 buffered submissions", logs.output[0])
+        record.assert_called_once_with(documents[1:])
+
+    def test_duplicates_from_an_earlier_attempt_count_as_written(
+        self, submissions, record, sleep
+    ):
+        submissions.return_value.insert_many.side_effect = self.bulk_error(
+            11000, 11000
+        )
+        documents = self.documents(2)
+        buffer = self.make_buffer()
+
+        with self.assertNoLogs("apps.form_engine.utils.ingest", "ERROR"):
+            buffer._flush(documents)
+
+        record.assert_called_once_with(documents)
+        self.assertEqual(buffer.metrics()["failed"], 0)
+
+    def test_exit_hook_flushes_queued_documents(self, submissions, record, sleep):
+        buffer = self.make_buffer(flush_size=100)
+        documents = self.documents(3)
+
+        with mock.patch("apps.form_engine.utils.ingest.atexit.register") as register:
+            for doc in documents:
+                buffer.put(doc)
+
+        [exit_hook], _ = register.call_args
+        exit_hook()
+
+        written = [
+            doc
+            for call in submissions.return_value.insert_many.call_args_list
+            for doc in call.args[0]
+        ]
+        self.assertEqual(written, documents)
+        self.assertFalse(buffer.metrics()["running"])
+
+
+class PoolMetricsTests(SimpleTestCase):
+    primary = ("db0", 27017)
+    secondary = ("db1", 27017)
+
+    def setUp(self):
+        self.metrics = PoolMetrics()
+        for address in (self.primary, self.secondary):
+            self.metrics.pool_created(
+                SimpleNamespace(address=address, options={"maxPoolSize": 2})
+            )
+
+    def check_out(self, address, count=1):
+        for _ in range(count):
+            self.metrics.connection_checked_out(
+                SimpleNamespace(address=address, duration=0.001)
+            )
+
+    def test_saturation_is_the_busiest_pool(self):
+        self.check_out(self.primary, 2)
+        self.check_out(self.secondary, 1)
+
+        snapshot = self.metrics.snapshot()
+
+        self.assertEqual(snapshot["in_use"], 3)
+        self.assertEqual(snapshot["saturation"], 1.0)
+        self.assertEqual(snapshot["pools"]["db1:27017"]["saturation"], 0.5)
+
+    def test_check_in_frees_its_own_pool(self):
+        self.check_out(self.primary, 2)
+        self.metrics.connection_checked_in(SimpleNamespace(address=self.primary))
+
+        self.assertEqual(self.metrics.snapshot()["saturation"], 0.5)
+
+    def test_pool_size_survives_a_reset(self):
+        self.metrics.reset()
+        self.check_out(self.primary)
+
+        self.assertEqual(self.metrics.snapshot()["saturation"], 0.5)
+
+    def test_unset_pool_size_is_the_driver_default(self):
+        address = ("db2", 27017)
+        self.metrics.pool_created(SimpleNamespace(address=address, options={}))
+        self.check_out(address, 10)
+
+        self.assertEqual(
+            self.metrics.snapshot()["pools"]["db2:27017"]["saturation"], 0.1
+        )
+
+    def test_each_client_gets_its_own_prebuilt_listener(self):
+        with override_settings(MONGO_CLIENT={"MAX_POOL_SIZE": 5}):
+            sync_options = mongo.get_client_options()
+            async_options = mongo.get_client_options(async_pool_metrics)
+
+        self.assertIs(sync_options["event_listeners"][1], pool_metrics)
+        self.assertIs(async_options["event_listeners"][1], async_pool_metrics)
+        self.assertEqual(sync_options["maxPoolSize"], 5)
+        self.assertFalse(hasattr(pool_metrics, "max_pool_size"))
+
+
+@override_settings(
+    QUERY_PROFILING={
+        "ENABLED": True,
+        "SQL_QUERY_BUDGET": 0,
+        "MONGO_COMMAND_BUDGET": 5,
+        "DURATION_BUDGET_MS": 60_000,
+    }
+)
+class QueryProfilingMiddlewareTests(TestCase):
+    def run_command(self):
+        # What the driver's command listener reports for one round trip
+        event = SimpleNamespace(
+            command_name="ping",
+            command={"ping": 1},
+            database_name="admin",
+            connection_id=("db0", 27017),
+            request_id=id(self),
+            duration_micros=1500,
+        )
+        command_metrics.started(event)
+        command_metrics.succeeded(event)
+
+    def view(self, request):
+        get_user_model().objects.count()
+        self.run_command()
+        return HttpResponse()
+
+    async def async_view(self, request):
+        await sync_to_async(get_user_model().objects.count)()
+        self.run_command()
+        return HttpResponse()
+
+    def assert_profiled(self, response, logs):
+        timing = response["Server-Timing"]
+        self.assertIn('desc="1 queries"', timing)
+        self.assertIn('desc="1 commands"', timing)
+        self.assertIn("GET /profiled took", logs.output[0])
+
+    def test_sync_request(self):
+        middleware = QueryProfilingMiddleware(self.view)
+
+        with self.assertLogs("core.profiling", "WARNING") as logs:
+            response = middleware(APIRequestFactory().get("/profiled"))
+
+        self.assertFalse(iscoroutinefunction(middleware))
+        self.assert_profiled(response, logs)
+
+    def test_async_request(self):
+        middleware = QueryProfilingMiddleware(self.async_view)
+
+        with self.assertLogs("core.profiling", "WARNING") as logs:
+            response = async_to_sync(middleware)(APIRequestFactory().get("/profiled"))
+
+        self.assertTrue(iscoroutinefunction(middleware))
+        self.assert_profiled(response, logs)
+
+
+@skipUnless(mongomock, "mongomock is not installed")
+class MongoTestCase(TestCase):
+    def setUp(self):
+        self.previous_client = mongo._client
+        mongo._client = mongomock_client()
+        self.addCleanup(setattr, mongo, "_client", self.previous_client)
+
+        previous_async_client = mongo._async_client
+        mongo._async_client = AsyncMongomockClient(mongo._client)
+        self.addCleanup(setattr, mongo, "_async_client", previous_async_client)
+
+    def create_form(self, user, count):
+        form_id = forms_collection().insert_one(
+            {"name": "Form", "created_by": str(user.pk), "version": 0}
+        ).inserted_id
+        field_ids = field_collection().insert_many([
+            {
+                "form_id": form_id,
+                "name": f"field_{idx}",
+                "created_by": str(user.pk),
+                "is_active": True,
+                "order": idx,
+                "rank": rank,
+            }
+            for idx, rank in enumerate(initial_ranks(count))
+        ]).inserted_ids
+        return form_id, field_ids
+
+    def field_order(self, form_id) -> list:
+        return [
+            field["_id"]
+            for field in field_collection().find({"form_id": form_id}).sort("rank", 1)
+        ]
+
+
+class FieldMoveViewTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = get_user_model().objects.create_user(
+            username="owner", email="owner@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.user, 4)
+
+    def move(self, field_id, **data):
+        request = APIRequestFactory().post(
+            f"/forms/fields/move/{field_id}", data, format="json"
+        )
+        force_authenticate(request, user=self.user)
+        return views.FieldMoveView.as_view()(request, field_id=str(field_id))
+
+    def assert_order(self, *indexes):
+        self.assertEqual(
+            self.field_order(self.form_id), [self.fields[idx] for idx in indexes]
+        )
+        ranks = field_collection().distinct("rank", {"form_id": self.form_id})
+        self.assertEqual(len(ranks), len(self.fields))
+
+    def test_after_only_lands_right_after_the_neighbour(self):
+        response = self.move(self.fields[3], after=str(self.fields[0]))
+        self.assertEqual(response.status_code, 200)
+        self.assert_order(0, 3, 1, 2)
+
+    def test_before_only_lands_right_before_the_neighbour(self):
+        response = self.move(self.fields[3], before=str(self.fields[2]))
+        self.assertEqual(response.status_code, 200)
+        self.assert_order(0, 1, 3, 2)
+
+    def test_after_last_field_moves_to_the_end(self):
+        response = self.move(self.fields[0], after=str(self.fields[3]))
+        self.assertEqual(response.status_code, 200)
+        self.assert_order(1, 2, 3, 0)
+
+    def test_before_first_field_moves_to_the_start(self):
+        response = self.move(self.fields[2], before=str(self.fields[0]))
+        self.assertEqual(response.status_code, 200)
+        self.assert_order(2, 0, 1, 3)
+
+    def test_between_both_neighbours(self):
+        response = self.move(
+            self.fields[0], after=str(self.fields[1]), before=str(self.fields[2])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assert_order(1, 0, 2, 3)
+
+    def test_relative_to_itself_is_rejected(self):
+        response = self.move(self.fields[1], after=str(self.fields[1]))
+        self.assertEqual(response.status_code, 400)
+
+
+class RebalanceTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = get_user_model().objects.create_user(
+            username="owner", email="owner@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.user, 3)
+
+        # Crowd the fields into a dense region
+        lower, upper = "1", "2"
+        for field_id in reversed(self.fields):
+            upper = rank_between(lower, upper)
+            field_collection().update_one({"_id": field_id}, {"$set": {"rank": upper}})
+
+    def test_respaces_keeping_order_and_bumps_version(self):
+        before = self.field_order(self.form_id)
+
+        self.assertEqual(rebalance_form_ranks(self.form_id), 3)
+
+        self.assertEqual(self.field_order(self.form_id), before)
+        ranks = field_collection().distinct("rank", {"form_id": self.form_id})
+        self.assertEqual(sorted(ranks), initial_ranks(3))
+        self.assertEqual(forms_collection().find_one(self.form_id)["version"], 1)
+
+    @mock.patch("apps.form_engine.utils.ranking.threading.Thread")
+    def test_one_scheduled_rebalance_per_form(self, thread):
+        schedule_rebalance(self.form_id)
+        schedule_rebalance(str(self.form_id))
+
+        thread.assert_called_once()
+        target = thread.call_args.kwargs["target"]
+        target(*thread.call_args.kwargs["args"])
+        self.assertEqual(sorted(field_collection().distinct("rank")), initial_ranks(3))
+
+        # Once the pass has finished the form can be scheduled again
+        schedule_rebalance(self.form_id)
+        self.assertEqual(thread.call_count, 2)
+
+    def test_concurrent_move_is_not_overwritten(self):
+        collection = field_collection()
+        bulk_write = collection.bulk_write
+        moved = self.fields[2]
+        calls = []
+
+        def racing_bulk_write(operations, **kwargs):
+            if not calls:
+                # A move commits between the rebalance's read and its write
+                collection.update_one({"_id": moved}, {"$set": {"rank": "0V"}})
+            calls.append(operations)
+            return bulk_write(operations, **kwargs)
+
+        with mock.patch(
+            "apps.form_engine.utils.ranking.field_collection",
+            return_value=mock.Mock(
+                wraps=collection, bulk_write=racing_bulk_write
+            ),
+        ):
+            rebalance_form_ranks(self.form_id)
+
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(self.field_order(self.form_id)[0], moved)
+        ranks = field_collection().distinct("rank", {"form_id": self.form_id})
+        self.assertEqual(sorted(ranks), initial_ranks(3))
+
+
+class AllocateFieldSeqTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = get_user_model().objects.create_user(
+            username="owner", email="owner@example.com", password="password"
+        )
+        # Predates the counter: fields carry orders 0..2 but no field_seq
+        self.form_id, self.fields = self.create_form(self.user, 3)
+
+    @mock.patch("apps.form_engine.utils.form_version.schedule_rebalance")
+    def test_legacy_form_is_seeded_once_past_its_orders(self, schedule_rebalance):
+        seqs = [allocate_field_seq({"_id": self.form_id}) for _ in range(3)]
+
+        self.assertEqual(seqs, [3, 4, 5])
+        self.assertEqual(forms_collection().find_one(self.form_id)["field_seq"], 5)
+        schedule_rebalance.assert_called_once_with(self.form_id)
+
+    @mock.patch("apps.form_engine.utils.form_version.schedule_rebalance")
+    def test_unmatched_query_allocates_nothing(self, schedule_rebalance):
+        query = {"_id": self.form_id, "created_by": "someone-else"}
+
+        self.assertIsNone(allocate_field_seq(query))
+        self.assertNotIn("field_seq", forms_collection().find_one(self.form_id))
+        schedule_rebalance.assert_not_called()
+
+
+class FormListViewTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        user_model = get_user_model()
+        self.member = user_model.objects.create_user(
+            username="member", email="member@example.com", password="password"
+        )
+        self.other = user_model.objects.create_user(
+            username="other", email="other@example.com", password="password"
+        )
+        forms_collection().insert_one({
+            "name": "Shared",
+            "assigned_users": [str(self.member.pk), str(self.other.pk)],
+            "field_snapshot": [{"name": "email", "type": "email"}],
+            "field_seq": 1,
+        })
+
+    def list_forms(self, user):
+        request = APIRequestFactory().get("/forms/list")
+        force_authenticate(request, user=user)
+        return views.FormListView.as_view()(request)
+
+    def test_members_do_not_see_form_internals(self):
+        response = self.list_forms(self.member)
+
+        self.assertEqual(response.status_code, 200)
+        [form] = response.data["results"]
+        self.assertEqual(form["name"], "Shared")
+        for key in ("assigned_users", "field_snapshot", "field_seq"):
+            self.assertNotIn(key, form)
+
+    def test_unassigned_member_gets_an_empty_page(self):
+        loner = get_user_model().objects.create_user(
+            username="loner", email="loner@example.com", password="password"
+        )
+        response = self.list_forms(loner)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"], [])
+
+
+class FormRenderViewTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="password",
+            is_staff=True,
+        )
+        self.member = user_model.objects.create_user(
+            username="member", email="member@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.owner, 2)
+        forms_collection().update_one(
+            {"_id": self.form_id},
+            {"$set": {"is_active": True, "assigned_users": [str(self.member.pk)]}},
+        )
+
+    def render(self, user, **headers):
+        request = APIRequestFactory().get(
+            f"/forms/render/{self.form_id}", headers=headers
+        )
+        force_authenticate(request, user=user)
+        return views.FormRenderView.as_view()(request, form_id=str(self.form_id))
+
+    def test_assigned_member_and_owner_can_render(self):
+        for user in (self.member, self.owner):
+            response = self.render(user)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                [field["name"] for field in response.data["fields"]],
+                ["field_0", "field_1"],
+            )
+
+    def test_revoked_member_loses_access_immediately(self):
+        self.assertEqual(self.render(self.member).status_code, 200)
+
+        mirror_form_assignments([self.member.pk], removed=[self.form_id])
+
+        self.assertEqual(self.render(self.member).status_code, 404)
+
+    def test_etag_follows_the_form_version(self):
+        response = self.render(self.member)
+
+        self.assertEqual(response["ETag"], render_etag(self.form_id, 0))
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+    def test_matching_if_none_match_is_not_modified(self):
+        etag = self.render(self.member)["ETag"]
+
+        for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            with self.subTest(header=header), mock.patch(
+                "apps.form_engine.views.get_form_render"
+            ) as get_form_render:
+                response = self.render(self.member, if_none_match=header)
+
+                self.assertEqual(response.status_code, 304)
+                self.assertIsNone(response.data)
+                self.assertEqual(response["ETag"], etag)
+                get_form_render.assert_not_called()
+
+        response = self.render(self.member, if_none_match='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_repeat_renders_are_served_from_the_cache(self):
+        first = self.render(self.member).data
+
+        with mock.patch(
+            "apps.form_engine.utils.form_render.build_form_render"
+        ) as build:
+            self.assertEqual(self.render(self.owner).data, first)
+
+        build.assert_not_called()
+
+    def test_field_change_bumps_the_etag_and_the_cached_render(self):
+        etag = self.render(self.member)["ETag"]
+
+        request = APIRequestFactory().patch(
+            f"/forms/fields/{self.fields[1]}", {"is_active": False}, format="json"
+        )
+        force_authenticate(request, user=self.owner)
+        views.FormFieldUpdateView.as_view()(request, field_id=str(self.fields[1]))
+
+        response = self.render(self.member, if_none_match=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            [field["name"] for field in response.data["fields"]], ["field_0"]
+        )
+
+
+class FieldSnapshotTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = get_user_model().objects.create_user(
+            username="owner", email="owner@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.user, 2)
+        forms_collection().update_one(
+            {"_id": self.form_id},
+            {
+                "$set": {
+                    "field_seq": 2,
+                    FIELD_SNAPSHOT: build_field_snapshot(
+                        field_collection().find({"form_id": self.form_id})
+                    ),
+                }
+            },
+        )
+
+    def call(self, view, method, path, data=None, **kwargs):
+        request = getattr(APIRequestFactory(), method)(path, data, format="json")
+        force_authenticate(request, user=self.user)
+        return view.as_view()(request, **kwargs)
+
+    def form(self) -> dict:
+        return forms_collection().find_one(self.form_id)
+
+    def snapshot_ids(self) -> list:
+        return [entry["id"] for entry in self.form()[FIELD_SNAPSHOT]]
+
+    def test_create_pushes_the_new_field(self):
+        response = self.call(
+            views.FieldCreateView,
+            "post",
+            f"/forms/fields/create/{self.form_id}",
+            {"name": "email", "label": "Email", "type": "email"},
+            form_id=str(self.form_id),
+        )
+
+        self.assertEqual(response.status_code, 201)
+        form = self.form()
+        self.assertEqual(form["version"], 1)
+        entry = form[FIELD_SNAPSHOT][-1]
+        self.assertEqual(str(entry["id"]), response.data["field"]["id"])
+        self.assertEqual((entry["name"], entry["type"]), ("email", "email"))
+
+    def test_destroy_pulls_the_field(self):
+        response = self.call(
+            views.FieldDestroyView,
+            "delete",
+            f"/forms/fields/destroy/{self.fields[0]}",
+            field_id=str(self.fields[0]),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.snapshot_ids(), [self.fields[1]])
+        self.assertEqual(self.form()["version"], 1)
+
+    def test_deactivating_and_reactivating_drops_and_restores_the_field(self):
+        for is_active, expected in ((False, [self.fields[1]]), (True, self.fields)):
+            response = self.call(
+                views.FormFieldUpdateView,
+                "patch",
+                f"/forms/fields/update/{self.fields[0]}",
+                {"is_active": is_active},
+                field_id=str(self.fields[0]),
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertCountEqual(self.snapshot_ids(), expected)
+        self.assertEqual(self.form()["version"], 2)
+
+    def test_move_only_bumps_the_version(self):
+        snapshot = self.form()[FIELD_SNAPSHOT]
+
+        response = self.call(
+            views.FieldMoveView,
+            "post",
+            f"/forms/fields/move/{self.fields[1]}",
+            {"before": str(self.fields[0])},
+            field_id=str(self.fields[1]),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.form()[FIELD_SNAPSHOT], snapshot)
+        self.assertEqual(self.form()["version"], 1)
+
+    def test_form_without_snapshot_is_only_bumped(self):
+        forms_collection().update_one(
+            {"_id": self.form_id}, {"$unset": {FIELD_SNAPSHOT: ""}}
+        )
+
+        self.call(
+            views.FieldDestroyView,
+            "delete",
+            f"/forms/fields/destroy/{self.fields[0]}",
+            field_id=str(self.fields[0]),
+        )
+
+        self.assertNotIn(FIELD_SNAPSHOT, self.form())
+        self.assertEqual(self.form()["version"], 1)
+
+
+class RebuildRollupsTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.form_id = ObjectId()
+        submissions_collection().insert_many([
+            {"form_id": self.form_id, "submitted_at": datetime(2025, 1, day)}
+            for day in (1, 1, 2)
+        ])
+        rollups_collection().insert_many([
+            {"form_id": self.form_id, "day": "2025-01-01", "count": 7},
+            {"form_id": self.form_id, "day": "2024-12-31", "count": 3},
+            {"form_id": self.form_id, "day": TOTAL_DAY, "count": 10},
+        ])
+
+    def counts(self) -> dict:
+        return {
+            doc["day"]: doc["count"]
+            for doc in rollups_collection().find({"form_id": self.form_id})
+        }
+
+    def test_sets_counts_and_drops_stale_days(self):
+        self.assertEqual(rebuild_rollups([self.form_id]), 3)
+
+        self.assertEqual(
+            self.counts(), {"2025-01-01": 2, "2025-01-02": 1, TOTAL_DAY: 3}
+        )
+
+    def live_submit(self, day):
+        # What the submit view does, on the unpatched collections
+        submitted_at = datetime(2025, 1, day)
+        self.submissions.insert_one(
+            {"form_id": self.form_id, "submitted_at": submitted_at}
+        )
+        for key in (submitted_at.strftime("%Y-%m-%d"), TOTAL_DAY):
+            self.rollups.update_one(
+                {"form_id": self.form_id, "day": key},
+                {"$inc": {"count": 1}},
+                upsert=True,
+            )
+
+    def test_live_submissions_during_a_rebuild_are_kept(self):
+        self.submissions = submissions_collection()
+        self.rollups = rollups_collection()
+        aggregate = self.submissions.aggregate
+        bulk_write = self.rollups.bulk_write
+        counted = []
+
+        def racing_aggregate(*args, **kwargs):
+            rows = list(aggregate(*args, **kwargs))
+            if not counted:
+                # Lands after the cutoff count, before the rollups are read
+                self.live_submit(3)
+            counted.append(rows)
+            return rows
+
+        def racing_bulk_write(*args, **kwargs):
+            # Lands after the rollups were read, before the correction
+            self.live_submit(3)
+            return bulk_write(*args, **kwargs)
+
+        with mock.patch(
+            "apps.form_engine.utils.rollups.submissions_collection",
+            return_value=mock.Mock(wraps=self.submissions, aggregate=racing_aggregate),
+        ), mock.patch(
+            "apps.form_engine.utils.rollups.rollups_collection",
+            return_value=mock.Mock(wraps=self.rollups, bulk_write=racing_bulk_write),
+        ):
+            rebuild_rollups([self.form_id])
+
+        self.assertEqual(
+            self.counts(),
+            {"2025-01-01": 2, "2025-01-02": 1, "2025-01-03": 2, TOTAL_DAY: 5},
+        )
+
+    def test_zeroed_rollup_with_a_live_increment_is_kept(self):
+        collection = rollups_collection()
+        delete_many = collection.delete_many
+
+        def racing_delete_many(query):
+            # A submit for the stale day lands right before the delete
+            collection.update_one(
+                {"form_id": self.form_id, "day": "2024-12-31"},
+                {"$inc": {"count": 1}},
+            )
+            return delete_many(query)
+
+        with mock.patch(
+            "apps.form_engine.utils.rollups.rollups_collection",
+            return_value=mock.Mock(wraps=collection, delete_many=racing_delete_many),
+        ):
+            rebuild_rollups([self.form_id])
+
+        self.assertEqual(self.counts()["2024-12-31"], 1)
+
+
+class FormDeletionTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            username="owner", email="owner@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.owner, 3)
+        self.other_form_id, _ = self.create_form(self.owner, 1)
+
+        for form_id, count in ((self.form_id, 5), (self.other_form_id, 1)):
+            submissions_collection().insert_many([
+                {"form_id": form_id, "submitted_at": datetime(2025, 1, 1)}
+                for _ in range(count)
+            ])
+            rollups_collection().insert_one(
+                {"form_id": form_id, "day": TOTAL_DAY, "count": count}
+            )
+
+        members = [
+            user_model.objects.create_user(
+                username=f"member{idx}",
+                email=f"member{idx}@example.com",
+                password="password",
+            )
+            for idx in range(2)
+        ]
+        FormMaster.objects.bulk_create(
+            [FormMaster(user=member, form_id=str(self.form_id)) for member in members]
+        )
+
+        request_form_deletion(self.form_id, str(self.owner.pk))
+
+    def job(self) -> dict:
+        return deletions_collection().find_one(self.form_id)
+
+    def run_deletion(self):
+        return run_form_deletion(self.form_id, batch_size=2, sleep=0)
+
+    def assert_form_gone(self):
+        self.assertIsNone(forms_collection().find_one(self.form_id))
+        for collection in (
+            submissions_collection(),
+            rollups_collection(),
+            field_collection(),
+        ):
+            self.assertEqual(collection.count_documents({"form_id": self.form_id}), 0)
+        self.assertFalse(
+            FormMaster.all_objects.filter(form_id=str(self.form_id)).exists()
+        )
+        # Nothing of the other form is touched
+        self.assertEqual(
+            submissions_collection().count_documents({"form_id": self.other_form_id}),
+            1,
+        )
+
+    def test_request_hides_the_form(self):
+        self.assertTrue(forms_collection().find_one(self.form_id)["deleting"])
+        self.assertEqual(deleting_form_ids(), [self.form_id])
+
+    def test_run_deletes_in_batches_and_counts(self):
+        self.assertTrue(self.run_deletion())
+
+        self.assert_form_gone()
+        job = self.job()
+        self.assertEqual(job["status"], DELETION_DONE)
+        self.assertEqual(
+            job["deleted"],
+            {"submissions": 5, "rollups": 1, "fields": 3, "assignments": 2},
+        )
+        self.assertEqual(deleting_form_ids(), [])
+
+    def test_crashed_job_resumes_where_it_stopped(self):
+        delete_fields = STEP_HANDLERS["fields"]
+
+        with mock.patch.dict(
+            STEP_HANDLERS, {"fields": mock.Mock(side_effect=RuntimeError("boom"))}
+        ):
+            self.assertFalse(self.run_deletion())
+
+        job = self.job()
+        self.assertEqual(job["status"], DELETION_FAILED)
+        self.assertEqual(job["steps_done"], ["submissions", "rollups"])
+        self.assertEqual(job["error"], "boom")
+
+        handlers = {
+            step: mock.Mock(wraps=handler) for step, handler in STEP_HANDLERS.items()
+        }
+        handlers["fields"] = mock.Mock(wraps=delete_fields)
+        with mock.patch.dict(STEP_HANDLERS, handlers):
+            self.assertEqual(resume_form_deletions(batch_size=2, sleep=0), 1)
+
+        self.assert_form_gone()
+        # Finished steps only get the final sweep, no full re-run
+        self.assertEqual(handlers["submissions"].call_count, 1)
+        self.assertEqual(self.job()["deleted"]["submissions"], 5)
+        self.assertEqual(self.job()["status"], DELETION_DONE)
+
+    def test_live_claim_is_not_taken_over(self):
+        self.assertIsNotNone(claim_form_deletion(self.form_id, stale_after=300))
+
+        self.assertIsNone(claim_form_deletion(self.form_id, stale_after=300))
+        self.assertFalse(self.run_deletion())
+
+    def test_stale_claim_is_taken_over_and_the_old_worker_stops(self):
+        stale = claim_form_deletion(self.form_id, stale_after=300)
+        deletions_collection().update_one(
+            {"_id": self.form_id},
+            {"$set": {"heartbeat": datetime.now(UTC) - timedelta(minutes=10)}},
+        )
+
+        fresh = claim_form_deletion(self.form_id, stale_after=300)
+
+        self.assertIsNotNone(fresh)
+        self.assertNotEqual(fresh["worker"], stale["worker"])
+        self.assertEqual(fresh["status"], DELETION_RUNNING)
+        self.assertEqual(fresh["started_at"], stale["started_at"])
+
+        # The stale worker's next progress write no longer matches its token
+        with mock.patch(
+            "apps.form_engine.utils.form_deletion.claim_form_deletion",
+            return_value=stale,
+        ):
+            self.assertFalse(self.run_deletion())
+        self.assertEqual(self.job()["worker"], fresh["worker"])
+
+    def test_late_submission_is_swept_before_the_form_goes(self):
+        delete_fields = STEP_HANDLERS["fields"]
+        late = [{"form_id": self.form_id}]
+
+        def late_submit_then_delete(form_id, batch_size):
+            # A submit that read the form before it was flagged lands now
+            if late:
+                submissions_collection().insert_one(late.pop())
+            return delete_fields(form_id, batch_size)
+
+        with mock.patch.dict(STEP_HANDLERS, {"fields": late_submit_then_delete}):
+            self.assertTrue(self.run_deletion())
+
+        self.assert_form_gone()
+
+    @mock.patch("apps.form_engine.utils.form_deletion.connections")
+    @mock.patch("apps.form_engine.utils.form_deletion.threading.Thread")
+    def test_scheduled_thread_closes_its_connections(self, thread, connections):
+        schedule_form_deletion(self.form_id)
+
+        target = thread.call_args.kwargs["target"]
+        with mock.patch(
+            "apps.form_engine.utils.form_deletion.run_form_deletion",
+            side_effect=RuntimeError("boom"),
+        ), self.assertRaises(RuntimeError):
+            target(*thread.call_args.kwargs["args"])
+
+        connections.close_all.assert_called_once_with()
+
+
+class MongoPaginationTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.collection = submissions_collection()
+        self.collection.insert_many([
+            {"form_id": idx % 2, "submitted_at": datetime(2025, 1, idx + 1)}
+            for idx in range(5)
+        ])
+
+    def paginator(self, count_strategy=None, **params):
+        request = Request(APIRequestFactory().get("/submissions", params))
+        return MongoPageNumberPagination(request, count_strategy=count_strategy)
+
+    def paginate(self, paginator, query=None):
+        collection = mock.Mock(wraps=self.collection)
+        collection.full_name = self.collection.full_name
+        results, total_count, total_page = paginator.paginate(
+            collection, query, sort=("submitted_at", -1)
+        )
+        return collection, paginator.get_paginated_response(
+            results, total_count, total_page
+        )
+
+    def test_exact_counts_every_request(self):
+        for _ in range(2):
+            collection, page = self.paginate(
+                self.paginator(COUNT_EXACT, page_size=2), {"form_id": 0}
+            )
+
+            collection.count_documents.assert_called_once_with({"form_id": 0})
+            self.assertEqual((page["count"], page["total_page"]), (3, 2))
+            self.assertTrue(page["count_exact"])
+            self.assertEqual(page["next"], 2)
+
+    def test_none_skips_the_count_and_peeks_for_a_next_page(self):
+        collection, page = self.paginate(self.paginator(COUNT_NONE, page_size=2))
+
+        collection.count_documents.assert_not_called()
+        self.assertEqual((page["count"], page["total_page"]), (None, None))
+        self.assertFalse(page["count_exact"])
+        self.assertEqual(page["next"], 2)
+        self.assertEqual(len(page["results"]), 2)
+
+        _, page = self.paginate(self.paginator(COUNT_NONE, page_size=2, page=3))
+        self.assertIsNone(page["next"])
+        self.assertEqual(len(page["results"]), 1)
+
+    def test_estimated_uses_collection_metadata_without_a_filter(self):
+        collection, page = self.paginate(self.paginator(COUNT_ESTIMATED))
+
+        collection.estimated_document_count.assert_called_once_with()
+        collection.count_documents.assert_not_called()
+        self.assertEqual(page["count"], 5)
+        self.assertFalse(page["count_exact"])
+
+    def test_estimated_with_a_filter_falls_back_to_the_cached_count(self):
+        collection, page = self.paginate(
+            self.paginator(COUNT_ESTIMATED), {"form_id": 1}
+        )
+
+        collection.estimated_document_count.assert_not_called()
+        collection.count_documents.assert_called_once_with({"form_id": 1})
+        self.assertEqual(page["count"], 2)
+        self.assertTrue(page["count_exact"])
+
+        collection, page = self.paginate(
+            self.paginator(COUNT_ESTIMATED), {"form_id": 1}
+        )
+        collection.count_documents.assert_not_called()
+        self.assertEqual(page["count"], 2)
+        self.assertFalse(page["count_exact"])
+
+    def test_cached_reuses_the_count_per_query(self):
+        self.paginate(self.paginator(COUNT_CACHED), {"form_id": 0})
+        self.collection.insert_one({"form_id": 0})
+
+        collection, page = self.paginate(self.paginator(COUNT_CACHED), {"form_id": 0})
+        collection.count_documents.assert_not_called()
+        self.assertEqual(page["count"], 3)
+        self.assertFalse(page["count_exact"])
+
+        collection, page = self.paginate(self.paginator(COUNT_CACHED), {"form_id": 1})
+        collection.count_documents.assert_called_once_with({"form_id": 1})
+        self.assertEqual(page["count"], 2)
+
+    @override_settings(MONGO_PAGINATION_COUNT_STRATEGY=COUNT_NONE)
+    def test_setting_picks_the_default_strategy(self):
+        self.assertEqual(self.paginator().count_strategy, COUNT_NONE)
+
+    def test_malformed_cursor_is_not_found(self):
+        for token in ("not base64!", "bm90IGpzb24=", "WzEsIDJd", "e30="):
+            with self.subTest(token=token), self.assertRaises(NotFound):
+                self.paginator(cursor=token)
+
+    def insert_legacy_rows(self):
+        # One with an explicit null, one without the sort key at all
+        self.collection.insert_many([
+            {"form_id": 0, "submitted_at": None},
+            {"form_id": 1},
+        ])
+
+    def walk(self, direction, **params) -> list:
+        pages, token = [], ""
+        while token is not None:
+            paginator = self.paginator(cursor=token, page_size=2, **params)
+            results, total_count, total_page = paginator.paginate(
+                self.collection, sort=("submitted_at", direction)
+            )
+            page = paginator.get_paginated_response(
+                results, total_count, total_page
+            )
+            pages.append(page)
+            token = page["next"]
+        return pages
+
+    def expected_order(self, direction) -> list:
+        return [
+            doc["_id"]
+            for doc in self.collection.find().sort(
+                [("submitted_at", direction), ("_id", direction)]
+            )
+        ]
+
+    def test_cursor_walk_reaches_null_sort_values(self):
+        self.insert_legacy_rows()
+
+        for direction in (1, -1):
+            with self.subTest(direction=direction):
+                pages = self.walk(direction)
+
+                walked = [doc["_id"] for page in pages for doc in page["results"]]
+                self.assertEqual(walked, self.expected_order(direction))
+                self.assertEqual(len(walked), 7)
+
+    def test_previous_cursor_walks_back_across_nulls(self):
+        self.insert_legacy_rows()
+        pages = self.walk(-1)
+        last = pages[-1]
+
+        paginator = self.paginator(cursor=last["previous"], page_size=2)
+        results, _, _ = paginator.paginate(
+            self.collection, sort=("submitted_at", -1)
+        )
+
+        self.assertEqual(
+            [doc["_id"] for doc in results],
+            [doc["_id"] for doc in pages[-2]["results"]],
+        )
+
+    def test_cursor_param_switches_the_response_shape(self):
+        _, page = self.paginate(self.paginator(page_size=2))
+        self.assertEqual(
+            set(page),
+            {"next", "previous", "current", "total_page", "count", "count_exact",
+             "results"},
+        )
+        self.assertEqual(page["next"], 2)
+
+        [first, *_] = self.walk(-1)
+        self.assertEqual(set(first), {"next", "previous", "page_size", "results"})
+        self.assertIsInstance(first["next"], str)
+        self.assertIsNone(first["previous"])
+
+
+class MongoIndexTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.db = mongo.get_mongo_db()
+        ensure_indexes(self.db)
+
+    def test_declared_indexes_have_no_drift(self):
+        self.assertEqual(index_drift(self.db), {})
+
+    def test_missing_index(self):
+        self.db["submissions"].drop_index("submitted_by_submitted_at")
+
+        self.assertEqual(
+            index_drift(self.db),
+            {
+                "submissions": {
+                    "missing": ["submitted_by_submitted_at"],
+                    "mismatched": [],
+                    "extra": [],
+                }
+            },
+        )
+
+    def test_same_name_with_other_keys_or_options_is_mismatched(self):
+        self.db["form_deletions"].drop_index("status")
+        self.db["form_deletions"].create_index([("status", -1)], name="status")
+        self.db["submission_rollups"].drop_index("form_id_day")
+        self.db["submission_rollups"].create_index(
+            [("form_id", 1), ("day", 1)], name="form_id_day"
+        )
+
+        drift = index_drift(self.db)
+
+        self.assertEqual(drift["form_deletions"]["mismatched"], ["status"])
+        self.assertEqual(drift["submission_rollups"]["mismatched"], ["form_id_day"])
+
+    def test_undeclared_index_is_extra(self):
+        self.db["fields"].create_index([("form_id", 1), ("created_at", -1)])
+
+        self.assertEqual(
+            index_drift(self.db)["fields"]["extra"], ["form_id_1_created_at_-1"]
+        )
+
+    def test_conflicting_index_is_skipped_and_reported(self):
+        create_indexes = Collection.create_indexes
+
+        def conflicting(collection, models, *args, **kwargs):
+            if models[0].document["name"] == "status":
+                raise OperationFailure("Index already exists", code=85)
+            return create_indexes(collection, models, *args, **kwargs)
+
+        self.db["form_deletions"].drop_index("status")
+        self.db["form_deletions"].create_index([("status", -1)], name="status")
+        self.db["forms"].drop_index("created_by_created_at")
+        stdout = io.StringIO()
+
+        with mock.patch.object(
+            Collection, "create_indexes", autospec=True, side_effect=conflicting
+        ), self.assertRaises(CommandError):
+            call_command("mongo_indexes", stdout=stdout)
+
+        self.assertIn("created_by_created_at", self.db["forms"].index_information())
+        self.assertIn("form_deletions.status: mismatched", stdout.getvalue())
+
+
+class FormSubmissionBatchViewTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.member = get_user_model().objects.create_user(
+            username="member", email="member@example.com", password="password"
+        )
+        self.form_id = forms_collection().insert_one({
+            "name": "Signup",
+            "is_active": True,
+            "version": 0,
+            FIELD_SNAPSHOT: [{"name": "email", "type": "email", "required": True}],
+        }).inserted_id
+
+    def submit(self, *emails, form_id=None):
+        form_id = str(form_id or self.form_id)
+        request = APIRequestFactory().post(
+            f"/forms/submissions/batch/{form_id}",
+            {
+                "submissions": [
+                    {"values": {"email": email} if email else {}} for email in emails
+                ]
+            },
+            format="json",
+        )
+        force_authenticate(request, user=self.member)
+        return views.FormSubmissionBatchView.as_view()(request, form_id=form_id)
+
+    def stored(self) -> int:
+        return submissions_collection().count_documents({"form_id": self.form_id})
+
+    def total(self) -> int:
+        return rollups_collection().find_one(
+            {"form_id": self.form_id, "day": TOTAL_DAY}
+        )["count"]
+
+    def test_valid_batch_is_stored_and_counted(self):
+        response = self.submit("a@example.com", "b@example.com")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [item["index"] for item in response.data["created"]], [0, 1]
+        )
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(self.stored(), 2)
+        self.assertEqual(self.total(), 2)
+
+    def test_invalid_items_are_reported_by_index(self):
+        response = self.submit("a@example.com", None, "c@example.com")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [item["index"] for item in response.data["created"]], [0, 2]
+        )
+        self.assertEqual(
+            response.data["errors"],
+            [{"index": 1, "errors": {"email": REQUIRED_ERROR}}],
+        )
+        self.assertEqual(self.stored(), 2)
+        self.assertEqual(self.total(), 2)
+
+    def test_rejected_writes_are_partial_failures(self):
+        collection = submissions_collection()
+
+        def failing_insert_many(documents, **kwargs):
+            # The server rejects the second valid item, stores the others
+            collection.insert_many(documents[:1] + documents[2:])
+            raise BulkWriteError({
+                "writeErrors": [{"index": 1, "code": 121, "errmsg": "rejected"}]
+            })
+
+        with mock.patch(
+            "apps.form_engine.views.submissions_collection",
+            return_value=mock.Mock(wraps=collection, insert_many=failing_insert_many),
+        ):
+            response = self.submit("a@example.com", None, "c@example.com", "d@x.io")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            [item["index"] for item in response.data["created"]], [0, 3]
+        )
+        self.assertEqual(
+            response.data["errors"],
+            [
+                {"index": 1, "errors": {"email": REQUIRED_ERROR}},
+                {"index": 2, "errors": {"detail": "rejected"}},
+            ],
+        )
+        self.assertEqual(self.total(), 2)
+
+    def test_nothing_valid_is_a_bad_request(self):
+        response = self.submit(None, "not-an-email")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            [item["index"] for item in response.data["errors"]], [0, 1]
+        )
+        self.assertEqual(self.stored(), 0)
+
+    def test_empty_batch_is_rejected(self):
+        self.assertEqual(self.submit().status_code, 400)
+
+    def test_inactive_form_is_not_found(self):
+        forms_collection().update_one(
+            {"_id": self.form_id}, {"$set": {"is_active": False}}
+        )
+
+        self.assertEqual(self.submit("a@example.com").status_code, 404)
+        self.assertEqual(self.stored(), 0)
+
+
+class AsyncViewTests(MongoTestCase):
+    def setUp(self):
+        super().setUp()
+        user_model = get_user_model()
+        self.owner = user_model.objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="password",
+            is_staff=True,
+        )
+        self.member = user_model.objects.create_user(
+            username="member", email="member@example.com", password="password"
+        )
+        self.form_id, self.fields = self.create_form(self.owner, 1)
+        field_collection().update_one(
+            {"_id": self.fields[0]},
+            {"$set": {"name": "email", "type": "email", "required": True}},
+        )
+        forms_collection().update_one(
+            {"_id": self.form_id},
+            {"$set": {"is_active": True, "assigned_users": [str(self.member.pk)]}},
+        )
+
+    def call(self, view, method, path, user, data=None, **kwargs):
+        request = getattr(APIRequestFactory(), method)(path, data, format="json")
+        force_authenticate(request, user=user)
+        return async_to_sync(view.as_view())(request, **kwargs)
+
+    def submit(self, values):
+        return self.call(
+            async_views.AsyncFormSubmissionView,
+            "post",
+            f"/forms/submit/{self.form_id}",
+            self.member,
+            {"values": values},
+            form_id=str(self.form_id),
+        )
+
+    def list_submissions(self, user):
+        return self.call(
+            async_views.AsyncFormSubmissionListView, "get", "/forms/submissions", user
+        )
+
+    def test_form_list_shows_assigned_forms(self):
+        response = self.call(
+            async_views.AsyncFormListView, "get", "/forms/list", self.member
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [form["id"] for form in response.data["results"]], [str(self.form_id)]
+        )
+
+    def test_submit_validates_from_the_snapshot(self):
+        forms_collection().update_one(
+            {"_id": self.form_id},
+            {"$set": {FIELD_SNAPSHOT: [{"name": "email", "type": "text"}]}},
+        )
+
+        with mock.patch(
+            "apps.form_engine.async_views._fetch_active_fields"
+        ) as fetch_active_fields:
+            response = self.submit({"email": "not an email"})
+
+        self.assertEqual(response.status_code, 201)
+        fetch_active_fields.assert_not_called()
+
+    def test_submit_falls_back_to_the_fields_without_a_snapshot(self):
+        response = self.submit({"email": "not an email"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", response.data["errors"])
+
+        response = self.submit({"email": "user@example.com"})
+        self.assertEqual(response.status_code, 201)
+        stored = submissions_collection().find_one(
+            ObjectId(response.data["submission_id"])
+        )
+        self.assertEqual(stored["values"], {"email": "user@example.com"})
+        self.assertEqual(
+            rollups_collection().find_one(
+                {"form_id": self.form_id, "day": TOTAL_DAY}
+            )["count"],
+            1,
+        )
+
+    def test_submit_to_an_inactive_form_is_not_found(self):
+        forms_collection().update_one(
+            {"_id": self.form_id}, {"$set": {"is_active": False}}
+        )
+
+        self.assertEqual(self.submit({"email": "user@example.com"}).status_code, 404)
+
+    def test_submission_list_per_role(self):
+        self.submit({"email": "user@example.com"})
+        submissions_collection().insert_one(
+            {"form_id": ObjectId(), "submitted_by": "someone else"}
+        )
+
+        for user in (self.member, self.owner):
+            with self.subTest(user=user.username):
+                response = self.list_submissions(user)
+
+                self.assertEqual(response.status_code, 200)
+                [submission] = response.data["results"]
+                self.assertEqual(submission["form_id"], str(self.form_id))
+                self.assertEqual(submission["submitted_by"], str(self.member.pk))
+
+    def test_submission_list_hides_forms_being_deleted(self):
+        self.submit({"email": "user@example.com"})
+        request_form_deletion(self.form_id, str(self.owner.pk))
+
+        response = self.list_submissions(self.member)
+
+        self.assertEqual(response.data["results"], [])
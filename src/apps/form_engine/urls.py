@@ -1,18 +1,42 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+if settings.FORM_ENGINE_ASYNC_VIEWS:
+    from . import async_views
+
+    form_list_view = async_views.AsyncFormListView
+    field_list_view = async_views.AsyncFormFieldListView
+    submission_view = async_views.AsyncFormSubmissionView
+    submission_list_view = async_views.AsyncFormSubmissionListView
+else:
+    form_list_view = views.FormListView
+    field_list_view = views.FormFieldListView
+    submission_view = views.FormSubmissionView
+    submission_list_view = views.FormSubmissionListView
+
 urlpatterns = [
-    path("list", views.FormListView.as_view()),
+    path("list", form_list_view.as_view()),
     path("create", views.FormCreateView.as_view()),
     path("update/<str:form_id>", views.FormUpdateView.as_view()),
     path("destroy/<str:form_id>", views.FormDestroyView.as_view()),
+    path("deletions/<str:form_id>", views.FormDeletionStatusView.as_view()),
+    path("render/<str:form_id>", views.FormRenderView.as_view()),
 
     path("fields/update-order", views.UpdateFieldIndexView.as_view()),
-    path("fields/<str:form_id>", views.FormFieldListView.as_view()),
+    path("fields/move/<str:field_id>", views.FieldMoveView.as_view()),
+    path("fields/<str:form_id>", field_list_view.as_view()),
     path("fields/create/<str:form_id>", views.FieldCreateView.as_view()),
     path("fields/update/<str:field_id>", views.FormFieldUpdateView.as_view()),
     path("fields/destroy/<str:field_id>", views.FieldDestroyView.as_view()),
 
-    path("submissions/create/<str:form_id>", views.FormSubmissionView.as_view()),
-    path("submissions", views.FormSubmissionListView.as_view()),
-]
\ No newline at end of file
+    path("submissions/create/<str:form_id>", submission_view.as_view()),
+    path("submissions/batch/<str:form_id>", views.FormSubmissionBatchView.as_view()),
+    path("submissions", submission_list_view.as_view()),
+    path("submissions/export/<str:form_id>", views.FormSubmissionExportView.as_view()),
+    path("submissions/stats/<str:form_id>", views.FormSubmissionStatsView.as_view()),
+
+    path("analytics/<str:form_id>", views.FormAnalyticsView.as_view()),
+    path("ingest/metrics", views.SubmissionBufferMetricsView.as_view()),
+    path("metrics/mongo", views.MongoMetricsView.as_view()),
+]
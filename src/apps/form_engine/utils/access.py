@@ -0,0 +1,81 @@
+from bson import ObjectId
+from pymongo import UpdateMany, UpdateOne
+
+from apps.form_engine.models import FormMaster
+from core.db.mongo import forms_collection
+
+# Form assignments live in FormMaster (SQL) and are mirrored onto each form
+# document as `assigned_users`, so a member's form list is one indexed query.
+ASSIGNED_USERS_FIELD = "assigned_users"
+
+# Bookkeeping on form documents that API responses never return: the
+# assignment mirror (other users' ids), the field snapshot and sequence.
+FORM_RESPONSE_PROJECTION = {
+    ASSIGNED_USERS_FIELD: 0,
+    "field_snapshot": 0,
+    "field_seq": 0,
+}
+
+
+def assigned_forms_query(user) -> dict:
+    return {ASSIGNED_USERS_FIELD: str(user.pk)}
+
+
+def mirror_form_assignments(user_ids, added=(), removed=()) -> None:
+    user_ids = [str(user_id) for user_id in user_ids]
+    operations = []
+
+    if added:
+        operations.append(
+            UpdateMany(
+                {"_id": {"$in": [ObjectId(form_id) for form_id in added]}},
+                {"$addToSet": {ASSIGNED_USERS_FIELD: {"$each": user_ids}}},
+            )
+        )
+
+    if removed:
+        operations.append(
+            UpdateMany(
+                {"_id": {"$in": [ObjectId(form_id) for form_id in removed]}},
+                {"$pull": {ASSIGNED_USERS_FIELD: {"$in": user_ids}}},
+            )
+        )
+
+    if operations:
+        forms_collection().bulk_write(operations, ordered=False)
+
+
+def rebuild_form_assignments(batch_size=1000) -> int:
+    assignments = {}
+    for form_id, user_id in FormMaster.objects.values_list("form_id", "user_id"):
+        assignments.setdefault(form_id, []).append(str(user_id))
+
+    operations = [
+        UpdateOne(
+            {"_id": ObjectId(form_id)},
+            {"$set": {ASSIGNED_USERS_FIELD: user_ids}},
+        )
+        for form_id, user_ids in assignments.items()
+        if ObjectId.is_valid(form_id)
+    ]
+
+    for start in range(0, len(operations), batch_size):
+        forms_collection().bulk_write(
+            operations[start:start + batch_size], ordered=False
+        )
+
+    forms_collection().update_many(
+        {
+            ASSIGNED_USERS_FIELD: {"$exists": True, "$ne": []},
+            "_id": {
+                "$nin": [
+                    ObjectId(form_id)
+                    for form_id in assignments
+                    if ObjectId.is_valid(form_id)
+                ]
+            },
+        },
+        {"$set": {ASSIGNED_USERS_FIELD: []}},
+    )
+
+    return len(operations)
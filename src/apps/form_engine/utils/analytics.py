@@ -0,0 +1,143 @@
+from bson import ObjectId
+from django.core.cache import cache
+
+from core.db.mongo import field_collection, submissions_collection
+
+ANALYTICS_CACHE_TTL = 300
+DATE_BUCKETS = {"year": 4, "month": 7, "day": 10}
+
+
+def _field_value(name: str) -> dict:
+    # $getField keeps names containing "." or a leading "$" from being read
+    # as paths/operators.
+    return {"$getField": {"field": {"$literal": name}, "input": "$values"}}
+
+
+def _field_facet(field: dict, date_bucket: str):
+    value = {"$project": {"_id": 0, "v": _field_value(field["name"])}}
+    field_type = field.get("type")
+
+    if field_type == "checkbox":
+        return [
+            value,
+            {"$match": {"v": {"$type": "bool"}}},
+            {"$group": {"_id": "$v", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+        ]
+
+    if field_type == "multi_checkbox":
+        return [
+            value,
+            {"$unwind": "$v"},
+            {"$group": {"_id": "$v", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}},
+        ]
+
+    if field_type == "number":
+        return [
+            value,
+            {"$match": {"v": {"$type": "number"}}},
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "min": {"$min": "$v"},
+                    "max": {"$max": "$v"},
+                    "avg": {"$avg": "$v"},
+                }
+            },
+        ]
+
+    if field_type == "date":
+        return [
+            value,
+            {"$match": {"v": {"$type": "string"}}},
+            {
+                "$group": {
+                    "_id": {"$substrCP": ["$v", 0, DATE_BUCKETS[date_bucket]]},
+                    "count": {"$sum": 1},
+                }
+            },
+            {"$sort": {"_id": 1}},
+        ]
+
+    return None
+
+
+def build_analytics_pipeline(form_id, fields, date_bucket="month"):
+    facets = {"total": [{"$count": "count"}]}
+    facet_fields = {}
+
+    for idx, field in enumerate(fields):
+        facet = _field_facet(field, date_bucket)
+        if facet is not None:
+            key = f"f{idx}"
+            facets[key] = facet
+            facet_fields[key] = field
+
+    pipeline = [
+        {"$match": {"form_id": ObjectId(form_id)}},
+        {"$facet": facets},
+    ]
+    return pipeline, facet_fields
+
+
+def _format_facet(field: dict, rows: list) -> dict:
+    result = {"name": field["name"], "type": field["type"]}
+
+    if field["type"] == "number":
+        stats = rows[0] if rows else {}
+        result.update({
+            "count": stats.get("count", 0),
+            "min": stats.get("min"),
+            "max": stats.get("max"),
+            "avg": stats.get("avg"),
+        })
+    elif field["type"] == "date":
+        result["histogram"] = [
+            {"bucket": row["_id"], "count": row["count"]} for row in rows
+        ]
+    else:
+        result["counts"] = [
+            {"value": row["_id"], "count": row["count"]} for row in rows
+        ]
+
+    return result
+
+
+def compute_form_analytics(form: dict, date_bucket="month") -> dict:
+    form_id = form["_id"]
+    fields = list(
+        field_collection()
+        .find(
+            {"form_id": ObjectId(form_id), "is_active": True},
+            projection={"name": 1, "type": 1},
+        )
+        .sort("rank", 1)
+    )
+
+    pipeline, facet_fields = build_analytics_pipeline(form_id, fields, date_bucket)
+    facets = next(submissions_collection().aggregate(pipeline), {})
+
+    total = facets.get("total") or [{}]
+    return {
+        "form_id": str(form_id),
+        "total_submissions": total[0].get("count", 0),
+        "fields": [
+            _format_facet(field, facets.get(key, []))
+            for key, field in facet_fields.items()
+        ],
+    }
+
+
+def get_form_analytics(form: dict, date_bucket="month") -> dict:
+    # Keyed by form version so field changes invalidate immediately; new
+    # submissions show up once the window expires.
+    key = f"form-analytics:{form['_id']}:{form.get('version', 0)}:{date_bucket}"
+
+    analytics = cache.get(key)
+    if analytics is None:
+        analytics = compute_form_analytics(form, date_bucket)
+        cache.set(key, analytics, ANALYTICS_CACHE_TTL)
+
+    return analytics
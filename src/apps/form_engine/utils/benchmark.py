@@ -0,0 +1,263 @@
+import itertools
+import platform
+import statistics
+import time
+from datetime import timedelta
+
+import django
+from bson import ObjectId
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.form_engine import views
+from apps.form_engine.models import FormMaster
+from apps.form_engine.utils.field_validation import (
+    FIELD_SNAPSHOT,
+    build_field_snapshot,
+)
+from apps.form_engine.utils.ranking import initial_ranks
+from core.db.mongo import field_collection, forms_collection, submissions_collection
+from core.middleware import profile_queries
+
+USER = get_user_model()
+
+FIELD_TYPES = ("text", "email", "number", "date", "checkbox", "multi_checkbox")
+OPTIONS = ["a", "b", "c", "d"]
+
+
+def make_field(idx: int) -> dict:
+    field_type = FIELD_TYPES[idx % len(FIELD_TYPES)]
+    field = {
+        "name": f"field_{idx}",
+        "label": f"Field {idx}",
+        "type": field_type,
+        "required": idx % 3 == 0,
+    }
+    if field_type == "text":
+        field["max_length"] = 200
+    if field_type == "multi_checkbox":
+        field["options"] = OPTIONS
+    return field
+
+
+def make_value(field: dict):
+    return {
+        "text": "lorem ipsum",
+        "email": "user@example.com",
+        "number": 42,
+        "date": "2025-01-31",
+        "checkbox": True,
+        "multi_checkbox": ["a", "c"],
+    }[field["type"]]
+
+
+def percentile(samples, pct):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+class FormEngineBenchmark:
+    """
+    Drives the form engine views in-process with APIRequestFactory against
+    whatever the Mongo client and default database currently point at. Callers
+    are responsible for pointing those at throwaway databases.
+    """
+
+    def __init__(self, fields=20, forms=100, submissions=10000, iterations=200):
+        self.field_count = fields
+        self.form_count = forms
+        self.submission_count = submissions
+        self.iterations = iterations
+        self.factory = APIRequestFactory()
+
+    def setup(self) -> None:
+        self.staff = USER.objects.create_user(
+            username="bench-staff",
+            email="bench-staff@example.com",
+            password="bench-password",
+            is_staff=True,
+        )
+        self.member = USER.objects.create_user(
+            username="bench-member",
+            email="bench-member@example.com",
+            password="bench-password",
+        )
+
+        # `fields` is also posted by form_create, so the ids live on copies
+        self.fields = [make_field(idx) for idx in range(self.field_count)]
+        field_documents = [{**field, "_id": ObjectId()} for field in self.fields]
+        self.values = {field["name"]: make_value(field) for field in self.fields}
+
+        now = timezone.now()
+        forms = [
+            {
+                "_id": ObjectId(),
+                "name": f"Benchmark form {idx}",
+                "submit": "Submit",
+                "is_active": True,
+                "created_by": str(self.staff.pk),
+                "created_at": now - timedelta(minutes=idx),
+                "updated_at": now,
+                "field_seq": 0 if idx else self.field_count,
+                "version": 0,
+                FIELD_SNAPSHOT: build_field_snapshot([] if idx else field_documents),
+            }
+            for idx in range(self.form_count)
+        ]
+        forms_collection().insert_many(forms)
+        self.form_id = str(forms[0]["_id"])
+        # field_create gets a form of its own: the fields it adds (some
+        # required) would otherwise make every later submission a 400.
+        self.field_form_id = str(forms[1]["_id"])
+
+        field_collection().insert_many([
+            {
+                **field,
+                "form_id": forms[0]["_id"],
+                "is_active": True,
+                "allow_blank": True,
+                "created_by": str(self.staff.pk),
+                "created_at": now,
+                "updated_at": now,
+                "order": idx,
+                "rank": rank,
+            }
+            for idx, (field, rank) in enumerate(
+                zip(field_documents, initial_ranks(len(field_documents)))
+            )
+        ])
+
+        FormMaster.objects.bulk_create(
+            [FormMaster(user=self.member, form_id=str(form["_id"])) for form in forms]
+        )
+
+        batch = []
+        for idx in range(self.submission_count):
+            batch.append({
+                "form_id": forms[0]["_id"],
+                "submitted_by": str(self.member.pk),
+                "values": self.values,
+                "submitted_at": now - timedelta(seconds=idx),
+                "updated_at": now,
+            })
+            if len(batch) == 1000:
+                submissions_collection().insert_many(batch)
+                batch = []
+        if batch:
+            submissions_collection().insert_many(batch)
+
+    def scenarios(self) -> dict:
+        counter = itertools.count()
+
+        def extra_field():
+            idx = next(counter)
+            return {**make_field(idx), "name": f"extra_{idx}"}
+
+        return {
+            "form_create": lambda: self.call(
+                views.FormCreateView,
+                "post",
+                "/forms/create",
+                self.staff,
+                data={"name": f"Created {next(counter)}", "fields": self.fields},
+            ),
+            "field_create": lambda: self.call(
+                views.FieldCreateView,
+                "post",
+                f"/forms/fields/create/{self.field_form_id}",
+                self.staff,
+                data=extra_field(),
+                form_id=self.field_form_id,
+            ),
+            "submission_create": lambda: self.call(
+                views.FormSubmissionView,
+                "post",
+                f"/forms/submissions/create/{self.form_id}",
+                self.member,
+                data={"values": self.values},
+                form_id=self.form_id,
+            ),
+            "submission_list": lambda: self.call(
+                views.FormSubmissionListView,
+                "get",
+                "/forms/submissions",
+                self.staff,
+                data={"page": 1 + next(counter) % 50, "page_size": 100},
+            ),
+            "form_render": lambda: self.call(
+                views.FormRenderView,
+                "get",
+                f"/forms/render/{self.form_id}",
+                self.member,
+                form_id=self.form_id,
+            ),
+            "form_list_staff": lambda: self.call(
+                views.FormListView, "get", "/forms/list", self.staff
+            ),
+            "form_list_member": lambda: self.call(
+                views.FormListView, "get", "/forms/list", self.member
+            ),
+        }
+
+    def call(self, view_class, method, path, user, data=None, **kwargs):
+        request = getattr(self.factory, method)(path, data, format="json")
+        force_authenticate(request, user=user)
+        response = view_class.as_view()(request, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{path} returned {response.status_code}")
+        return response
+
+    def run_scenario(self, func, warmup=5) -> dict:
+        for _ in range(warmup):
+            func()
+
+        samples = []
+        sql_queries = 0
+        mongo_commands = 0
+
+        started = time.perf_counter()
+        for _ in range(self.iterations):
+            with profile_queries() as profile:
+                call_started = time.perf_counter()
+                func()
+                samples.append((time.perf_counter() - call_started) * 1000)
+            sql_queries += profile.sql_count
+            mongo_commands += profile.mongo_count
+        elapsed = time.perf_counter() - started
+
+        return {
+            "iterations": self.iterations,
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "mean_ms": round(statistics.fmean(samples), 3),
+            "throughput_rps": round(self.iterations / elapsed, 2),
+            "sql_queries_per_op": sql_queries / self.iterations,
+            "mongo_commands_per_op": mongo_commands / self.iterations,
+        }
+
+    def run(self, only=None) -> dict:
+        results = {}
+
+        for name, func in self.scenarios().items():
+            if only and name not in only:
+                continue
+            try:
+                results[name] = self.run_scenario(func)
+            except Exception as e:
+                results[name] = {"error": f"{type(e).__name__}: {e}"}
+
+        return {
+            "meta": {
+                "timestamp": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "platform": platform.platform(),
+                "fields": self.field_count,
+                "forms": self.form_count,
+                "submissions": self.submission_count,
+                "iterations": self.iterations,
+            },
+            "results": results,
+        }
@@ -1,31 +1,282 @@
-def validate_field_value(field, value) -> None:
-    field_type = field["type"]
-    required = field.get("required", False)
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
 
-    if value is None:
-        if required:
-            raise ValueError("This field is required")
-        return
+from bson import ObjectId
 
-    if field_type == "text":
-        if not isinstance(value, str):
-            raise ValueError("Must be a string")
+from core.db.mongo import field_collection
 
-    elif field_type == "number":
-        if not isinstance(value, (int, float)):
-            raise ValueError("Must be a number")
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
-    elif field_type == "date":
-        if not isinstance(value, str):
-            raise ValueError("Must be a date string")
+REQUIRED_ERROR = "This field is required"
+BLANK_ERROR = "This field may not be blank"
 
-    elif field_type == "checkbox":
-        if not isinstance(value, bool):
-            raise ValueError("Must be true or false")
+PLAN_CACHE_SIZE = 512
 
-    elif field_type == "file":
-        if not isinstance(value, str):
-            raise ValueError("Invalid file reference")
 
-    else:
-        raise ValueError("Unsupported field type")
+def _check_text(rule, value):
+    if not isinstance(value, str):
+        return "Must be a string"
+    return rule.check_length(value) or rule.check_option(value)
+
+
+def _check_email(rule, value):
+    if not isinstance(value, str):
+        return "Must be a string"
+    if not EMAIL_RE.match(value):
+        return "Enter a valid email address"
+    return rule.check_length(value)
+
+
+def _check_number(rule, value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return "Must be a number"
+    return None
+
+
+def _check_date(rule, value):
+    if not isinstance(value, str) or not DATE_RE.match(value):
+        return "Must be a date string (YYYY-MM-DD)"
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return "Invalid date"
+    return None
+
+
+def _check_checkbox(rule, value):
+    if not isinstance(value, bool):
+        return "Must be true or false"
+    return None
+
+
+def _check_multi_checkbox(rule, value):
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        return "Must be a list of strings"
+    if rule.options is not None:
+        invalid = [v for v in value if v not in rule.options]
+        if invalid:
+            return f"Invalid choices: {invalid}"
+    return rule.check_length(value)
+
+
+def _check_file(rule, value):
+    # A file is either a plain reference (path/url) or {"name": ..., "size": bytes}
+    size = None
+    if isinstance(value, dict):
+        size = value.get("size")
+        value = value.get("name")
+    if not isinstance(value, str) or not value:
+        return "Invalid file reference"
+
+    if rule.extensions is not None:
+        ext = value.rsplit(".", 1)[-1].lower() if "." in value else ""
+        if ext not in rule.extensions:
+            return f"File type not allowed. Allowed: {sorted(rule.extensions)}"
+
+    if rule.max_size is not None and size is not None:
+        if not isinstance(size, (int, float)) or size > rule.max_size:
+            return f"File exceeds {rule.max_size // (1024 * 1024)} MB"
+    return None
+
+
+CHECKS = {
+    "text": _check_text,
+    "email": _check_email,
+    "number": _check_number,
+    "date": _check_date,
+    "checkbox": _check_checkbox,
+    "multi_checkbox": _check_multi_checkbox,
+    "file": _check_file,
+}
+
+
+class FieldRule:
+    __slots__ = (
+        "name",
+        "required",
+        "allow_blank",
+        "check",
+        "min_length",
+        "max_length",
+        "options",
+        "extensions",
+        "max_size",
+    )
+
+    def __init__(self, field: dict):
+        self.name = field["name"]
+        self.required = bool(field.get("required", False))
+        self.allow_blank = field.get("allow_blank", True)
+        self.check = CHECKS.get(field.get("type"))
+        self.min_length = field.get("min_length")
+        self.max_length = field.get("max_length")
+
+        options = field.get("options")
+        self.options = frozenset(options) if options else None
+
+        extensions = field.get("allowed_extensions")
+        self.extensions = (
+            frozenset(ext.lower().lstrip(".") for ext in extensions)
+            if extensions
+            else None
+        )
+
+        max_size_mb = field.get("max_size_mb")
+        self.max_size = max_size_mb * 1024 * 1024 if max_size_mb else None
+
+    def check_length(self, value):
+        if self.min_length is not None and len(value) < self.min_length:
+            return f"Ensure this has at least {self.min_length} characters"
+        if self.max_length is not None and len(value) > self.max_length:
+            return f"Ensure this has at most {self.max_length} characters"
+        return None
+
+    def check_option(self, value):
+        if self.options is not None and value not in self.options:
+            return f"Invalid choice: {value}"
+        return None
+
+    def validate(self, value):
+        if value is None:
+            return REQUIRED_ERROR if self.required else None
+        if value == "" and not self.allow_blank:
+            return BLANK_ERROR
+        if self.check is None:
+            return "Unsupported field type"
+        return self.check(self, value)
+
+
+class ValidationPlan:
+    __slots__ = ("version", "rules")
+
+    def __init__(self, fields, version=0):
+        self.version = version
+        self.rules = tuple(FieldRule(field) for field in fields)
+
+    def validate(self, values: dict) -> tuple[dict, dict]:
+        errors = {}
+        cleaned_values = {}
+
+        for rule in self.rules:
+            value = values.get(rule.name)
+            error = rule.validate(value)
+            if error:
+                errors[rule.name] = error
+            elif value is not None:
+                cleaned_values[rule.name] = value
+
+        return cleaned_values, errors
+
+
+def compile_validation_plan(fields, version=0) -> ValidationPlan:
+    return ValidationPlan(fields, version)
+
+
+FIELD_PROJECTION = {
+    "_id": 0,
+    "name": 1,
+    "type": 1,
+    "required": 1,
+    "allow_blank": 1,
+    "min_length": 1,
+    "max_length": 1,
+    "options": 1,
+    "allowed_extensions": 1,
+    "max_size_mb": 1,
+}
+
+
+def active_fields_query(form_id) -> dict:
+    return {"form_id": ObjectId(form_id), "is_active": True}
+
+
+# Active field specs embedded on the form document, kept in step with
+# `version`, so a submit can validate from the single form read.
+FIELD_SNAPSHOT = "field_snapshot"
+
+SNAPSHOT_KEYS = tuple(key for key in FIELD_PROJECTION if key != "_id")
+
+# Everything a submit needs from the form, minus the assignment mirror
+SUBMISSION_FORM_PROJECTION = {"assigned_users": 0}
+
+
+def is_snapshot_field(field: dict) -> bool:
+    return field.get("is_active", True)
+
+
+def snapshot_entry(field: dict) -> dict:
+    # Entries carry the field id so single fields can be replaced or pulled
+    return {
+        "id": field["_id"],
+        **{key: field[key] for key in SNAPSHOT_KEYS if key in field},
+    }
+
+
+def build_field_snapshot(fields) -> list:
+    return [snapshot_entry(field) for field in fields if is_snapshot_field(field)]
+
+
+def fetch_field_snapshot(form_id) -> list:
+    fields = field_collection().find(
+        active_fields_query(form_id),
+        projection={**FIELD_PROJECTION, "_id": 1},
+        sort=[("rank", 1)],
+    )
+    return [snapshot_entry(field) for field in fields]
+
+
+_plan_cache: OrderedDict = OrderedDict()
+_plan_lock = threading.Lock()
+
+
+def get_cached_validation_plan(form_id, version=None):
+    with _plan_lock:
+        plan = _plan_cache.get(str(form_id))
+        if plan is None or (version is not None and plan.version != version):
+            return None
+        _plan_cache.move_to_end(str(form_id))
+        return plan
+
+
+def cache_validation_plan(form_id, plan: ValidationPlan) -> None:
+    key = str(form_id)
+    with _plan_lock:
+        _plan_cache[key] = plan
+        _plan_cache.move_to_end(key)
+        while len(_plan_cache) > PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+
+
+def get_snapshot_plan(form: dict):
+    """
+    Plan for `form` from the in-process cache or its embedded snapshot,
+    without touching the fields collection. None for forms with no snapshot.
+    """
+    version = form.get("version", 0)
+
+    plan = get_cached_validation_plan(form["_id"], version)
+    if plan is None and FIELD_SNAPSHOT in form:
+        plan = compile_validation_plan(form[FIELD_SNAPSHOT], version)
+        cache_validation_plan(form["_id"], plan)
+    return plan
+
+
+def get_validation_plan(form: dict) -> ValidationPlan:
+    plan = get_snapshot_plan(form)
+    if plan is not None:
+        return plan
+
+    fields = field_collection().find(
+        active_fields_query(form["_id"]), projection=FIELD_PROJECTION
+    )
+    plan = compile_validation_plan(fields, form.get("version", 0))
+    cache_validation_plan(form["_id"], plan)
+    return plan
+
+
+def invalidate_validation_plan(form_id) -> None:
+    with _plan_lock:
+        _plan_cache.pop(str(form_id), None)
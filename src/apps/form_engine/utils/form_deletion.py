@@ -0,0 +1,276 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from bson import ObjectId
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from pymongo import ReturnDocument
+
+from apps.form_engine.models import FormMaster
+from apps.form_engine.utils.field_validation import invalidate_validation_plan
+from core.db.mongo import (
+    async_deletions_collection,
+    deletions_collection,
+    field_collection,
+    forms_collection,
+    rollups_collection,
+    submissions_collection,
+)
+
+logger = logging.getLogger(__name__)
+
+DELETION_PENDING = "pending"
+DELETION_RUNNING = "running"
+DELETION_FAILED = "failed"
+DELETION_DONE = "done"
+
+# Listed explicitly (not `$ne: done`) so lookups can use the status index
+UNFINISHED_STATUSES = [DELETION_PENDING, DELETION_RUNNING, DELETION_FAILED]
+
+DEFAULT_DELETION_SETTINGS = {
+    "BATCH_SIZE": 1000,
+    "SLEEP": 0.1,
+    "STALE_AFTER": 300,
+}
+
+# A form being deleted keeps its document until the job finishes; every live
+# read adds this so the form disappears as soon as deletion is requested.
+NOT_DELETING = {"deleting": {"$ne": True}}
+
+# Children go first and the form document last, so a half-finished job is
+# still discoverable and safe to resume.
+STEPS = ("submissions", "rollups", "fields", "assignments")
+
+# A submit or field create that read the form just before it was flagged can
+# still land after its step finished; these are swept once more right before
+# the form document goes.
+SWEEP_STEPS = ("submissions", "rollups", "fields")
+
+
+def deletion_settings() -> dict:
+    return {**DEFAULT_DELETION_SETTINGS, **getattr(settings, "FORM_DELETION", {})}
+
+
+def _delete_mongo_batch(collection, form_id, batch_size) -> tuple[int, int]:
+    ids = [
+        doc["_id"]
+        for doc in collection.find(
+            {"form_id": form_id}, projection={"_id": 1}, limit=batch_size
+        )
+    ]
+    if not ids:
+        return 0, 0
+
+    result = collection.delete_many({"_id": {"$in": ids}})
+    return len(ids), result.deleted_count
+
+
+def _delete_assignment_batch(form_id, batch_size) -> tuple[int, int]:
+    pks = list(
+        FormMaster.all_objects.filter(form_id=str(form_id)).values_list(
+            "pk", flat=True
+        )[:batch_size]
+    )
+    if not pks:
+        return 0, 0
+
+    deleted, _ = FormMaster.all_objects.filter(pk__in=pks).delete(soft=False)
+    return len(pks), deleted
+
+
+STEP_HANDLERS = {
+    "submissions": lambda form_id, size: _delete_mongo_batch(
+        submissions_collection(), form_id, size
+    ),
+    "rollups": lambda form_id, size: _delete_mongo_batch(
+        rollups_collection(), form_id, size
+    ),
+    "fields": lambda form_id, size: _delete_mongo_batch(
+        field_collection(), form_id, size
+    ),
+    "assignments": _delete_assignment_batch,
+}
+
+
+def request_form_deletion(form_id, created_by) -> dict:
+    """
+    Record a deletion job for the form and hide it from live reads. Safe to
+    call again for a form already being deleted.
+    """
+    form_id = ObjectId(form_id)
+    current_datetime = timezone.now()
+
+    # Job first: a crash before the form is flagged still leaves a job that
+    # the runner will pick up (and flag the form itself).
+    job = deletions_collection().find_one_and_update(
+        {"_id": form_id},
+        {
+            "$setOnInsert": {
+                "status": DELETION_PENDING,
+                "created_by": created_by,
+                "requested_at": current_datetime,
+                "deleted": {step: 0 for step in STEPS},
+                "steps_done": [],
+            }
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+    forms_collection().update_one(
+        {"_id": form_id, **NOT_DELETING},
+        {"$set": {"deleting": True, "deleting_at": current_datetime}},
+    )
+    return job
+
+
+def claim_form_deletion(form_id, stale_after):
+    """
+    Take ownership of a pending or failed job, or of a running one whose
+    worker stopped heartbeating. Returns None if someone else holds it.
+    """
+    current_datetime = timezone.now()
+    stale_before = current_datetime - timedelta(seconds=stale_after)
+
+    return deletions_collection().find_one_and_update(
+        {
+            "_id": ObjectId(form_id),
+            "$or": [
+                {"status": {"$in": [DELETION_PENDING, DELETION_FAILED]}},
+                {"status": DELETION_RUNNING, "heartbeat": {"$lt": stale_before}},
+            ],
+        },
+        {
+            "$set": {
+                "status": DELETION_RUNNING,
+                "worker": uuid.uuid4().hex,
+                "heartbeat": current_datetime,
+                "error": None,
+            },
+            "$min": {"started_at": current_datetime},
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+def _update_job(job, update: dict) -> bool:
+    # Matching on the worker token makes a job taken over as stale stop here
+    update.setdefault("$set", {})["heartbeat"] = timezone.now()
+    result = deletions_collection().update_one(
+        {"_id": job["_id"], "worker": job["worker"]}, update
+    )
+    return bool(result.matched_count)
+
+
+def _run_step(job, step, batch_size, sleep) -> bool:
+    """Delete the step's rows batch by batch; False once the job is lost."""
+    while True:
+        found, deleted = STEP_HANDLERS[step](job["_id"], batch_size)
+        if not _update_job(job, {"$inc": {f"deleted.{step}": deleted}}):
+            return False
+        if found < batch_size:
+            return True
+        if sleep:
+            time.sleep(sleep)
+
+
+def run_form_deletion(form_id, batch_size=None, sleep=None) -> bool:
+    """
+    Delete everything belonging to the form in bounded batches, pausing
+    between them to spare the primary. Progress is written after every
+    batch, so a crashed job resumes where it stopped. Returns True when the
+    job finished here.
+    """
+    options = deletion_settings()
+    batch_size = batch_size or options["BATCH_SIZE"]
+    sleep = options["SLEEP"] if sleep is None else sleep
+
+    job = claim_form_deletion(form_id, options["STALE_AFTER"])
+    if job is None:
+        return False
+
+    form_id = job["_id"]
+
+    try:
+        forms_collection().update_one({"_id": form_id}, {"$set": {"deleting": True}})
+
+        for step in STEPS:
+            if step in job.get("steps_done", []):
+                continue
+            if not _run_step(job, step, batch_size, sleep):
+                return False
+            if not _update_job(job, {"$addToSet": {"steps_done": step}}):
+                return False
+
+        for step in SWEEP_STEPS:
+            if not _run_step(job, step, batch_size, sleep):
+                return False
+
+        forms_collection().delete_one({"_id": form_id})
+        invalidate_validation_plan(form_id)
+
+        return _update_job(
+            job,
+            {"$set": {"status": DELETION_DONE, "finished_at": timezone.now()}},
+        )
+    except Exception as e:
+        logger.exception("Deleting form %s failed", form_id)
+        _update_job(
+            job, {"$set": {"status": DELETION_FAILED, "error": str(e)}}
+        )
+        return False
+
+
+def resume_form_deletions(batch_size=None, sleep=None) -> int:
+    finished = 0
+    for job in deletions_collection().find(
+        {"status": {"$in": UNFINISHED_STATUSES}}, projection={"_id": 1}
+    ):
+        finished += run_form_deletion(job["_id"], batch_size, sleep)
+    return finished
+
+
+def _run_scheduled_deletion(form_id) -> None:
+    try:
+        run_form_deletion(form_id)
+    finally:
+        # The thread's own DB connection would otherwise never be closed
+        connections.close_all()
+
+
+def schedule_form_deletion(form_id) -> None:
+    threading.Thread(
+        target=_run_scheduled_deletion,
+        args=(form_id,),
+        name=f"form-deletion-{form_id}",
+        daemon=True,
+    ).start()
+
+
+def deleting_form_ids() -> list:
+    return deletions_collection().distinct(
+        "_id", {"status": {"$in": UNFINISHED_STATUSES}}
+    )
+
+
+async def adeleting_form_ids() -> list:
+    return await async_deletions_collection().distinct(
+        "_id", {"status": {"$in": UNFINISHED_STATUSES}}
+    )
+
+
+def format_deletion_job(job: dict) -> dict:
+    return {
+        "form_id": str(job["_id"]),
+        "status": job["status"],
+        "deleted": job.get("deleted", {}),
+        "steps_done": job.get("steps_done", []),
+        "requested_at": job.get("requested_at"),
+        "started_at": job.get("started_at"),
+        "finished_at": job.get("finished_at"),
+        "error": job.get("error"),
+    }
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+
+from bson import ObjectId
+from django.core.cache import cache
+from django.utils.http import parse_etags
+
+from core.db.mongo import field_collection
+
+RENDER_CACHE_SIZE = 256
+RENDER_CACHE_TTL = 60 * 60 * 24
+
+# Bump when the shape of the rendered document changes
+RENDER_REVISION = 1
+
+RENDER_FORM_PROJECTION = {
+    "name": 1,
+    "submit": 1,
+    "expired_at": 1,
+    "is_active": 1,
+    "version": 1,
+}
+
+RENDER_FIELD_PROJECTION = {
+    "name": 1,
+    "label": 1,
+    "type": 1,
+    "required": 1,
+    "allow_null": 1,
+    "allow_blank": 1,
+    "placeholder": 1,
+    "help_text": 1,
+    "min_length": 1,
+    "max_length": 1,
+    "allowed_extensions": 1,
+    "max_size_mb": 1,
+    "options": 1,
+}
+
+
+def render_cache_key(form_id, version) -> str:
+    return f"form-render:{RENDER_REVISION}:{form_id}:{version}"
+
+
+def render_etag(form_id, version) -> str:
+    return f'"{form_id}-{version}-{RENDER_REVISION}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    # If-None-Match uses the weak comparison
+    return "*" in etags or etag in (tag.removeprefix("W/") for tag in etags)
+
+
+def build_form_render(form: dict) -> dict:
+    fields = field_collection().find(
+        {"form_id": ObjectId(form["_id"]), "is_active": True},
+        projection=RENDER_FIELD_PROJECTION,
+        sort=[("rank", 1)],
+    )
+
+    return {
+        "id": str(form["_id"]),
+        "name": form.get("name"),
+        "submit": form.get("submit"),
+        "expired_at": form.get("expired_at"),
+        "is_active": form.get("is_active", True),
+        "version": form.get("version", 0),
+        "fields": [
+            {**field, "id": str(field.pop("_id"))} for field in fields
+        ],
+    }
+
+
+_render_cache: OrderedDict = OrderedDict()
+_render_lock = threading.Lock()
+
+
+def _remember(key: str, document: dict) -> None:
+    with _render_lock:
+        _render_cache[key] = document
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+
+def get_form_render(form: dict) -> dict:
+    """
+    Rendered form document, cached per form version in an in-process LRU in
+    front of Django's cache. Every form/field mutation bumps `version`, so
+    entries never need invalidating; stale ones just age out.
+    """
+    key = render_cache_key(form["_id"], form.get("version", 0))
+
+    with _render_lock:
+        document = _render_cache.get(key)
+        if document is not None:
+            _render_cache.move_to_end(key)
+            return document
+
+    document = cache.get(key)
+    if document is None:
+        document = build_form_render(form)
+        cache.set(key, document, RENDER_CACHE_TTL)
+
+    _remember(key, document)
+    return document
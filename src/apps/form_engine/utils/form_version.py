@@ -0,0 +1,155 @@
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from apps.form_engine.utils.field_validation import (
+    FIELD_SNAPSHOT,
+    fetch_field_snapshot,
+    invalidate_validation_plan,
+    is_snapshot_field,
+    snapshot_entry,
+)
+from apps.form_engine.utils.ranking import schedule_rebalance
+from core.db.mongo import field_collection, forms_collection
+
+SNAPSHOT_MAX_ATTEMPTS = 5
+
+
+def bump_form_version(form_id) -> None:
+    forms_collection().update_one({"_id": ObjectId(form_id)}, {"$inc": {"version": 1}})
+    invalidate_validation_plan(form_id)
+
+
+def _change_field_snapshot(form_id, update: dict, **kwargs) -> None:
+    """
+    Apply `update` to the form's field snapshot and bump its version in one
+    write. Forms that predate the snapshot only get the bump: their submits
+    read the fields collection until `rebuild_field_snapshots` runs.
+    """
+    result = forms_collection().update_one(
+        {"_id": ObjectId(form_id), FIELD_SNAPSHOT: {"$exists": True}},
+        {**update, "$inc": {"version": 1}},
+        **kwargs,
+    )
+    if result.matched_count:
+        invalidate_validation_plan(form_id)
+    else:
+        bump_form_version(form_id)
+
+
+def push_field_snapshot(form_id, field: dict) -> None:
+    """Add a newly inserted field; call once the field itself is visible."""
+    if is_snapshot_field(field):
+        _change_field_snapshot(
+            form_id, {"$push": {FIELD_SNAPSHOT: snapshot_entry(field)}}
+        )
+    else:
+        bump_form_version(form_id)
+
+
+def pull_field_snapshot(form_id, field_id) -> None:
+    _change_field_snapshot(
+        form_id, {"$pull": {FIELD_SNAPSHOT: {"id": ObjectId(field_id)}}}
+    )
+
+
+def update_field_snapshot(previous: dict, field: dict) -> None:
+    """
+    Reflect an update of `previous` to `field` in the snapshot: replace the
+    entry in place, or add or drop it when the field's active flag flipped.
+    """
+    if not is_snapshot_field(field):
+        pull_field_snapshot(field["form_id"], field["_id"])
+    elif not is_snapshot_field(previous):
+        push_field_snapshot(field["form_id"], field)
+    else:
+        _change_field_snapshot(
+            field["form_id"],
+            {"$set": {f"{FIELD_SNAPSHOT}.$[entry]": snapshot_entry(field)}},
+            array_filters=[{"entry.id": field["_id"]}],
+        )
+
+
+def refresh_field_snapshot(form_id) -> None:
+    """
+    Rebuild the form's embedded active-field snapshot from the fields
+    collection and bump its version in one write. Meant for backfills; request
+    paths apply their single-field change instead. The write only applies if
+    the version is unchanged since before the fields were read, so a
+    concurrent mutation forces a rebuild rather than letting an older list win.
+    """
+    form_id = ObjectId(form_id)
+
+    for _ in range(SNAPSHOT_MAX_ATTEMPTS):
+        form = forms_collection().find_one({"_id": form_id}, projection={"version": 1})
+        if form is None:
+            return
+
+        snapshot = fetch_field_snapshot(form_id)
+        # A null match also covers forms that predate `version`
+        result = forms_collection().update_one(
+            {"_id": form_id, "version": form.get("version")},
+            {"$set": {FIELD_SNAPSHOT: snapshot}, "$inc": {"version": 1}},
+        )
+        if result.matched_count:
+            break
+    else:
+        # Persistent contention: settle for the freshest read we can make
+        forms_collection().update_one(
+            {"_id": form_id},
+            {
+                "$set": {FIELD_SNAPSHOT: fetch_field_snapshot(form_id)},
+                "$inc": {"version": 1},
+            },
+        )
+
+    invalidate_validation_plan(form_id)
+
+
+def _last_field_order(form_id) -> int:
+    last_field = field_collection().find_one(
+        {"form_id": ObjectId(form_id)},
+        projection={"order": 1},
+        sort=[("order", -1)],
+    )
+    return (last_field or {}).get("order") or 0
+
+
+def _increment_field_seq(query: dict):
+    form = forms_collection().find_one_and_update(
+        {**query, "field_seq": {"$exists": True}},
+        {"$inc": {"field_seq": 1}},
+        projection={"field_seq": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    return form and form["field_seq"]
+
+
+def allocate_field_seq(query: dict):
+    """
+    Atomically take the next per-form field sequence number from the form
+    matching `query`. Returns None when no form matches.
+    """
+    seq = _increment_field_seq(query)
+    if seq is not None:
+        return seq
+
+    # No match, or the form predates the counter. Seed it past the orders
+    # already handed out (only one seed can apply) before incrementing, so
+    # concurrent creates never start from an unseeded counter.
+    form = forms_collection().find_one(
+        {**query, "field_seq": {"$exists": False}}, projection={"_id": 1}
+    )
+    if form is not None and backfill_field_seq(form["_id"]):
+        # Its older ranks may sit above the sequence ranks; respace them
+        # off the request path.
+        schedule_rebalance(form["_id"])
+
+    return _increment_field_seq(query)
+
+
+def backfill_field_seq(form_id) -> bool:
+    result = forms_collection().update_one(
+        {"_id": ObjectId(form_id), "field_seq": {"$exists": False}},
+        {"$set": {"field_seq": _last_field_order(form_id)}},
+    )
+    return bool(result.modified_count)
@@ -0,0 +1,212 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from pymongo.errors import BulkWriteError, PyMongoError
+
+from apps.form_engine.utils.rollups import record_submission_documents
+from core.db.mongo import submissions_collection
+
+logger = logging.getLogger(__name__)
+
+INGEST_SYNC = "sync"
+INGEST_BUFFERED = "buffered"
+
+DEFAULT_BUFFER_SETTINGS = {
+    "MAX_SIZE": 10000,
+    "FLUSH_SIZE": 500,
+    "FLUSH_INTERVAL": 1.0,
+    "PUT_TIMEOUT": 0.5,
+    "FLUSH_RETRIES": 3,
+}
+
+
+class SubmissionBuffer:
+    """
+    Bounded in-process queue of validated submission documents, drained by a
+    background thread with insert_many once FLUSH_SIZE documents are queued or
+    FLUSH_INTERVAL seconds have passed.
+    """
+
+    def __init__(
+        self,
+        max_size,
+        flush_size,
+        flush_interval,
+        put_timeout,
+        flush_retries,
+    ):
+        self.max_size = max_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.flush_retries = flush_retries
+
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+        self._thread = None
+        self._exit_hook = False
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "enqueued": 0,
+            "rejected": 0,
+            "flushed": 0,
+            "failed": 0,
+            "flushes": 0,
+            "last_flush_ms": None,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def start(self) -> None:
+        # Started lazily so the thread is created after the server forks workers.
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="submission-buffer-flusher", daemon=True
+            )
+            self._thread.start()
+            if not self._exit_hook:
+                atexit.register(self.shutdown)
+                self._exit_hook = True
+
+    def put(self, document: dict, block=True) -> bool:
+        """
+        Queue a document. Returns False when the buffer is still full after
+        PUT_TIMEOUT, and the caller should write the document itself.
+        """
+        self.start()
+        try:
+            self._queue.put(document, block=block, timeout=self.put_timeout)
+        except queue.Full:
+            self._increment("rejected")
+            return False
+
+        self._increment("enqueued")
+        return True
+
+    def shutdown(self, timeout=30) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # Anything queued after the flusher stopped
+        self._flush(self._drain(self.max_size))
+
+    def metrics(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        flushes = stats.pop("flushes")
+        total_flush_ms = stats.pop("total_flush_ms")
+        return {
+            **stats,
+            "flushes": flushes,
+            "avg_flush_ms": total_flush_ms / flushes if flushes else None,
+            "depth": self._queue.qsize(),
+            "capacity": self.max_size,
+            "running": self._thread is not None and self._thread.is_alive(),
+        }
+
+    def _increment(self, key, value=1) -> None:
+        with self._stats_lock:
+            self._stats[key] += value
+
+    def _drain(self, limit) -> list:
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.flush_size and not self._stop.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+                batch.extend(self._drain(self.flush_size - len(batch)))
+
+            self._flush(batch)
+
+    def _flush(self, batch) -> None:
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        written = self._write(batch)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._stats_lock:
+            self._stats["flushes"] += 1
+            self._stats["flushed"] += len(written)
+            self._stats["failed"] += len(batch) - len(written)
+            self._stats["last_flush_ms"] = elapsed_ms
+            self._stats["max_flush_ms"] = max(self._stats["max_flush_ms"], elapsed_ms)
+            self._stats["total_flush_ms"] += elapsed_ms
+
+        if written:
+            record_submission_documents(written)
+
+    def _write(self, batch) -> list:
+        for attempt in range(1, self.flush_retries + 1):
+            try:
+                submissions_collection().insert_many(batch, ordered=False)
+                return batch
+            except BulkWriteError as e:
+                failed = {
+                    error["index"]
+                    for error in e.details.get("writeErrors", [])
+                    # Duplicate _id: an earlier attempt already wrote it
+                    if error.get("code") != 11000
+                }
+                if failed:
+                    logger.error("Dropped %s buffered submissions", len(failed))
+                return [doc for idx, doc in enumerate(batch) if idx not in failed]
+            except PyMongoError:
+                logger.exception(
+                    "Buffered submission flush failed (attempt %s)", attempt
+                )
+                time.sleep(min(2 ** attempt * 0.1, 2))
+
+        logger.error("Dropped %s buffered submissions", len(batch))
+        return []
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_submission_buffer() -> SubmissionBuffer:
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                options = {
+                    **DEFAULT_BUFFER_SETTINGS,
+                    **getattr(settings, "SUBMISSION_BUFFER", {}),
+                }
+                _buffer = SubmissionBuffer(
+                    max_size=options["MAX_SIZE"],
+                    flush_size=options["FLUSH_SIZE"],
+                    flush_interval=options["FLUSH_INTERVAL"],
+                    put_timeout=options["PUT_TIMEOUT"],
+                    flush_retries=options["FLUSH_RETRIES"],
+                )
+    return _buffer
@@ -0,0 +1,192 @@
+import threading
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from core.db.mongo import field_collection, forms_collection
+
+# Field display order is a lexicographic base-62 rank: moving a field only
+# rewrites that field's rank to a key between its new neighbours.
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+
+# Ranks longer than this mean a region has been split too often. Sequence
+# ranks are already 8 characters, so this leaves two splits between
+# appended fields before a rebalance is scheduled.
+RANK_MAX_LENGTH = 10
+
+# Appends take "z" + base-62 sequence; every other rank sorts below "z"
+SEQUENCE_PREFIX = DIGITS[-1]
+SEQUENCE_WIDTH = 6
+
+REBALANCE_ATTEMPTS = 5
+
+# Forms with a rebalance thread running in this process
+_rebalancing = set()
+_rebalancing_lock = threading.Lock()
+
+
+def _midpoint(a: str, b):
+    # a < b; neither ends with the smallest digit ("0"); b=None is unbounded
+    if b is not None:
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else "0") == b[n]:
+            n += 1
+        if n:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b is not None else BASE
+
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def rank_between(before=None, after=None) -> str:
+    """Return a rank sorting after `before` and before `after`."""
+    before = before or ""
+    if after is not None and before >= after:
+        raise ValueError(f"Invalid rank range: {before!r} >= {after!r}")
+    return _midpoint(before, after)
+
+
+def _encode(value: int, width: int) -> str:
+    digits = []
+    for _ in range(width):
+        value, remainder = divmod(value, BASE)
+        digits.append(DIGITS[remainder])
+    return "".join(reversed(digits))
+
+
+def initial_ranks(count: int) -> list:
+    # Spread evenly below SEQUENCE_PREFIX so sequence ranks always sort last
+    width = 1
+    while (BASE - 1) * BASE ** (width - 1) <= count:
+        width += 1
+
+    step = (BASE - 1) * BASE ** (width - 1) // (count + 1)
+    return [_encode(idx * step, width).rstrip("0") for idx in range(1, count + 1)]
+
+
+def sequence_rank(seq: int) -> str:
+    """
+    Rank for a field appended at the end of a form, derived from the form's
+    atomic field sequence instead of a read of the current last rank. Fixed
+    width keeps them ordered by seq; the "V" suffix keeps them from ending in
+    the smallest digit, so ranks can still be found between them.
+    """
+    return SEQUENCE_PREFIX + _encode(seq, SEQUENCE_WIDTH) + "V"
+
+
+def is_dense(rank) -> bool:
+    return rank is not None and len(rank) > RANK_MAX_LENGTH
+
+
+def adjacent_rank(form_id, rank, direction, exclude_id=None):
+    """
+    Rank of the field right after (direction=1) or before (direction=-1)
+    `rank` in the form, or None at either end.
+    """
+    query = {
+        "form_id": ObjectId(form_id),
+        "rank": {"$gt" if direction > 0 else "$lt": rank},
+    }
+    if exclude_id is not None:
+        query["_id"] = {"$ne": exclude_id}
+
+    field = field_collection().find_one(
+        query, projection={"rank": 1}, sort=[("rank", direction)]
+    )
+    return field["rank"] if field else None
+
+
+def rebalance_form_ranks(form_id, by_order=False) -> int:
+    """
+    Respace the form's ranks evenly. Each write only applies if the field
+    still has the rank that was read, so a move landing mid-rebalance is not
+    overwritten; the pass is re-run until nothing conflicts.
+    """
+    form_id = ObjectId(form_id)
+    updated = 0
+
+    # Ranks this rebalance wrote, mapped to the sort key of the rank they
+    # replaced, so a re-run orders rewritten and untouched fields on the
+    # same scale.
+    replaced = {}
+
+    def sort_key(field):
+        rank = field.get("rank")
+        return replaced.get((field["_id"], rank), rank or "")
+
+    for _ in range(REBALANCE_ATTEMPTS):
+        fields = list(
+            field_collection().find(
+                {"form_id": form_id},
+                projection={"rank": 1, "order": 1},
+            )
+        )
+
+        if by_order:
+            fields.sort(key=lambda f: (f.get("order") or 0, sort_key(f)))
+        else:
+            # Unranked (legacy) fields keep their relative `order` ahead
+            fields.sort(key=lambda f: (sort_key(f), f.get("order") or 0))
+
+        operations = []
+        for field, rank in zip(fields, initial_ranks(len(fields))):
+            if field.get("rank") == rank:
+                continue
+            # A null match also covers fields that never had a rank
+            operations.append(
+                UpdateOne(
+                    {"_id": field["_id"], "rank": field.get("rank")},
+                    {"$set": {"rank": rank}},
+                )
+            )
+            replaced[(field["_id"], rank)] = sort_key(field)
+
+        if not operations:
+            break
+
+        result = field_collection().bulk_write(operations, ordered=False)
+        updated += result.modified_count
+        if result.matched_count == len(operations):
+            break
+
+    if updated:
+        forms_collection().update_one({"_id": form_id}, {"$inc": {"version": 1}})
+    return updated
+
+
+def _run_scheduled_rebalance(form_id) -> None:
+    try:
+        rebalance_form_ranks(form_id)
+    finally:
+        with _rebalancing_lock:
+            _rebalancing.discard(form_id)
+
+
+def schedule_rebalance(form_id) -> None:
+    # Every move into a dense region asks for a rebalance; one running pass
+    # per form is enough, since it re-reads the ranks until nothing conflicts.
+    form_id = str(form_id)
+    with _rebalancing_lock:
+        if form_id in _rebalancing:
+            return
+        _rebalancing.add(form_id)
+
+    try:
+        threading.Thread(
+            target=_run_scheduled_rebalance,
+            args=(form_id,),
+            name=f"rank-rebalance-{form_id}",
+            daemon=True,
+        ).start()
+    except RuntimeError:
+        with _rebalancing_lock:
+            _rebalancing.discard(form_id)
+        raise
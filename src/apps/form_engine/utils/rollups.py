@@ -0,0 +1,176 @@
+import logging
+from collections import Counter
+
+from bson import ObjectId
+from django.utils import timezone
+from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
+
+from core.db.mongo import (
+    async_rollups_collection,
+    rollups_collection,
+    submissions_collection,
+)
+
+# Rollup documents are {form_id, day: "YYYY-MM-DD", count}; the per-form total
+# lives in the same collection under day=None.
+TOTAL_DAY = None
+
+logger = logging.getLogger(__name__)
+
+
+# The submission is already stored when its rollups are written. A failed
+# rollup write is logged rather than failing the request; rebuild_rollups
+# recounts the drift.
+def _write_rollups(operations) -> None:
+    if not operations:
+        return
+    try:
+        rollups_collection().bulk_write(operations, ordered=False)
+    except PyMongoError:
+        logger.exception("Failed to update submission rollups")
+
+
+def _increment(form_id, day, count) -> UpdateOne:
+    return UpdateOne(
+        {"form_id": form_id, "day": day}, {"$inc": {"count": count}}, upsert=True
+    )
+
+
+def _rollup_operations(form_id, submitted_at, count) -> list:
+    form_id = ObjectId(form_id)
+    return [
+        _increment(form_id, submitted_at.strftime("%Y-%m-%d"), count),
+        _increment(form_id, TOTAL_DAY, count),
+    ]
+
+
+def record_submission_documents(documents) -> None:
+    counts = Counter(
+        (doc["form_id"], doc["submitted_at"].strftime("%Y-%m-%d"))
+        for doc in documents
+    )
+    totals = Counter()
+    for (form_id, _), count in counts.items():
+        totals[form_id] += count
+
+    operations = [
+        _increment(form_id, day, count) for (form_id, day), count in counts.items()
+    ]
+    operations.extend(
+        _increment(form_id, TOTAL_DAY, count) for form_id, count in totals.items()
+    )
+
+    _write_rollups(operations)
+
+
+def record_submissions(form_id, submitted_at, count=1) -> None:
+    _write_rollups(_rollup_operations(form_id, submitted_at, count))
+
+
+async def arecord_submissions(form_id, submitted_at, count=1) -> None:
+    try:
+        await async_rollups_collection().bulk_write(
+            _rollup_operations(form_id, submitted_at, count), ordered=False
+        )
+    except PyMongoError:
+        logger.exception("Failed to update submission rollups")
+
+
+def get_submission_stats(form_id, start_day=None, end_day=None) -> dict:
+    day_filter = {"$ne": TOTAL_DAY}
+    if start_day:
+        day_filter["$gte"] = start_day
+    if end_day:
+        day_filter["$lte"] = end_day
+
+    rows = list(
+        rollups_collection()
+        .find({"form_id": ObjectId(form_id), "day": day_filter}, {"_id": 0})
+        .sort("day", 1)
+    )
+    total = rollups_collection().find_one(
+        {"form_id": ObjectId(form_id), "day": TOTAL_DAY}, {"count": 1}
+    )
+
+    return {
+        "total": total["count"] if total else 0,
+        "series": [{"day": row["day"], "count": row["count"]} for row in rows],
+    }
+
+
+def _count_submissions(match) -> dict:
+    pipeline = [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": {
+                    "form_id": "$form_id",
+                    "day": {
+                        "$dateToString": {"format": "%Y-%m-%d", "date": "$submitted_at"}
+                    },
+                },
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+
+    counts = Counter()
+    for row in submissions_collection().aggregate(pipeline, allowDiskUse=True):
+        form_id = row["_id"]["form_id"]
+        counts[(form_id, row["_id"]["day"])] = row["count"]
+        counts[(form_id, TOTAL_DAY)] += row["count"]
+    return counts
+
+
+def rebuild_rollups(form_ids=None, batch_size=1000) -> int:
+    """
+    Recount rollups from the submissions while submits keep running.
+
+    Submissions up to a cutoff `_id` are counted first, which is the slow
+    part. The few that arrived since are counted right before the rollups are
+    read, and each rollup is corrected by a `$inc` of the difference. Live
+    increments that land during the rebuild are therefore never overwritten,
+    as a `$set` would. Rollups that end at zero are deleted unless a live
+    increment has reached them in the meantime.
+    """
+    match = {}
+    if form_ids:
+        match["form_id"] = {"$in": [ObjectId(form_id) for form_id in form_ids]}
+
+    cutoff = ObjectId.from_datetime(timezone.now())
+    counts = _count_submissions({**match, "_id": {"$lt": cutoff}})
+    counts.update(_count_submissions({**match, "_id": {"$gte": cutoff}}))
+
+    existing = {
+        (doc["form_id"], doc.get("day")): doc
+        for doc in rollups_collection().find(
+            match, {"form_id": 1, "day": 1, "count": 1}
+        )
+    }
+
+    operations = []
+    for key in counts.keys() | existing.keys():
+        current = existing[key]["count"] if key in existing else 0
+        delta = counts[key] - current
+        if delta:
+            # Never recreate a rollup that was removed in the meantime
+            operations.append(
+                UpdateOne(
+                    {"form_id": key[0], "day": key[1]},
+                    {"$inc": {"count": delta}},
+                    upsert=delta > 0,
+                )
+            )
+    for start in range(0, len(operations), batch_size):
+        rollups_collection().bulk_write(
+            operations[start:start + batch_size], ordered=False
+        )
+
+    stale_ids = [doc["_id"] for key, doc in existing.items() if not counts[key]]
+    for start in range(0, len(stale_ids), batch_size):
+        rollups_collection().delete_many(
+            {"_id": {"$in": stale_ids[start:start + batch_size]}, "count": 0}
+        )
+
+    return len(counts)
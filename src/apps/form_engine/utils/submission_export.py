@@ -0,0 +1,92 @@
+import csv
+import json
+
+EXPORT_BATCH_SIZE = 2000
+CSV_BASE_COLUMNS = ["id", "submitted_by", "submitted_at"]
+
+# Spreadsheets evaluate cells starting with these as formulas
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+class Echo:
+    """File-like object whose write() hands the row back to the csv writer."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_cell(value):
+    # Quote submitted text that a spreadsheet would run as a formula
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return _csv_cell(";".join(str(item) for item in value))
+    if isinstance(value, dict):
+        return json.dumps(value, default=str)
+    return _csv_cell(value)
+
+
+def _csv_header(field_names) -> list:
+    # Field columns that clash with a base column are namespaced
+    return CSV_BASE_COLUMNS + [
+        _csv_cell(f"values.{name}" if name in CSV_BASE_COLUMNS else name)
+        for name in field_names
+    ]
+
+
+def _csv_row(writer, doc, field_names):
+    values = doc.get("values", {})
+    return writer.writerow(
+        [
+            str(doc["_id"]),
+            _csv_cell(doc.get("submitted_by")),
+            doc["submitted_at"].isoformat() if doc.get("submitted_at") else "",
+            *(_csv_value(values.get(name)) for name in field_names),
+        ]
+    )
+
+
+def _ndjson_line(doc):
+    return json.dumps(
+        {
+            "id": str(doc["_id"]),
+            "submitted_by": doc.get("submitted_by"),
+            "submitted_at": doc.get("submitted_at"),
+            "values": doc.get("values", {}),
+        },
+        default=str,
+    ) + "\n"
+
+
+def stream_csv(cursor, field_names):
+    writer = csv.writer(Echo())
+    yield writer.writerow(_csv_header(field_names))
+
+    for doc in cursor:
+        yield _csv_row(writer, doc, field_names)
+
+
+def stream_ndjson(cursor):
+    for doc in cursor:
+        yield _ndjson_line(doc)
+
+
+# Async variants over an async cursor. Under ASGI Django drains a sync
+# iterator into memory before sending anything, so exports use these there.
+async def astream_csv(cursor, field_names):
+    writer = csv.writer(Echo())
+    yield writer.writerow(_csv_header(field_names))
+
+    async for doc in cursor:
+        yield _csv_row(writer, doc, field_names)
+
+
+async def astream_ndjson(cursor):
+    async for doc in cursor:
+        yield _ndjson_line(doc)
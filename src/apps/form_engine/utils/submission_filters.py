@@ -0,0 +1,22 @@
+from datetime import datetime, time
+
+from django.utils.dateparse import parse_date
+
+
+def submission_date_filter(request) -> dict:
+    start_date = request.query_params.get("start_date")
+    end_date = request.query_params.get("end_date")
+
+    date_filter = {}
+
+    if start_date:
+        start = parse_date(start_date)
+        if start:
+            date_filter["$gte"] = datetime.combine(start, time.min)
+
+    if end_date:
+        end = parse_date(end_date)
+        if end:
+            date_filter["$lte"] = datetime.combine(end, time.max)
+
+    return date_filter
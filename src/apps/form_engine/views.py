@@ -1,17 +1,79 @@
 from bson import ObjectId
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.utils import timezone
-from datetime import datetime, time
 from django.utils.dateparse import parse_date
 from rest_framework import status, generics, views
 from rest_framework.response import Response
 from pymongo import ReturnDocument, UpdateOne
-
-from apps.form_engine.utils.field_validation import validate_field_value
-
-from .serializer import DynamicFormSerializer, FormFieldSerializer, FormSubmissionSerializer, UpdateFieldOrderSerializer
-from core.db.mongo import forms_collection, field_collection, submissions_collection
+from pymongo.errors import BulkWriteError
+
+from apps.form_engine.utils.access import (
+    FORM_RESPONSE_PROJECTION,
+    assigned_forms_query,
+)
+from apps.form_engine.utils.analytics import DATE_BUCKETS, get_form_analytics
+from apps.form_engine.utils.field_validation import (
+    SUBMISSION_FORM_PROJECTION,
+    get_validation_plan,
+)
+from apps.form_engine.utils.form_version import (
+    allocate_field_seq,
+    bump_form_version,
+    pull_field_snapshot,
+    push_field_snapshot,
+    update_field_snapshot,
+)
+from apps.form_engine.utils.ranking import (
+    adjacent_rank,
+    is_dense,
+    rank_between,
+    rebalance_form_ranks,
+    schedule_rebalance,
+    sequence_rank,
+)
+from apps.form_engine.utils.form_deletion import (
+    NOT_DELETING,
+    deleting_form_ids,
+    format_deletion_job,
+    request_form_deletion,
+    schedule_form_deletion,
+)
+from apps.form_engine.utils.form_render import (
+    RENDER_FORM_PROJECTION,
+    etag_matches,
+    get_form_render,
+    render_etag,
+)
+from apps.form_engine.utils.ingest import INGEST_BUFFERED, get_submission_buffer
+from apps.form_engine.utils.rollups import get_submission_stats, record_submissions
+from apps.form_engine.utils.submission_filters import submission_date_filter
+from apps.form_engine.utils.submission_export import (
+    EXPORT_BATCH_SIZE,
+    astream_csv,
+    astream_ndjson,
+    stream_csv,
+    stream_ndjson,
+)
+from apps.users.permissions import IsStaffUser
+
+from .serializer import (
+    DynamicFormSerializer,
+    FormFieldSerializer,
+    FormSubmissionBatchSerializer,
+    FormSubmissionSerializer,
+    MoveFieldSerializer,
+    UpdateFieldOrderSerializer,
+)
+from core.db.mongo import (
+    async_submissions_collection,
+    deletions_collection,
+    field_collection,
+    forms_collection,
+    submissions_collection,
+)
+from core.db.monitoring import get_mongo_metrics
 from core.utils.pagination import MongoPageNumberPagination
-from apps.form_engine.models import FormMaster
 
 
 class FormCreateView(views.APIView):
@@ -27,14 +89,18 @@ class FormCreateView(views.APIView):
         serializer.is_valid(raise_exception=True)
         form = serializer.save()
         return Response(
-            {"message": "Form created successfully", "form_id": form.get("form_id")},
+            {
+                "message": "Form created successfully",
+                "form_id": form.get("form_id"),
+                "field_ids": form.get("field_ids", []),
+            },
             status=status.HTTP_201_CREATED,
         )
 
 
 class FormUpdateView(views.APIView):
     def patch(self, request, form_id=None, *args, **kwargs):
-        form = forms_collection().find_one({"_id": ObjectId(form_id)})
+        form = forms_collection().find_one({"_id": ObjectId(form_id), **NOT_DELETING})
 
         if not form:
             return Response(
@@ -49,7 +115,8 @@ class FormUpdateView(views.APIView):
 
         updated_form = forms_collection().find_one_and_update(
             {"_id": ObjectId(form_id)},
-            {"$set": update_data},
+            {"$set": update_data, "$inc": {"version": 1}},
+            projection=FORM_RESPONSE_PROJECTION,
             return_document=ReturnDocument.AFTER,
         )
 
@@ -68,7 +135,8 @@ class FormDestroyView(views.APIView):
         auth_user = request.user
 
         form = forms_collection().find_one(
-            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk)}
+            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk)},
+            projection={"_id": 1},
         )
 
         if not form:
@@ -76,17 +144,35 @@ class FormDestroyView(views.APIView):
                 {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        field_collection().delete_many({"form_id": ObjectId(form_id)})
-
-        forms_collection().delete_one({"_id": ObjectId(form_id)})
+        # Hide the form now; its submissions, fields, rollups and assignments
+        # are removed in throttled batches in the background.
+        job = request_form_deletion(form["_id"], str(auth_user.pk))
+        schedule_form_deletion(form["_id"])
 
         return Response(
             {
-                "message": "Form deleted successfully",
+                "message": "Form deletion started",
+                "deletion": format_deletion_job(job),
             },
-            status=status.HTTP_200_OK,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class FormDeletionStatusView(views.APIView):
+    def get(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        job = deletions_collection().find_one(
+            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk)}
         )
 
+        if not job:
+            return Response(
+                {"detail": "Deletion not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(format_deletion_job(job))
+
 
 class FormListView(views.APIView):
     def get(self, request, *args, **kwargs):
@@ -97,26 +183,14 @@ class FormListView(views.APIView):
         if auth_user.is_staff:
             query = {"created_by": str(auth_user.pk)}
         else:
-            form_ids = list(
-                FormMaster.objects.filter(user=auth_user)
-                .values_list("form_id", flat=True)
-            )
-
-            if not form_ids:
-                return Response(
-                    paginator.get_paginated_response([], 0, 0)
-                )
-            
-            query = {
-                "_id": {
-                    "$in": [ObjectId(fid) for fid in form_ids]
-                }
-            }
+            # Indexed on assigned_users; no assignments is just an empty page
+            query = assigned_forms_query(auth_user)
 
         results, count, total_page = paginator.paginate(
             collection=forms_collection(),
-            query=query,
+            query={**query, **NOT_DELETING},
             sort=("created_at", -1),
+            projection=FORM_RESPONSE_PROJECTION,
         )
 
         for doc in results:
@@ -130,41 +204,43 @@ class FieldCreateView(views.APIView):
     def post(self, request, form_id=None, *args, **kwargs):
         auth_user = request.user
 
-        form = forms_collection().find_one(
-            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk)}
+        serializer = FormFieldSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # One write checks ownership and takes the next order, so concurrent
+        # creates can never share an order.
+        seq = allocate_field_seq(
+            {
+                "_id": ObjectId(form_id),
+                "created_by": str(auth_user.pk),
+                **NOT_DELETING,
+            }
         )
 
-        if not form:
+        if seq is None:
             return Response(
                 {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
             )
 
-        serializer = FormFieldSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
         current_datetime = timezone.now()
         validated_data: dict = serializer.validated_data
 
-        last_field = field_collection().find_one(
-            {"form_id": ObjectId(form_id)},
-            sort=[("order", -1)],
-            projection={"order": 1}
-        )
-
-        next_order = (last_field.get("order", 0) + 1) if last_field else 1
-
-        result = field_collection().insert_one(
-            {
-                **validated_data,
-                "form_id": ObjectId(form_id),
-                "created_by": str(auth_user.pk),
-                "created_at": current_datetime,
-                "updated_at": current_datetime,
-                "order": next_order
-            }
-        )
+        field = {
+            **validated_data,
+            "_id": ObjectId(),
+            "form_id": ObjectId(form_id),
+            "created_by": str(auth_user.pk),
+            "created_at": current_datetime,
+            "updated_at": current_datetime,
+            "order": seq,
+            "rank": sequence_rank(seq),
+        }
+        field_collection().insert_one(field)
+
+        # Push only once the field is visible, or a render cached for the
+        # new version could miss it.
+        push_field_snapshot(form_id, field)
 
-        field = field_collection().find_one({"_id": result.inserted_id})
         field["id"] = str(field.pop("_id"))
         field["form_id"] = str(field.pop("form_id"))
 
@@ -174,6 +250,43 @@ class FieldCreateView(views.APIView):
         )
 
 
+class FormRenderView(views.APIView):
+    def get(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        if auth_user.is_staff:
+            query = {"_id": ObjectId(form_id), "created_by": str(auth_user.pk)}
+        else:
+            # Checked against the assignment mirror in the same read, so a
+            # revocation applies on every worker at once.
+            query = {
+                "_id": ObjectId(form_id),
+                "is_active": True,
+                **assigned_forms_query(auth_user),
+            }
+
+        form = forms_collection().find_one(
+            {**query, **NOT_DELETING}, projection=RENDER_FORM_PROJECTION
+        )
+
+        if not form:
+            return Response(
+                {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        etag = render_etag(form_id, form.get("version", 0))
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Authorization",
+        }
+
+        if etag_matches(etag, request.headers.get("If-None-Match")):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(get_form_render(form), headers=headers)
+
+
 class FormFieldListView(views.APIView):
     def get(self, request, form_id=None, *args, **kwargs):
         paginator = MongoPageNumberPagination(request)
@@ -182,7 +295,7 @@ class FormFieldListView(views.APIView):
         results, count, total_page = paginator.paginate(
             collection=field_collection(),
             query=query,
-            sort=("created_at", -1),
+            sort=("rank", 1),
         )
 
         for doc in results:
@@ -213,6 +326,8 @@ class FormFieldUpdateView(views.APIView):
             return_document=ReturnDocument.AFTER,
         )
 
+        update_field_snapshot(field, updated_field)
+
         updated_field["id"] = str(updated_field.pop("_id"))
         updated_field["form_id"] = str(updated_field.get("form_id"))
 
@@ -238,6 +353,7 @@ class FieldDestroyView(views.APIView):
             )
 
         field_collection().delete_one({"_id": ObjectId(field_id)})
+        pull_field_snapshot(field["form_id"], field["_id"])
 
         return Response(
             {
@@ -278,6 +394,15 @@ class UpdateFieldIndexView(views.APIView):
         if operations:
             result = field_collection().bulk_write(operations)
 
+            # Display order lives in `rank`; re-derive it from the new orders.
+            # The rebalance bumps the version of any form whose ranks moved.
+            form_ids = field_collection().distinct(
+                "form_id",
+                {"_id": {"$in": [ObjectId(item["id"]) for item in fields]}},
+            )
+            for form_id in form_ids:
+                rebalance_form_ranks(form_id, by_order=True)
+
             return Response(
                 {
                     "message": "Field order updated successfully",
@@ -292,14 +417,109 @@ class UpdateFieldIndexView(views.APIView):
         )
 
 
+class FieldMoveView(views.APIView):
+    def post(self, request, field_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        serializer = MoveFieldSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        after_id = serializer.validated_data.get("after")
+        before_id = serializer.validated_data.get("before")
+
+        field = field_collection().find_one(
+            {"_id": ObjectId(field_id), "created_by": str(auth_user.pk)},
+            projection={"form_id": 1, "rank": 1},
+        )
+
+        if not field:
+            return Response(
+                {"detail": "Field not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        if field_id in (after_id, before_id):
+            return Response(
+                {"detail": "A field cannot be moved relative to itself"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        neighbour_ids = [ObjectId(fid) for fid in (after_id, before_id) if fid]
+        neighbours = {
+            str(doc["_id"]): doc
+            for doc in field_collection().find(
+                {"_id": {"$in": neighbour_ids}, "form_id": field["form_id"]},
+                projection={"rank": 1},
+            )
+        }
+
+        if len(neighbours) != len(neighbour_ids):
+            return Response(
+                {"detail": "Neighbour field not found in this form"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        lower = neighbours[after_id].get("rank") if after_id else None
+        upper = neighbours[before_id].get("rank") if before_id else None
+
+        if (after_id and lower is None) or (before_id and upper is None):
+            return Response(
+                {"detail": "Field ranks are not initialised for this form"},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        # With one side given, the other is whichever field sits right next
+        # to it now (not counting the field being moved).
+        if after_id and not before_id:
+            upper = adjacent_rank(field["form_id"], lower, 1, field["_id"])
+        elif before_id and not after_id:
+            lower = adjacent_rank(field["form_id"], upper, -1, field["_id"])
+
+        if upper is None:
+            # The tail belongs to sequence ranks so later appends stay last
+            seq = allocate_field_seq({"_id": field["form_id"]})
+            rank = sequence_rank(seq)
+            if lower is not None and rank <= lower:
+                return Response(
+                    {"detail": "Field ranks are not initialised for this form"},
+                    status=status.HTTP_409_CONFLICT,
+                )
+        else:
+            try:
+                rank = rank_between(lower, upper)
+            except ValueError:
+                return Response(
+                    {"detail": "`after` must come before `before`"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        field_collection().update_one(
+            {"_id": field["_id"]},
+            {"$set": {"rank": rank, "updated_at": timezone.now()}},
+        )
+        # Only the display order changed; the snapshot is not ordered
+        bump_form_version(field["form_id"])
+
+        if is_dense(rank):
+            schedule_rebalance(field["form_id"])
+
+        return Response(
+            {
+                "message": "Field moved successfully",
+                "id": field_id,
+                "rank": rank,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class FormSubmissionView(views.APIView):
     def post(self, request, form_id=None, *args, **kwargs):
         auth_user = request.user
 
-        form = forms_collection().find_one({
-            "_id": ObjectId(form_id),
-            "is_active": True
-        })
+        form = forms_collection().find_one(
+            {"_id": ObjectId(form_id), "is_active": True, **NOT_DELETING},
+            projection=SUBMISSION_FORM_PROJECTION,
+        )
 
         if not form:
             return Response(
@@ -312,30 +532,8 @@ class FormSubmissionView(views.APIView):
 
         submitted_values = serializer.validated_data["values"]
 
-        fields = list(
-            field_collection().find({
-                "form_id": ObjectId(form_id),
-                "is_active": True
-            })
-        )
-
-        errors = {}
-        cleaned_values = {}
-
-        for field in fields:
-            name = field["name"]
-            value = submitted_values.get(name)
-
-            try:
-                validate_field_value(field, value)
-                if value is not None:
-                    cleaned_values[name] = value
-            except ValueError as e:
-                errors[name] = str(e)
-
-        for field in fields:
-            if field.get("required") and field["name"] not in cleaned_values:
-                errors[field["name"]] = "This field is required"
+        plan = get_validation_plan(form)
+        cleaned_values, errors = plan.validate(submitted_values)
 
         if errors:
             return Response(
@@ -343,23 +541,122 @@ class FormSubmissionView(views.APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        result = submissions_collection().insert_one({
+        current_datetime = timezone.now()
+
+        document = {
+            "_id": ObjectId(),
             "form_id": ObjectId(form_id),
             "submitted_by": str(auth_user.pk),
             "values": cleaned_values,
-            "submitted_at": timezone.now(),
-            "updated_at": timezone.now(),
-        })
+            "schema_version": plan.version,
+            "submitted_at": current_datetime,
+            "updated_at": current_datetime,
+        }
+
+        if (
+            form.get("ingest_mode") == INGEST_BUFFERED
+            and get_submission_buffer().put(document)
+        ):
+            return Response(
+                {
+                    "message": "Form submission accepted",
+                    "submission_id": str(document["_id"]),
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        submissions_collection().insert_one(document)
+        record_submissions(form_id, current_datetime)
 
         return Response(
             {
                 "message": "Form submitted successfully",
-                "submission_id": str(result.inserted_id),
+                "submission_id": str(document["_id"]),
             },
             status=status.HTTP_201_CREATED,
         )
     
 
+class FormSubmissionBatchView(views.APIView):
+    def post(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        form = forms_collection().find_one(
+            {"_id": ObjectId(form_id), "is_active": True, **NOT_DELETING},
+            projection=SUBMISSION_FORM_PROJECTION,
+        )
+
+        if not form:
+            return Response(
+                {"detail": "Form not found or inactive"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        serializer = FormSubmissionBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        plan = get_validation_plan(form)
+        current_datetime = timezone.now()
+
+        documents = []
+        indexes = []
+        errors = []
+
+        for idx, item in enumerate(serializer.validated_data["submissions"]):
+            cleaned_values, item_errors = plan.validate(item["values"])
+
+            if item_errors:
+                errors.append({"index": idx, "errors": item_errors})
+                continue
+
+            documents.append({
+                "_id": ObjectId(),
+                "form_id": ObjectId(form_id),
+                "submitted_by": str(auth_user.pk),
+                "values": cleaned_values,
+                "schema_version": plan.version,
+                "submitted_at": current_datetime,
+                "updated_at": current_datetime,
+            })
+            indexes.append(idx)
+
+        failed = set()
+
+        if documents:
+            try:
+                submissions_collection().insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    position = write_error["index"]
+                    failed.add(position)
+                    errors.append({
+                        "index": indexes[position],
+                        "errors": {"detail": write_error.get("errmsg")},
+                    })
+
+        created = [
+            {"index": idx, "submission_id": str(doc["_id"])}
+            for position, (idx, doc) in enumerate(zip(indexes, documents))
+            if position not in failed
+        ]
+        errors.sort(key=lambda item: item["index"])
+
+        if created:
+            record_submissions(form_id, current_datetime, count=len(created))
+
+        return Response(
+            {
+                "message": f"{len(created)} submissions created",
+                "created": created,
+                "errors": errors,
+            },
+            status=(
+                status.HTTP_201_CREATED if created
+                else status.HTTP_400_BAD_REQUEST
+            ),
+        )
+
+
 class FormSubmissionListView(views.APIView):
     def get(self, request, *args, **kwargs):
         paginator = MongoPageNumberPagination(request)
@@ -368,7 +665,7 @@ class FormSubmissionListView(views.APIView):
         if auth_user.is_staff:
             form_ids = list(
                 forms_collection().find(
-                    {"created_by": str(auth_user.pk)},
+                    {"created_by": str(auth_user.pk), **NOT_DELETING},
                     {"_id": 1}
                 )
             )
@@ -381,21 +678,11 @@ class FormSubmissionListView(views.APIView):
         else:
             query = {"submitted_by": str(auth_user.pk)}
 
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
+            deleting = deleting_form_ids()
+            if deleting:
+                query["form_id"] = {"$nin": deleting}
 
-        date_filter = {}
-
-        if start_date:
-            start = parse_date(start_date)
-            if start:
-                date_filter["$gte"] = datetime.combine(start, time.min)
-
-        if end_date:
-            end = parse_date(end_date)
-            if end:
-                date_filter["$lte"] = datetime.combine(end, time.max)
-        
+        date_filter = submission_date_filter(request)
         if date_filter:
             query["submitted_at"] = date_filter
 
@@ -409,4 +696,139 @@ class FormSubmissionListView(views.APIView):
             doc["id"] = str(doc.pop("_id"))
             doc["form_id"] = str(doc.get("form_id")) if doc.get("form_id") else None
 
-        return Response(paginator.get_paginated_response(results, count, total_page))
\ No newline at end of file
+        return Response(paginator.get_paginated_response(results, count, total_page))
+
+
+class FormSubmissionExportView(views.APIView):
+    permission_classes = [IsStaffUser]
+    export_formats = {
+        "csv": "text/csv",
+        "ndjson": "application/x-ndjson",
+    }
+
+    def get(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+        export_format = request.query_params.get("export_format", "csv")
+
+        if export_format not in self.export_formats:
+            return Response(
+                {"detail": f"Unsupported export format: {export_format}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        form = forms_collection().find_one(
+            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk), **NOT_DELETING},
+            projection={"name": 1},
+        )
+
+        if not form:
+            return Response(
+                {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        query = {"form_id": ObjectId(form_id)}
+
+        date_filter = submission_date_filter(request)
+        if date_filter:
+            query["submitted_at"] = date_filter
+
+        # Under ASGI a sync iterator would be drained into memory before the
+        # first byte goes out, so stream from the async client there.
+        is_asgi = isinstance(request._request, ASGIRequest)
+        collection = (
+            async_submissions_collection() if is_asgi else submissions_collection()
+        )
+
+        cursor = (
+            collection
+            .find(query)
+            .sort("submitted_at", -1)
+            .batch_size(EXPORT_BATCH_SIZE)
+        )
+
+        if export_format == "csv":
+            field_names = list(dict.fromkeys(
+                field["name"]
+                for field in field_collection()
+                .find({"form_id": ObjectId(form_id)}, projection={"name": 1})
+                .sort("rank", 1)
+            ))
+            stream = (astream_csv if is_asgi else stream_csv)(cursor, field_names)
+        else:
+            stream = (astream_ndjson if is_asgi else stream_ndjson)(cursor)
+
+        response = StreamingHttpResponse(
+            stream, content_type=self.export_formats[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="submissions-{form_id}.{export_format}"'
+        )
+        return response
+
+
+class FormAnalyticsView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+        date_bucket = request.query_params.get("date_bucket", "month")
+
+        if date_bucket not in DATE_BUCKETS:
+            return Response(
+                {"detail": f"date_bucket must be one of {list(DATE_BUCKETS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        form = forms_collection().find_one(
+            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk), **NOT_DELETING},
+            projection={"version": 1},
+        )
+
+        if not form:
+            return Response(
+                {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(get_form_analytics(form, date_bucket))
+
+
+class FormSubmissionStatsView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, form_id=None, *args, **kwargs):
+        auth_user = request.user
+
+        exists = forms_collection().count_documents(
+            {"_id": ObjectId(form_id), "created_by": str(auth_user.pk), **NOT_DELETING},
+            limit=1,
+        )
+
+        if not exists:
+            return Response(
+                {"detail": "Form not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        start_date = parse_date(request.query_params.get("start_date") or "")
+        end_date = parse_date(request.query_params.get("end_date") or "")
+
+        stats = get_submission_stats(
+            form_id,
+            start_day=start_date.isoformat() if start_date else None,
+            end_day=end_date.isoformat() if end_date else None,
+        )
+
+        return Response({"form_id": form_id, **stats})
+
+
+class SubmissionBufferMetricsView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_submission_buffer().metrics())
+
+
+class MongoMetricsView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_mongo_metrics())
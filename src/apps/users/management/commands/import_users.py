@@ -0,0 +1,38 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.serializers import BulkUserImportSerializer
+from apps.users.utils.user_import import import_users, parse_user_rows
+
+USER = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Bulk import users from a CSV or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV (with a header row) or .json file")
+        parser.add_argument(
+            "--created-by",
+            required=True,
+            help="Username of the staff user recorded as creator.",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+
+        try:
+            created_by = USER.objects.get(username=options["created_by"])
+        except USER.DoesNotExist:
+            raise CommandError(f"User '{options['created_by']}' not found")
+
+        rows = parse_user_rows(path.read_bytes(), path.name)
+
+        serializer = BulkUserImportSerializer(data={"users": rows})
+        if not serializer.is_valid():
+            raise CommandError(f"Invalid import file: {serializer.errors}")
+
+        users = import_users(serializer.validated_data["users"], created_by=created_by)
+        self.stdout.write(self.style.SUCCESS(f"Imported {len(users)} users"))
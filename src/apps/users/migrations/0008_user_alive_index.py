@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-18 19:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0007_user_deleted_at_alter_user_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['created_by', '-created_at'], name='user_alive_idx'),
+        ),
+    ]
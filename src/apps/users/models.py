@@ -1,10 +1,62 @@
 import uuid
 import pytz
-from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, UserManager
+from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.auth.models import UserManager as BaseUserManager
 from django.db import models
 from django.utils import timezone
 
 from db.base import BaseModel
+from db.manager import SoftDeletionManager
+from db.mixins import alive_index
+from db.queryset import SoftDeletionQueryset
+
+# Columns the cached JWT user snapshot depends on (see CachedJWTAuthentication)
+AUTH_SNAPSHOT_COLUMNS = frozenset({"is_active", "is_staff", "deleted_at"})
+
+
+class AuthSnapshotQuerysetMixin:
+    """
+    Bulk writes skip post_save/post_delete, so drop the cached JWT user
+    snapshot of every row they touch.
+    """
+
+    def _invalidate_auth_users(self, user_ids) -> None:
+        from apps.authentication.authentication import invalidate_auth_user
+
+        invalidate_auth_user(*user_ids)
+
+    def update(self, **kwargs):
+        if AUTH_SNAPSHOT_COLUMNS.isdisjoint(kwargs):
+            return super().update(**kwargs)
+
+        user_ids = list(self.values_list("pk", flat=True))
+        rows = super().update(**kwargs)
+        self._invalidate_auth_users(user_ids)
+        return rows
+
+    def delete(self, *args, **kwargs):
+        user_ids = list(self.values_list("pk", flat=True))
+        result = super().delete(*args, **kwargs)
+        self._invalidate_auth_users(user_ids)
+        return result
+
+
+class UserQueryset(AuthSnapshotQuerysetMixin, models.QuerySet):
+    pass
+
+
+class UserSoftDeletionQueryset(AuthSnapshotQuerysetMixin, SoftDeletionQueryset):
+    pass
+
+
+class UserManager(BaseUserManager.from_queryset(UserQueryset)):
+    pass
+
+
+class UserSoftDeletionManager(
+    SoftDeletionManager.from_queryset(UserSoftDeletionQueryset)
+):
+    pass
 
 
 class User(AbstractBaseUser, PermissionsMixin, BaseModel):
@@ -51,12 +103,16 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     REQUIRED_FIELDS = ["email"]
 
     objects = UserManager()
+    all_objects = UserSoftDeletionManager(alive_only=False)
 
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
         db_table = "users"
         ordering = ("-created_at",)
+        indexes = [
+            alive_index("created_by", "-created_at", name="user_alive_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.pk} <{self.email}>"
@@ -4,6 +4,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from django.db import transaction
 
+from apps.form_engine.utils.form_deletion import NOT_DELETING
 from core.utils.password_generation import generate_password
 from core.db.mongo import forms_collection
 from rest_framework import serializers
@@ -61,6 +62,79 @@ class UserCreateSerializer(serializers.ModelSerializer):
         return user
 
 
+class UserImportRowSerializer(serializers.Serializer):
+    username = serializers.CharField(max_length=255)
+    email = serializers.EmailField()
+    first_name = serializers.CharField(
+        max_length=255, required=False, allow_blank=True
+    )
+    last_name = serializers.CharField(
+        max_length=255, required=False, allow_blank=True
+    )
+    phone = serializers.CharField(
+        max_length=100, required=False, allow_blank=True, allow_null=True
+    )
+    password = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True
+    )
+
+    def validate(self, attrs):
+        password = attrs.get("password")
+        if password:
+            user = USER(username=attrs["username"], email=attrs["email"])
+            try:
+                validate_password(password, user)
+            except ValidationError as e:
+                error = serializers.as_serializer_error(e)
+                raise serializers.ValidationError(
+                    {"password": error.get("errors", [])}
+                )
+        return attrs
+
+
+class BulkUserImportSerializer(serializers.Serializer):
+    MAX_USERS = 5000
+
+    users = UserImportRowSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=MAX_USERS,
+    )
+
+    def validate_users(self, rows):
+        usernames = [row["username"] for row in rows]
+        emails = [row["email"].lower().strip() for row in rows]
+
+        taken_usernames = set(
+            USER.objects.filter(username__in=usernames)
+            .values_list("username", flat=True)
+        )
+        taken_emails = set(
+            USER.objects.filter(email__in=emails)
+            .values_list("email", flat=True)
+        )
+
+        errors = {}
+        seen_usernames = set()
+        seen_emails = set()
+
+        for idx, (username, email) in enumerate(zip(usernames, emails)):
+            row_errors = {}
+            if username in taken_usernames or username in seen_usernames:
+                row_errors["username"] = "A user with that username already exists."
+            if email in taken_emails or email in seen_emails:
+                row_errors["email"] = "A user with that email already exists."
+            if row_errors:
+                errors[idx] = row_errors
+
+            seen_usernames.add(username)
+            seen_emails.add(email)
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return rows
+
+
 class UserListSerializer(serializers.ModelSerializer):
     class Meta:
         model = USER
@@ -78,6 +152,28 @@ class UserListSerializer(serializers.ModelSerializer):
         ]
 
 
+def validate_existing_form_ids(form_ids):
+    object_ids = {ObjectId(fid) for fid in form_ids if ObjectId.is_valid(fid)}
+
+    found = {
+        doc["_id"]
+        for doc in forms_collection().find(
+            {"_id": {"$in": list(object_ids)}, **NOT_DELETING},
+            projection={"_id": 1}
+        )
+    } if object_ids else set()
+
+    invalid = [
+        fid for fid in form_ids
+        if not ObjectId.is_valid(fid) or ObjectId(fid) not in found
+    ]
+
+    if invalid:
+        raise serializers.ValidationError(
+            f"These form IDs do not exist: {invalid}"
+        )
+
+
 class AssignFormsSerializer(serializers.Serializer):
     form_ids = serializers.ListField(
         child=serializers.CharField(),
@@ -85,21 +181,47 @@ class AssignFormsSerializer(serializers.Serializer):
     )
 
     def validate_form_ids(self, value):
-        invalid = []
+        validate_existing_form_ids(value)
+        return value
 
-        for form_id in value:
-            try:
-                exists = forms_collection().count_documents(
-                    {"_id": ObjectId(form_id)},
-                    limit=1
-                )
-                if not exists:
-                    invalid.append(form_id)
-            except Exception:
-                invalid.append(form_id)
 
-        if invalid:
+class BulkAssignFormsSerializer(serializers.Serializer):
+    user_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False
+    )
+    assign = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        default=list
+    )
+    revoke = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        default=list
+    )
+
+    def validate(self, attrs):
+        assign = set(attrs["assign"])
+        revoke = set(attrs["revoke"])
+
+        if not assign and not revoke:
+            raise serializers.ValidationError(
+                "Provide form IDs to assign or revoke."
+            )
+
+        overlap = assign & revoke
+        if overlap:
             raise serializers.ValidationError(
-                f"These form IDs do not exist: {invalid}"
+                f"Form IDs cannot be assigned and revoked at once: {sorted(overlap)}"
             )
-        return value
\ No newline at end of file
+
+        try:
+            validate_existing_form_ids(sorted(assign | revoke))
+        except serializers.ValidationError as e:
+            raise serializers.ValidationError({"form_ids": e.detail})
+
+        attrs["user_ids"] = set(attrs["user_ids"])
+        attrs["assign"] = assign
+        attrs["revoke"] = revoke
+        return attrs
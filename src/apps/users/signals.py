@@ -1,5 +1,6 @@
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
+from apps.authentication.authentication import invalidate_auth_user
 from .models import User, Profile
 
 
@@ -13,4 +14,9 @@ def create_user_post(sender, instance, created, *args, **kwargs):
     if created:
         Profile.objects.create(
             user=instance
-        )
\ No newline at end of file
+        )
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_auth_user_cache(sender, instance, *args, **kwargs):
+    invalidate_auth_user(instance.pk)
@@ -1,3 +1,192 @@
+from unittest import mock, skipUnless
+
+from bson import ObjectId
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.form_engine.models import FormMaster
+from apps.users import views
+from apps.users.serializers import validate_existing_form_ids
+from core.db import mongo
+from core.db.mongo import forms_collection
+from core.db.testing import mongomock_client
+
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+
+class UserImportViewTests(TestCase):
+    def setUp(self):
+        self.staff = get_user_model().objects.create_user(
+            username="staff",
+            email="staff@example.com",
+            password="password",
+            is_staff=True,
+        )
+
+    def upload(self, name, content):
+        request = APIRequestFactory().post(
+            "/users/import",
+            {"file": SimpleUploadedFile(name, content)},
+            format="multipart",
+        )
+        force_authenticate(request, user=self.staff)
+        return views.UserImportView.as_view()(request)
+
+    def test_csv_upload_creates_users(self):
+        response = self.upload(
+            "users.csv",
+            b"username,email,password\nada,ada@example.com,S3cure-pass!\n",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["created"], 1)
+        user = get_user_model().objects.get(username="ada")
+        self.assertTrue(user.check_password("S3cure-pass!"))
+
+    def test_malformed_json_is_a_bad_request(self):
+        response = self.upload("users.json", b'{"users": [')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_non_utf8_upload_is_a_bad_request(self):
+        response = self.upload(
+            "users.csv", "username,email\nzoë,zoe@example.com\n".encode("latin-1")
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+@skipUnless(mongomock, "mongomock is not installed")
+class FormAssignmentTests(TestCase):
+    def setUp(self):
+        previous_client = mongo._client
+        mongo._client = mongomock_client()
+        self.addCleanup(setattr, mongo, "_client", previous_client)
+
+        user_model = get_user_model()
+        self.staff = user_model.objects.create_user(
+            username="staff",
+            email="staff@example.com",
+            password="password",
+            is_staff=True,
+        )
+        self.members = [
+            user_model.objects.create_user(
+                username=f"member{idx}",
+                email=f"member{idx}@example.com",
+                password="password",
+            )
+            for idx in range(2)
+        ]
+        user_model.objects.filter(
+            pk__in=[member.pk for member in self.members]
+        ).update(created_by=self.staff)
+
+        self.form_ids = [
+            str(form_id)
+            for form_id in forms_collection().insert_many(
+                [{"name": "One"}, {"name": "Two"}]
+            ).inserted_ids
+        ]
+
+    def post(self, view, path, data, **kwargs):
+        request = APIRequestFactory().post(path, data, format="json")
+        force_authenticate(request, user=self.staff)
+        return view.as_view()(request, **kwargs)
+
+    def assign(self, member, form_ids):
+        return self.post(
+            views.AssignFormsView,
+            f"/users/form/assign/{member.pk}",
+            {"form_ids": form_ids},
+            user_id=member.pk,
+        )
+
+    def bulk(self, **data):
+        return self.post(views.BulkAssignFormsView, "/users/form/assign/bulk", data)
+
+    def assigned(self, member) -> set:
+        return set(
+            FormMaster.objects.filter(user=member).values_list("form_id", flat=True)
+        )
+
+    def test_reassigning_a_revoked_form_restores_it(self):
+        member = self.members[0]
+        self.assign(member, self.form_ids)
+        self.assign(member, self.form_ids[:1])
+
+        response = self.assign(member, self.form_ids)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.assigned(member), set(self.form_ids))
+        self.assertEqual(FormMaster.all_objects.filter(user=member).count(), 2)
+
+    def test_bulk_assign_creates_and_restores(self):
+        self.assign(self.members[0], self.form_ids[:1])
+        self.assign(self.members[0], [])
+
+        response = self.bulk(
+            user_ids=[str(member.pk) for member in self.members],
+            assign=self.form_ids,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.data["created"], response.data["restored"]), (3, 1)
+        )
+        for member in self.members:
+            self.assertEqual(self.assigned(member), set(self.form_ids))
+        form = forms_collection().find_one(ObjectId(self.form_ids[1]))
+        self.assertCountEqual(
+            form["assigned_users"], [str(member.pk) for member in self.members]
+        )
+
+    def test_bulk_revoke(self):
+        user_ids = [str(member.pk) for member in self.members]
+        self.bulk(user_ids=user_ids, assign=self.form_ids)
+
+        response = self.bulk(user_ids=user_ids, revoke=self.form_ids[:1])
+
+        self.assertEqual(response.data["revoked"], 2)
+        for member in self.members:
+            self.assertEqual(self.assigned(member), set(self.form_ids[1:]))
+
+    def test_bulk_rejects_users_of_other_staff(self):
+        stranger = get_user_model().objects.create_user(
+            username="stranger", email="stranger@example.com", password="password"
+        )
+
+        response = self.bulk(user_ids=[str(stranger.pk)], assign=self.form_ids)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(self.assigned(stranger))
+
+    def test_bulk_rejects_overlapping_assign_and_revoke(self):
+        response = self.bulk(
+            user_ids=[str(self.members[0].pk)],
+            assign=self.form_ids,
+            revoke=self.form_ids[:1],
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_unknown_form_ids_are_rejected_with_one_query(self):
+        collection = forms_collection()
+        unknown = str(ObjectId())
+
+        with mock.patch(
+            "apps.users.serializers.forms_collection",
+            return_value=mock.Mock(wraps=collection),
+        ) as forms, self.assertRaises(serializers.ValidationError) as ctx:
+            validate_existing_form_ids([*self.form_ids, unknown, "not-an-id"])
 
-# Create your tests here.
+        forms.return_value.find.assert_called_once()
+        self.assertIn(unknown, str(ctx.exception))
+        self.assertIn("not-an-id", str(ctx.exception))
+        self.assertNotIn(self.form_ids[0], str(ctx.exception))
@@ -5,5 +5,7 @@ from . import views
 urlpatterns = [
     path("create", views.UserListCreateView.as_view()),
     path("list", views.UserListCreateView.as_view()),
+    path("import", views.UserImportView.as_view()),
+    path("form/assign/bulk", views.BulkAssignFormsView.as_view()),
     path("form/assign/<uuid:user_id>", views.AssignFormsView.as_view()),
 ]
\ No newline at end of file
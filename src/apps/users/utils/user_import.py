@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from apps.users.models import Profile
+from core.utils.password_generation import generate_password
+
+USER = get_user_model()
+
+IMPORT_COLUMNS = ("username", "email", "first_name", "last_name", "phone", "password")
+
+# Below this many passwords, starting worker processes costs more than it saves
+HASH_POOL_THRESHOLD = 16
+
+# Never fork: request workers run threads (DB connections, the ingest
+# flusher, rebalances) whose locks a forked child could inherit held.
+HASH_POOL_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+
+def hash_passwords(passwords, max_workers=None) -> list:
+    if len(passwords) < HASH_POOL_THRESHOLD:
+        return [make_password(password) for password in passwords]
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(passwords) // (max_workers * 4))
+
+    # Fresh workers need Django configured before make_password can read
+    # PASSWORD_HASHERS. The initializer is referenced from django itself, as
+    # unpickling one from this module would import models before setup.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context(HASH_POOL_START_METHOD),
+        initializer=django.setup,
+    ) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def parse_user_rows(content, filename="") -> list:
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+
+    if filename.endswith(".json"):
+        data = json.loads(content)
+        return data.get("users", []) if isinstance(data, dict) else data
+
+    reader = csv.DictReader(io.StringIO(content))
+    return [
+        {key: (row.get(key) or "").strip() for key in IMPORT_COLUMNS if key in row}
+        for row in reader
+    ]
+
+
+def import_users(rows, created_by=None, batch_size=500) -> list:
+    """
+    Create users and their profiles with bulk_create. Rows must already be
+    validated (see BulkUserImportSerializer). bulk_create skips User.save and
+    the post_save signal, so email normalisation, the created_by audit column
+    and the Profile row are handled here.
+    """
+    passwords = hash_passwords(
+        [row.get("password") or generate_password() for row in rows]
+    )
+
+    users = [
+        USER(
+            username=row["username"],
+            email=row["email"].lower().strip(),
+            first_name=row.get("first_name") or "",
+            last_name=row.get("last_name") or "",
+            phone=row.get("phone") or None,
+            password=password,
+            created_by=created_by,
+        )
+        for row, password in zip(rows, passwords)
+    ]
+
+    with transaction.atomic():
+        USER.objects.bulk_create(users, batch_size=batch_size)
+        Profile.objects.bulk_create(
+            [Profile(user=user, created_by=created_by) for user in users],
+            batch_size=batch_size,
+        )
+
+    return users
@@ -1,3 +1,5 @@
+import csv
+
 from django.contrib.auth import get_user_model
 from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
@@ -5,13 +7,52 @@ from rest_framework import generics, status, views
 from rest_framework.filters import SearchFilter
 from rest_framework.response import Response
 
-from .serializers import UserCreateSerializer, UserListSerializer, AssignFormsSerializer
+from .serializers import (
+    AssignFormsSerializer,
+    BulkAssignFormsSerializer,
+    BulkUserImportSerializer,
+    UserCreateSerializer,
+    UserListSerializer,
+)
 from .permissions import IsStaffUser
+from .utils.user_import import import_users, parse_user_rows
 from .filters import UserFilter
 from core.utils.pagination import CustomLimitPagination
 from apps.form_engine.models import FormMaster
+from apps.form_engine.utils.access import mirror_form_assignments
 
 USER = get_user_model()
+
+
+def assign_forms(user_ids, form_ids) -> tuple[int, int]:
+    """
+    Assign every form to every user and return (created, restored). Revoked
+    assignments are soft-deleted and still hold the (user, form_id) unique
+    slot, so those are brought back instead of inserted. Call inside a
+    transaction.
+    """
+    restored = FormMaster.all_objects.filter(
+        user_id__in=user_ids,
+        form_id__in=form_ids
+    ).deleted().restore()
+
+    existing = set(
+        FormMaster.all_objects.filter(
+            user_id__in=user_ids,
+            form_id__in=form_ids
+        ).values_list("user_id", "form_id")
+    )
+
+    to_create = [
+        FormMaster(user_id=user_id, form_id=form_id)
+        for user_id in user_ids
+        for form_id in form_ids
+        if (user_id, form_id) not in existing
+    ]
+
+    FormMaster.objects.bulk_create(to_create)
+    return len(to_create), restored
+
 class UserListCreateView(generics.ListCreateAPIView):
     serializer_class = UserCreateSerializer
     pagination_class = CustomLimitPagination
@@ -24,7 +65,8 @@ class UserListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         return USER.objects.filter(
-            created_by=self.request.user
+            created_by=self.request.user,
+            deleted_at__isnull=True,
         )
 
     def get_serializer_class(self):
@@ -48,6 +90,40 @@ class UserListCreateView(generics.ListCreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
+class UserImportView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def post(self, request, *args, **kwargs):
+        upload = request.FILES.get("file")
+
+        if upload:
+            try:
+                data = {"users": parse_user_rows(upload.read(), upload.name)}
+            except (ValueError, csv.Error):
+                # Covers malformed JSON and uploads that are not UTF-8
+                return Response(
+                    {"detail": "File must be UTF-8 encoded CSV or JSON"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        else:
+            data = request.data
+
+        serializer = BulkUserImportSerializer(data=data)
+        serializer.is_valid(raise_exception=True)
+
+        users = import_users(
+            serializer.validated_data["users"], created_by=request.user
+        )
+
+        return Response(
+            {
+                "message": "Users imported successfully",
+                "created": len(users),
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class AssignFormsView(views.APIView):
     permission_classes = [IsStaffUser]
 
@@ -85,12 +161,9 @@ class AssignFormsView(views.APIView):
                 ).delete()
 
             if to_add:
-                FormMaster.objects.bulk_create(
-                    [
-                        FormMaster(user=user, form_id=form_id)
-                        for form_id in to_add
-                    ]
-                )
+                assign_forms([user.pk], to_add)
+
+        mirror_form_assignments([user.pk], added=to_add, removed=to_remove)
 
         return Response(
             {
@@ -102,3 +175,51 @@ class AssignFormsView(views.APIView):
             status=status.HTTP_201_CREATED,
         )
 
+
+class BulkAssignFormsView(views.APIView):
+    permission_classes = [IsStaffUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = BulkAssignFormsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user_ids = serializer.validated_data["user_ids"]
+        assign = serializer.validated_data["assign"]
+        revoke = serializer.validated_data["revoke"]
+
+        users = set(
+            USER.objects.filter(id__in=user_ids, created_by=request.user)
+            .values_list("id", flat=True)
+        )
+
+        missing = user_ids - users
+        if missing:
+            return Response(
+                {"detail": f"Users not found: {sorted(str(uid) for uid in missing)}"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        created = restored = revoked = 0
+
+        with transaction.atomic():
+            if revoke:
+                revoked = FormMaster.objects.filter(
+                    user_id__in=users,
+                    form_id__in=revoke
+                ).delete()
+
+            if assign:
+                created, restored = assign_forms(users, assign)
+
+        mirror_form_assignments(users, added=assign, removed=revoke)
+
+        return Response(
+            {
+                "message": "Forms assigned successfully",
+                "users": len(users),
+                "created": created,
+                "restored": restored,
+                "revoked": revoked,
+            },
+            status=status.HTTP_200_OK,
+        )
@@ -22,6 +22,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # per-request SQL/Mongo query profiling, see QUERY_PROFILING
+    "core.middleware.QueryProfilingMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -95,7 +97,66 @@ AUTH_USER_MODEL = "users.User"
 REST_FRAMEWORK = {
     "NON_FIELD_ERRORS_KEY": "errors",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.authentication.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-}
\ No newline at end of file
+}
+
+# Cache for JWT user snapshots, form renders, analytics and pagination
+# counts. The locmem default is per process; point CACHE_URL at a shared
+# backend (e.g. redis://host:6379/0) whenever more than one worker runs.
+CACHES = {"default": env.cache_url("CACHE_URL", default="locmemcache://")}
+
+# Serve the form engine read/submit hot paths with native async views.
+# Only useful when running under the ASGI entry point (core.asgi).
+FORM_ENGINE_ASYNC_VIEWS = env.bool("FORM_ENGINE_ASYNC_VIEWS", default=False)
+
+# Default total-count strategy for MongoPageNumberPagination:
+# exact | none | estimated | cached
+MONGO_PAGINATION_COUNT_STRATEGY = env.str(
+    "MONGO_PAGINATION_COUNT_STRATEGY", default="exact"
+)
+
+# Fail system checks (startup / `manage.py check`) when declared MongoDB
+# indexes are missing. Create them with `manage.py mongo_indexes`.
+MONGO_REQUIRE_INDEXES = env.bool("MONGO_REQUIRE_INDEXES", default=False)
+
+# Write-behind buffer for forms with ingest_mode="buffered"
+SUBMISSION_BUFFER = {
+    "MAX_SIZE": env.int("SUBMISSION_BUFFER_MAX_SIZE", default=10000),
+    "FLUSH_SIZE": env.int("SUBMISSION_BUFFER_FLUSH_SIZE", default=500),
+    "FLUSH_INTERVAL": env.float("SUBMISSION_BUFFER_FLUSH_INTERVAL", default=1.0),
+    "PUT_TIMEOUT": env.float("SUBMISSION_BUFFER_PUT_TIMEOUT", default=0.5),
+}
+
+# Background cascade delete of forms (apps.form_engine.utils.form_deletion)
+FORM_DELETION = {
+    "BATCH_SIZE": env.int("FORM_DELETION_BATCH_SIZE", default=1000),
+    "SLEEP": env.float("FORM_DELETION_SLEEP", default=0.1),
+    "STALE_AFTER": env.int("FORM_DELETION_STALE_AFTER", default=300),
+}
+
+# MongoClient pool/timeouts and command/pool monitoring (core.db.mongo)
+MONGO_CLIENT = {
+    "MAX_POOL_SIZE": env.int("MONGO_MAX_POOL_SIZE", default=100),
+    "MIN_POOL_SIZE": env.int("MONGO_MIN_POOL_SIZE", default=0),
+    "WAIT_QUEUE_TIMEOUT_MS": env.int("MONGO_WAIT_QUEUE_TIMEOUT_MS", default=None),
+    "SERVER_SELECTION_TIMEOUT_MS": env.int(
+        "MONGO_SERVER_SELECTION_TIMEOUT_MS", default=30000
+    ),
+    "CONNECT_TIMEOUT_MS": env.int("MONGO_CONNECT_TIMEOUT_MS", default=20000),
+    "SOCKET_TIMEOUT_MS": env.int("MONGO_SOCKET_TIMEOUT_MS", default=None),
+    "APP_NAME": env.str("MONGO_APP_NAME", default="form-builder"),
+    "MONITORING": env.bool("MONGO_MONITORING", default=True),
+}
+
+# Per-request SQL/Mongo profiling: Server-Timing header and budget warnings
+QUERY_PROFILING = {
+    "ENABLED": env.bool("QUERY_PROFILING", default=False),
+    "SQL_QUERY_BUDGET": env.int("QUERY_PROFILING_SQL_BUDGET", default=20),
+    "MONGO_COMMAND_BUDGET": env.int("QUERY_PROFILING_MONGO_BUDGET", default=20),
+    "DURATION_BUDGET_MS": env.int("QUERY_PROFILING_DURATION_BUDGET_MS", default=500),
+}
+
+# Seconds a JWT user snapshot (id, is_staff, is_active) stays cached
+AUTH_USER_CACHE_TTL = env.int("AUTH_USER_CACHE_TTL", default=60)
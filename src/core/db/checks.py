@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+from core.db.indexes import missing_indexes
+
+
+@register("mongo")
+def check_mongo_indexes(app_configs=None, **kwargs):
+    if not getattr(settings, "MONGO_REQUIRE_INDEXES", False):
+        return []
+
+    try:
+        missing = missing_indexes()
+    except Exception as e:
+        return [Error(f"Could not verify MongoDB indexes: {e}", id="mongo.E002")]
+
+    return [
+        Error(
+            f"MongoDB collection '{collection_name}' is missing indexes: {names}",
+            hint="Run `python manage.py mongo_indexes`.",
+            id="mongo.E001",
+        )
+        for collection_name, names in missing.items()
+    ]
@@ -0,0 +1,139 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from core.db.mongo import get_mongo_db
+
+# Every index the form engine's access paths rely on, per collection.
+# Names are fixed so drift can be detected by name.
+MONGO_INDEXES = {
+    "forms": [
+        IndexModel(
+            [("created_by", ASCENDING), ("created_at", DESCENDING)],
+            name="created_by_created_at",
+        ),
+        IndexModel(
+            [("assigned_users", ASCENDING), ("created_at", DESCENDING)],
+            name="assigned_users_created_at",
+        ),
+    ],
+    "fields": [
+        IndexModel(
+            [("form_id", ASCENDING), ("order", ASCENDING)],
+            name="form_id_order",
+        ),
+        IndexModel(
+            [("form_id", ASCENDING), ("rank", ASCENDING)],
+            name="form_id_rank",
+        ),
+        IndexModel(
+            [("form_id", ASCENDING), ("is_active", ASCENDING)],
+            name="form_id_is_active",
+        ),
+    ],
+    "submissions": [
+        IndexModel(
+            [("form_id", ASCENDING), ("submitted_at", DESCENDING)],
+            name="form_id_submitted_at",
+        ),
+        IndexModel(
+            [("submitted_by", ASCENDING), ("submitted_at", DESCENDING)],
+            name="submitted_by_submitted_at",
+        ),
+    ],
+    "submission_rollups": [
+        IndexModel(
+            [("form_id", ASCENDING), ("day", ASCENDING)],
+            name="form_id_day",
+            unique=True,
+        ),
+    ],
+    "form_deletions": [
+        IndexModel([("status", ASCENDING)], name="status"),
+        # Finished jobs stay queryable for a week, then expire
+        IndexModel(
+            [("finished_at", ASCENDING)],
+            name="finished_at_ttl",
+            expireAfterSeconds=7 * 24 * 60 * 60,
+        ),
+    ],
+}
+
+IGNORED_INDEXES = {"_id_"}
+
+# IndexOptionsConflict / IndexKeySpecsConflict: an index with the same name
+# or keys already exists with a different definition.
+INDEX_CONFLICT_CODES = (85, 86)
+COMPARED_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+def _index_options(spec: dict) -> dict:
+    return {key: spec[key] for key in COMPARED_OPTIONS if key in spec}
+
+
+def index_drift(db=None) -> dict:
+    """
+    Compare declared indexes with the ones on the server. Returns per
+    collection the names that are missing, declared differently, or present
+    on the server without being declared.
+    """
+    db = db if db is not None else get_mongo_db()
+    drift = {}
+
+    for collection_name, models in MONGO_INDEXES.items():
+        existing = db[collection_name].index_information()
+        missing, mismatched = [], []
+
+        for model in models:
+            spec = model.document
+            current = existing.get(spec["name"])
+            if current is None:
+                missing.append(spec["name"])
+            elif (
+                list(current["key"]) != list(spec["key"].items())
+                or _index_options(current) != _index_options(spec)
+            ):
+                mismatched.append(spec["name"])
+
+        declared = {model.document["name"] for model in models}
+        extra = sorted(set(existing) - declared - IGNORED_INDEXES)
+
+        if missing or mismatched or extra:
+            drift[collection_name] = {
+                "missing": missing,
+                "mismatched": mismatched,
+                "extra": extra,
+            }
+
+    return drift
+
+
+def missing_indexes(db=None) -> dict:
+    return {
+        name: report["missing"] + report["mismatched"]
+        for name, report in index_drift(db).items()
+        if report["missing"] or report["mismatched"]
+    }
+
+
+def ensure_indexes(db=None) -> dict:
+    """
+    Create the declared indexes. Indexes that conflict with an existing
+    definition are skipped rather than dropped; index_drift reports them as
+    mismatched.
+    """
+    db = db if db is not None else get_mongo_db()
+    created = {}
+
+    for collection_name, models in MONGO_INDEXES.items():
+        created[collection_name] = []
+        for model in models:
+            # create_indexes is a no-op for indexes that already exist as declared
+            try:
+                created[collection_name] += db[collection_name].create_indexes(
+                    [model]
+                )
+            except OperationFailure as e:
+                if e.code not in INDEX_CONFLICT_CODES:
+                    raise
+
+    return created
@@ -1,20 +1,71 @@
 from django.conf import settings
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+
+from core.db.monitoring import async_pool_metrics, command_metrics, pool_metrics
 
 _client = None
+_async_client = None
+
+# Server error code a standalone mongod answers transactions with
+ILLEGAL_OPERATION = 20
+
+DEFAULT_CLIENT_OPTIONS = {
+    "MAX_POOL_SIZE": 100,
+    "MIN_POOL_SIZE": 0,
+    "MAX_IDLE_TIME_MS": None,
+    "WAIT_QUEUE_TIMEOUT_MS": None,
+    "SERVER_SELECTION_TIMEOUT_MS": 30000,
+    "CONNECT_TIMEOUT_MS": 20000,
+    "SOCKET_TIMEOUT_MS": None,
+    "APP_NAME": "form-builder",
+    "MONITORING": True,
+}
+
+
+def get_client_options(pool_listener=pool_metrics) -> dict:
+    options = {**DEFAULT_CLIENT_OPTIONS, **getattr(settings, "MONGO_CLIENT", {})}
+
+    kwargs = {
+        "maxPoolSize": options["MAX_POOL_SIZE"],
+        "minPoolSize": options["MIN_POOL_SIZE"],
+        "maxIdleTimeMS": options["MAX_IDLE_TIME_MS"],
+        "waitQueueTimeoutMS": options["WAIT_QUEUE_TIMEOUT_MS"],
+        "serverSelectionTimeoutMS": options["SERVER_SELECTION_TIMEOUT_MS"],
+        "connectTimeoutMS": options["CONNECT_TIMEOUT_MS"],
+        "socketTimeoutMS": options["SOCKET_TIMEOUT_MS"],
+        "appname": options["APP_NAME"],
+    }
+
+    if options["MONITORING"]:
+        kwargs["event_listeners"] = [command_metrics, pool_listener]
+
+    return kwargs
 
 
 def get_mongo_client():
     global _client
     if _client is None:
-        _client = MongoClient(settings.MONGODB_URI)
+        _client = MongoClient(settings.MONGODB_URI, **get_client_options())
     return _client
 
 
+def get_async_mongo_client():
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(
+            settings.MONGODB_URI, **get_client_options(async_pool_metrics)
+        )
+    return _async_client
+
+
 def get_mongo_db():
     return get_mongo_client()[settings.MONGODB_NAME]
 
 
+def get_async_mongo_db():
+    return get_async_mongo_client()[settings.MONGODB_NAME]
+
+
 def forms_collection():
     return get_mongo_db()["forms"]
 
@@ -22,4 +73,26 @@ def field_collection():
     return get_mongo_db()["fields"]
 
 def submissions_collection():
-    return get_mongo_db()["submissions"]
\ No newline at end of file
+    return get_mongo_db()["submissions"]
+
+def rollups_collection():
+    return get_mongo_db()["submission_rollups"]
+
+def deletions_collection():
+    return get_mongo_db()["form_deletions"]
+
+
+def async_forms_collection():
+    return get_async_mongo_db()["forms"]
+
+def async_field_collection():
+    return get_async_mongo_db()["fields"]
+
+def async_submissions_collection():
+    return get_async_mongo_db()["submissions"]
+
+def async_rollups_collection():
+    return get_async_mongo_db()["submission_rollups"]
+
+def async_deletions_collection():
+    return get_async_mongo_db()["form_deletions"]
@@ -0,0 +1,240 @@
+import threading
+
+from pymongo import monitoring
+from pymongo.common import MAX_POOL_SIZE
+
+# Commands whose first value names the collection they act on
+COLLECTION_COMMANDS = {
+    "find",
+    "insert",
+    "update",
+    "delete",
+    "aggregate",
+    "count",
+    "distinct",
+    "findAndModify",
+    "getMore",
+    "createIndexes",
+    "listIndexes",
+}
+
+
+class CommandMetrics(monitoring.CommandListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._hooks = []
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.commands = {}
+            self.collections = {}
+
+    def add_hook(self, hook) -> None:
+        # hook(command_name, collection, duration_ms, succeeded)
+        self._hooks.append(hook)
+
+    def started(self, event):
+        name = event.command_name
+        collection = None
+        if name in COLLECTION_COMMANDS:
+            target = event.command.get(name)
+            if name == "getMore":
+                target = event.command.get("collection")
+            if isinstance(target, str):
+                collection = f"{event.database_name}.{target}"
+
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event):
+        self._record(event, succeeded=True)
+
+    def failed(self, event):
+        self._record(event, succeeded=False)
+
+    def _record(self, event, succeeded) -> None:
+        duration_ms = event.duration_micros / 1000
+        name = event.command_name
+
+        with self._lock:
+            key = (event.connection_id, event.request_id)
+            collection = self._pending.pop(key, None)
+
+            stats = self.commands.setdefault(
+                name, {"count": 0, "failed": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            stats["count"] += 1
+            stats["total_ms"] += duration_ms
+            stats["max_ms"] = max(stats["max_ms"], duration_ms)
+            if not succeeded:
+                stats["failed"] += 1
+
+            if collection:
+                operations = self.collections.setdefault(collection, {})
+                operations[name] = operations.get(name, 0) + 1
+
+        for hook in self._hooks:
+            hook(name, collection, duration_ms, succeeded)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            commands = {
+                name: {**stats, "avg_ms": stats["total_ms"] / stats["count"]}
+                for name, stats in self.commands.items()
+            }
+            collections = {name: dict(ops) for name, ops in self.collections.items()}
+
+        return {"commands": commands, "collections": collections}
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Connection pool gauges for one client. A client keeps a pool per server,
+    so saturation is worked out per pool against the maxPoolSize the pool was
+    created with, and the busiest pool is reported.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Learnt from pool_created, so it survives reset()
+        self._max_pool_sizes = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.pools = {}
+            self.open = 0
+            self.in_use = 0
+            self.peak_in_use = 0
+            self.checkouts = 0
+            self.checkout_failures = 0
+            self.checkout_timeouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+
+    def _wait(self, event) -> float:
+        duration = getattr(event, "duration", None)
+        return duration * 1000 if duration is not None else 0.0
+
+    def _pool(self, address) -> dict:
+        return self.pools.setdefault(
+            address, {"open": 0, "in_use": 0, "peak_in_use": 0}
+        )
+
+    def _saturation(self, address):
+        max_pool_size = self._max_pool_sizes.get(address, MAX_POOL_SIZE)
+        if not max_pool_size:
+            return None
+        return self.pools[address]["in_use"] / max_pool_size
+
+    def pool_created(self, event):
+        with self._lock:
+            self._max_pool_sizes[event.address] = event.options.get(
+                "maxPoolSize", MAX_POOL_SIZE
+            )
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open += 1
+            self._pool(event.address)["open"] += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open = max(self.open - 1, 0)
+            pool = self._pool(event.address)
+            pool["open"] = max(pool["open"] - 1, 0)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        wait_ms = self._wait(event)
+        with self._lock:
+            self.checkout_failures += 1
+            if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+                self.checkout_timeouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def connection_checked_out(self, event):
+        wait_ms = self._wait(event)
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            pool = self._pool(event.address)
+            pool["in_use"] += 1
+            pool["peak_in_use"] = max(pool["peak_in_use"], pool["in_use"])
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+            pool = self._pool(event.address)
+            pool["in_use"] = max(pool["in_use"] - 1, 0)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.checkout_failures
+            pools = {
+                f"{host}:{port}": {
+                    **stats,
+                    "max_pool_size": self._max_pool_sizes.get(
+                        (host, port), MAX_POOL_SIZE
+                    ),
+                    "saturation": self._saturation((host, port)),
+                }
+                for (host, port), stats in self.pools.items()
+            }
+            saturations = [
+                pool["saturation"]
+                for pool in pools.values()
+                if pool["saturation"] is not None
+            ]
+            return {
+                "open": self.open,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "saturation": max(saturations, default=None),
+                "pools": pools,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkout_timeouts": self.checkout_timeouts,
+                "avg_wait_ms": self.total_wait_ms / attempts if attempts else 0,
+                "max_wait_ms": self.max_wait_ms,
+            }
+
+
+command_metrics = CommandMetrics()
+# One per client: the sync and async clients keep separate pools per server
+pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def get_mongo_metrics() -> dict:
+    return {
+        **command_metrics.snapshot(),
+        "pool": pool_metrics.snapshot(),
+        "async_pool": async_pool_metrics.snapshot(),
+    }
+
+
+def reset_mongo_metrics() -> None:
+    command_metrics.reset()
+    pool_metrics.reset()
+    async_pool_metrics.reset()
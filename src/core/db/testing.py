@@ -0,0 +1,108 @@
+import functools
+
+from pymongo.errors import OperationFailure
+
+from core.db.mongo import ILLEGAL_OPERATION
+
+
+def mongomock_client():
+    """
+    In-process stand-in for MongoClient, for tests and the benchmark's
+    `--mongo mongomock` mode. Raises ImportError when mongomock is missing.
+
+    mongomock 4.3 predates pymongo 4.11, which passes `sort` to every bulk
+    update; the bulk builder is wrapped to drop it while unset. It has no
+    sessions either, so starting one fails the way a standalone mongod
+    rejects transactions, and callers take their non-transactional path.
+    """
+    import mongomock
+    from mongomock.collection import BulkOperationBuilder
+
+    add_update = BulkOperationBuilder.add_update
+    if not getattr(add_update, "_drops_sort", False):
+
+        @functools.wraps(add_update)
+        def add_update_without_sort(self, *args, sort=None, **kwargs):
+            if sort is not None:
+                raise NotImplementedError("mongomock cannot sort bulk updates")
+            return add_update(self, *args, **kwargs)
+
+        add_update_without_sort._drops_sort = True
+        BulkOperationBuilder.add_update = add_update_without_sort
+
+    class MongoClient(mongomock.MongoClient):
+        def start_session(self, *args, **kwargs):
+            raise OperationFailure(
+                "Transaction numbers are only allowed on a replica set member "
+                "or mongos",
+                code=ILLEGAL_OPERATION,
+            )
+
+    return MongoClient()
+
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def skip(self, *args, **kwargs):
+        self._cursor = self._cursor.skip(*args, **kwargs)
+        return self
+
+    def limit(self, *args, **kwargs):
+        self._cursor = self._cursor.limit(*args, **kwargs)
+        return self
+
+    async def to_list(self, length=None):
+        documents = list(self._cursor)
+        return documents if length is None else documents[:length]
+
+    async def __aiter__(self):
+        for document in self._cursor:
+            yield document
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, *args, **kwargs):
+        return _AsyncCursor(self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return method
+
+
+class _AsyncDatabase:
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+class AsyncMongomockClient:
+    """
+    AsyncMongoClient stand-in over a `mongomock_client()`, sharing its data,
+    so async code paths can be tested against what sync code wrote. Covers
+    what the async views use: awaitable collection methods and `find()`
+    cursors with sort/skip/limit and `to_list()`.
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getitem__(self, name):
+        return _AsyncDatabase(self._client[name])
@@ -0,0 +1,167 @@
+import contextvars
+import logging
+import time
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from core.db.monitoring import command_metrics
+
+logger = logging.getLogger("core.profiling")
+
+DEFAULT_PROFILING_SETTINGS = {
+    "ENABLED": False,
+    "SQL_QUERY_BUDGET": 20,
+    "MONGO_COMMAND_BUDGET": 20,
+    "DURATION_BUDGET_MS": 500,
+}
+
+_current_profile = contextvars.ContextVar("query_profile", default=None)
+
+
+class QueryProfile:
+    __slots__ = ("sql_count", "sql_ms", "mongo_count", "mongo_ms", "mongo_commands")
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.mongo_count = 0
+        self.mongo_ms = 0.0
+        self.mongo_commands = {}
+
+    def sql_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_count += 1
+            self.sql_ms += (time.perf_counter() - started) * 1000
+
+
+def _record_mongo_command(command_name, collection, duration_ms, succeeded):
+    profile = _current_profile.get()
+    if profile is None:
+        return
+
+    profile.mongo_count += 1
+    profile.mongo_ms += duration_ms
+    key = f"{command_name} {collection}" if collection else command_name
+    profile.mongo_commands[key] = profile.mongo_commands.get(key, 0) + 1
+
+
+command_metrics.add_hook(_record_mongo_command)
+
+
+def _wrap_connections(stack, profile) -> None:
+    for connection in connections.all():
+        stack.enter_context(connection.execute_wrapper(profile.sql_wrapper))
+
+
+@contextmanager
+def profile_queries():
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+
+    try:
+        with ExitStack() as stack:
+            _wrap_connections(stack, profile)
+            yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@asynccontextmanager
+async def aprofile_queries():
+    """
+    profile_queries for async requests. Connections are per thread, so the
+    SQL wrappers are installed on the thread that sync_to_async runs the
+    request's ORM calls on.
+    """
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    stack = ExitStack()
+
+    try:
+        await sync_to_async(_wrap_connections)(stack, profile)
+        yield profile
+    finally:
+        await sync_to_async(stack.close)()
+        _current_profile.reset(token)
+
+
+class QueryProfilingMiddleware:
+    """
+    Counts and times SQL queries and Mongo commands per request, reports them
+    in a Server-Timing header and logs requests over the configured budgets.
+    Enabled with QUERY_PROFILING["ENABLED"].
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        options = {
+            **DEFAULT_PROFILING_SETTINGS,
+            **getattr(settings, "QUERY_PROFILING", {}),
+        }
+        if not options["ENABLED"]:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.sql_budget = options["SQL_QUERY_BUDGET"]
+        self.mongo_budget = options["MONGO_COMMAND_BUDGET"]
+        self.duration_budget_ms = options["DURATION_BUDGET_MS"]
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+
+        with profile_queries() as profile:
+            response = self.get_response(request)
+
+        return self.report(request, response, profile, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+
+        async with aprofile_queries() as profile:
+            response = await self.get_response(request)
+
+        return self.report(request, response, profile, started)
+
+    def report(self, request, response, profile, started):
+        total_ms = (time.perf_counter() - started) * 1000
+
+        response["Server-Timing"] = ", ".join([
+            f'sql;dur={profile.sql_ms:.1f};desc="{profile.sql_count} queries"',
+            f'mongo;dur={profile.mongo_ms:.1f};desc="{profile.mongo_count} commands"',
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        if (
+            profile.sql_count > self.sql_budget
+            or profile.mongo_count > self.mongo_budget
+            or total_ms > self.duration_budget_ms
+        ):
+            logger.warning(
+                "Query budget exceeded: %s %s took %.1fms with %s SQL queries "
+                "(%.1fms) and %s Mongo commands (%.1fms) %s",
+                request.method,
+                request.path,
+                total_ms,
+                profile.sql_count,
+                profile.sql_ms,
+                profile.mongo_count,
+                profile.mongo_ms,
+                profile.mongo_commands,
+            )
+
+        return response
@@ -1,4 +1,13 @@
+import base64
+import binascii
+import hashlib
 import math
+
+from bson import json_util
+from bson.errors import BSONError
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 
 
@@ -20,18 +29,40 @@ class CustomLimitPagination(PageNumberPagination):
 
 
 
+COUNT_EXACT = "exact"
+COUNT_NONE = "none"
+COUNT_ESTIMATED = "estimated"
+COUNT_CACHED = "cached"
+
+
 class MongoPageNumberPagination:
     page_size = 10
     page_query_param = "page"
     page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
     max_page_size = 100
+    invalid_cursor_message = "Invalid cursor"
+    count_cache_ttl = 30
 
-    def __init__(self, request):
+    def __init__(self, request, count_strategy=None):
         self.request = request
         self.page = self.get_page()
         self.page_size = self.get_page_size()
         self.skip = (self.page - 1) * self.page_size
 
+        self.count_strategy = count_strategy or getattr(
+            settings, "MONGO_PAGINATION_COUNT_STRATEGY", COUNT_EXACT
+        )
+        self.count_exact = True
+        self.has_next = False
+
+        # Keyset mode is opt-in: any `cursor` query param (empty for the first
+        # page) switches from skip/limit to a range seek on (sort_key, _id).
+        self.use_cursor = self.cursor_query_param in request.query_params
+        self.cursor = self.decode_cursor() if self.use_cursor else None
+        self.next_cursor = None
+        self.previous_cursor = None
+
     def get_page(self) -> int:
         try:
             page = int(self.request.query_params.get(self.page_query_param, 1))
@@ -51,28 +82,210 @@ class MongoPageNumberPagination:
 
         return min(size, self.max_page_size)
 
+    def encode_cursor(self, doc, sort_key, reverse=False) -> str:
+        payload = {"v": doc.get(sort_key), "id": doc["_id"], "r": reverse}
+        return base64.urlsafe_b64encode(
+            json_util.dumps(payload).encode()
+        ).decode()
+
+    def decode_cursor(self):
+        token = self.request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json_util.loads(base64.urlsafe_b64decode(token.encode()))
+            return payload["v"], payload["id"], bool(payload["r"])
+        except (binascii.Error, ValueError, KeyError, TypeError, BSONError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_cursor_query(self, query, sort):
+        sort_key, direction = sort or ("_id", -1)
+        reverse = bool(self.cursor and self.cursor[2])
+        if reverse:
+            direction = -direction
+
+        if sort_key == "_id":
+            sort_spec = [("_id", direction)]
+        else:
+            sort_spec = [(sort_key, direction), ("_id", direction)]
+
+        if self.cursor is None:
+            return query, sort_spec
+
+        value, last_id, _ = self.cursor
+        op = "$lt" if direction < 0 else "$gt"
+
+        if sort_key == "_id":
+            seek = {"_id": {op: last_id}}
+        else:
+            seek = {"$or": self.get_seek_branches(sort_key, value, last_id, op)}
+
+        return ({"$and": [query, seek]} if query else seek), sort_spec
+
+    def get_seek_branches(self, sort_key, value, last_id, op) -> list:
+        # Null and missing values sort before everything else, and a range
+        # operator never matches them, so they get their own branches:
+        # ascending they precede every value, descending they follow it.
+        branches = [{sort_key: value, "_id": {op: last_id}}]
+        if value is None:
+            if op == "$gt":
+                branches.append({sort_key: {"$ne": None}})
+            return branches
+
+        branches.append({sort_key: {op: value}})
+        if op == "$lt":
+            branches.append({sort_key: None})
+        return branches
+
+    def get_cursor_page(self, results, sort):
+        sort_key = (sort or ("_id", -1))[0]
+        reverse = bool(self.cursor and self.cursor[2])
+
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = has_more if reverse else self.cursor is not None
+
+        if results:
+            if has_next:
+                self.next_cursor = self.encode_cursor(results[-1], sort_key)
+            if has_previous:
+                self.previous_cursor = self.encode_cursor(
+                    results[0], sort_key, reverse=True
+                )
+
+        return results
+
+    def get_count_cache_key(self, collection, query) -> str:
+        digest = hashlib.sha1(
+            json_util.dumps(query, sort_keys=True).encode()
+        ).hexdigest()
+        return f"mongo-count:{collection.full_name}:{digest}"
+
+    def get_total_count(self, collection, query):
+        if self.count_strategy == COUNT_NONE:
+            self.count_exact = False
+            return None
+
+        if self.count_strategy == COUNT_ESTIMATED and not query:
+            self.count_exact = False
+            return collection.estimated_document_count()
+
+        if self.count_strategy in (COUNT_CACHED, COUNT_ESTIMATED):
+            key = self.get_count_cache_key(collection, query)
+            total_count = cache.get(key)
+            if total_count is not None:
+                self.count_exact = False
+                return total_count
+
+            total_count = collection.count_documents(query)
+            cache.set(key, total_count, self.count_cache_ttl)
+            return total_count
+
+        return collection.count_documents(query)
+
+    async def aget_total_count(self, collection, query):
+        if self.count_strategy == COUNT_NONE:
+            self.count_exact = False
+            return None
+
+        if self.count_strategy == COUNT_ESTIMATED and not query:
+            self.count_exact = False
+            return await collection.estimated_document_count()
+
+        if self.count_strategy in (COUNT_CACHED, COUNT_ESTIMATED):
+            key = self.get_count_cache_key(collection, query)
+            total_count = await cache.aget(key)
+            if total_count is not None:
+                self.count_exact = False
+                return total_count
+
+            total_count = await collection.count_documents(query)
+            await cache.aset(key, total_count, self.count_cache_ttl)
+            return total_count
+
+        return await collection.count_documents(query)
+
+    def get_total_page(self, total_count):
+        if total_count is None:
+            return None
+        return math.ceil(total_count / self.page_size) if total_count else 1
+
+    def get_page_results(self, results):
+        # One extra row tells us whether a next page exists without a count.
+        self.has_next = len(results) > self.page_size
+        return results[: self.page_size]
+
     def paginate(self, collection, query=None, sort=None, projection=None):
         query = query or {}
 
-        total_count = collection.count_documents(query)
-        total_page = math.ceil(total_count / self.page_size) if total_count else 1
+        if self.use_cursor:
+            query, sort_spec = self.get_cursor_query(query, sort)
+            cursor = collection.find(query, projection).sort(sort_spec)
+            results = list(cursor.limit(self.page_size + 1))
+            return self.get_cursor_page(results, sort), None, None
+
+        total_count = self.get_total_count(collection, query)
+        total_page = self.get_total_page(total_count)
 
         cursor = collection.find(query, projection)
 
         if sort:
             cursor = cursor.sort(*sort)
 
-        cursor = cursor.skip(self.skip).limit(self.page_size)
-        results = list(cursor)
+        cursor = cursor.skip(self.skip).limit(self.page_size + 1)
+        results = self.get_page_results(list(cursor))
+
+        return results, total_count, total_page
+
+    async def apaginate(self, collection, query=None, sort=None, projection=None):
+        query = query or {}
+
+        if self.use_cursor:
+            query, sort_spec = self.get_cursor_query(query, sort)
+            cursor = collection.find(query, projection).sort(sort_spec)
+            results = await cursor.limit(self.page_size + 1).to_list()
+            return self.get_cursor_page(results, sort), None, None
+
+        total_count = await self.aget_total_count(collection, query)
+        total_page = self.get_total_page(total_count)
+
+        cursor = collection.find(query, projection)
+
+        if sort:
+            cursor = cursor.sort(*sort)
+
+        cursor = cursor.skip(self.skip).limit(self.page_size + 1)
+        results = self.get_page_results(await cursor.to_list())
 
         return results, total_count, total_page
 
     def get_paginated_response(self, results, total_count, total_page) -> dict:
+        """
+        Build the response body. The shape depends on the request:
+
+        - without `cursor`: page numbers, `next`/`previous` are page numbers
+          and `current`, `total_page`, `count` and `count_exact` are set.
+        - with `cursor` (even empty): keyset mode, `next`/`previous` are
+          opaque cursor tokens and no counts are returned.
+        """
+        if self.use_cursor:
+            return {
+                "next": self.next_cursor,
+                "previous": self.previous_cursor,
+                "page_size": self.page_size,
+                "results": results,
+            }
+
         return {
-            "next": self.page + 1 if self.page < total_page else None,
+            "next": self.page + 1 if self.has_next else None,
             "previous": self.page - 1 if self.page > 1 else None,
             "current": self.page,
             "total_page": total_page,
             "count": total_count,
+            "count_exact": self.count_exact,
             "results": results,
         }
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.db.indexes import ensure_indexes, index_drift
+
+
+class Command(BaseCommand):
+    help = "Create the declared MongoDB indexes and report drift"
+
+    # The index system check would otherwise block the command that fixes it.
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift; exit non-zero when indexes are missing.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            for collection_name, names in ensure_indexes().items():
+                self.stdout.write(f"{collection_name}: {', '.join(names)}")
+
+        drift = index_drift()
+
+        for collection_name, report in drift.items():
+            for kind, names in report.items():
+                for name in names:
+                    self.stdout.write(
+                        self.style.WARNING(f"{collection_name}.{name}: {kind}")
+                    )
+
+        if any(report["missing"] or report["mismatched"] for report in drift.values()):
+            raise CommandError("Required MongoDB indexes are missing or differ")
+
+        self.stdout.write(self.style.SUCCESS("MongoDB indexes are up to date"))
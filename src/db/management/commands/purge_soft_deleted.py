@@ -0,0 +1,74 @@
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from db.mixins import SoftDeleteModel
+
+
+class Command(BaseCommand):
+    help = "Hard-delete rows soft-deleted longer ago than the retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Retention window in days (default 30).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0,
+            help="Seconds to pause between batches.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Only purge app_label.ModelName (repeatable).",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def get_models(self, labels):
+        if labels:
+            try:
+                models = [apps.get_model(label) for label in labels]
+            except LookupError as e:
+                raise CommandError(str(e))
+        else:
+            models = apps.get_models()
+
+        return [model for model in models if issubclass(model, SoftDeleteModel)]
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        batch_size = options["batch_size"]
+
+        for model in self.get_models(options["models"]):
+            expired = model.all_objects.filter(deleted_at__lt=cutoff)
+
+            if options["dry_run"]:
+                self.stdout.write(
+                    f"{model._meta.label}: {expired.count()} rows to purge"
+                )
+                continue
+
+            purged = 0
+            while True:
+                ids = list(expired.values_list("pk", flat=True)[:batch_size])
+                if not ids:
+                    break
+
+                model.all_objects.filter(pk__in=ids).delete(soft=False)
+                purged += len(ids)
+
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+
+            self.stdout.write(
+                self.style.SUCCESS(f"{model._meta.label}: purged {purged} rows")
+            )
@@ -3,9 +3,14 @@ from django.db.models import manager
 from .queryset import SoftDeletionQueryset
 
 
-class SoftDeletionManager(manager.Manager):
+class SoftDeletionManager(manager.BaseManager.from_queryset(SoftDeletionQueryset)):
+    def __init__(self, *args, alive_only=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.alive_only = alive_only
+
     def get_queryset(self):
+        queryset = super().get_queryset()
 
-        return SoftDeletionQueryset(self.model, using=self._db).filter(
-            deleted_at__isnull=True
-        )
\ No newline at end of file
+        if self.alive_only:
+            return queryset.filter(deleted_at__isnull=True)
+        return queryset
@@ -34,7 +34,7 @@ class SoftDeleteModel(models.Model):
     deleted_at = models.DateTimeField(null=True, blank=True)
 
     objects = SoftDeletionManager()
-    all_objects = models.Manager()
+    all_objects = SoftDeletionManager(alive_only=False)
 
     class Meta:
         abstract = True
@@ -47,6 +47,20 @@ class SoftDeleteModel(models.Model):
         self.save(using=using)
         return None
 
+
 class AuditModel(TimeAuditModel, UserAuditModel, SoftDeleteModel):
     class Meta:
-        abstract = True
\ No newline at end of file
+        abstract = True
+
+
+def alive_index(*fields, name) -> models.Index:
+    """
+    Partial index over live rows only (`deleted_at IS NULL`), matching the
+    filter SoftDeletionManager adds. Use in a model's `Meta.indexes`, e.g.
+    `alive_index("user", "form_id", name="formmaster_alive_idx")`.
+    """
+    return models.Index(
+        fields=list(fields),
+        condition=models.Q(deleted_at__isnull=True),
+        name=name,
+    )
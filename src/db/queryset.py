@@ -3,8 +3,71 @@ from django.utils import timezone
 
 
 class SoftDeletionQueryset(models.QuerySet):
+    """
+    Bulk operations that stamp the audit columns BaseModel.save would
+    normally fill, in one statement instead of a save() per row.
+    """
+
+    def _audit_user(self):
+        from crum import get_current_user
+        user = get_current_user()
+        if user is None or user.is_anonymous:
+            return None
+        return user
+
+    def _has_field(self, name) -> bool:
+        return any(field.name == name for field in self.model._meta.concrete_fields)
+
+    def _audit_values(self) -> dict:
+        values = {}
+        if self._has_field("updated_at"):
+            values["updated_at"] = timezone.now()
+
+        user = self._audit_user()
+        if user is not None and self._has_field("updated_by"):
+            values["updated_by"] = user
+        return values
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        user = self._audit_user()
+
+        if user is not None and self._has_field("created_by"):
+            for obj in objs:
+                obj.created_by = user
+                obj.updated_by = None
+
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        fields = set(fields)
+        current_datetime = timezone.now()
+        user = self._audit_user()
+
+        if self._has_field("updated_at"):
+            for obj in objs:
+                obj.updated_at = current_datetime
+            fields.add("updated_at")
+
+        if user is not None and self._has_field("updated_by"):
+            for obj in objs:
+                obj.updated_by = user
+            fields.add("updated_by")
+
+        return super().bulk_update(objs, list(fields), *args, **kwargs)
+
     def delete(self, soft=True):
         if soft:
-            return self.update(deleted_at=timezone.now())
+            return self.update(deleted_at=timezone.now(), **self._audit_values())
+
+        return super().delete()
+
+    def restore(self):
+        return self.update(deleted_at=None, **self._audit_values())
+
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
 
-        return super().delete()
\ No newline at end of file
+    def deleted(self):
+        return self.filter(deleted_at__isnull=False)